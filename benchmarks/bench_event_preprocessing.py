@@ -0,0 +1,88 @@
+"""
+Benchmark of the vectorized own goal fix and orientation normalization against the
+previous row by row implementations on a synthetic 3,000 event match.
+
+Run from the repository root with: python -m benchmarks.bench_event_preprocessing
+"""
+
+import timeit
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from footballdashboards.helpers.event_preprocessing import fix_own_goals, orient_by_team_side
+
+
+def make_match(
+    n_events: int = 3000, n_own_goals: int = 3, seed: int = 0
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    is_home = rng.integers(0, 2, n_events)
+    data = pd.DataFrame(
+        {
+            "x": rng.uniform(0, 100, n_events),
+            "y": rng.uniform(0, 100, n_events),
+            "is_home_team": is_home,
+            "team": np.where(is_home == 1, "Arsenal", "Chelsea"),
+            "teamId": np.where(is_home == 1, 13, 15),
+            "minute": np.sort(rng.integers(0, 95, n_events)),
+        }
+    )
+    own_goal_mask = np.zeros(n_events, dtype=bool)
+    own_goal_mask[rng.choice(n_events, n_own_goals, replace=False)] = True
+    return data, own_goal_mask
+
+
+def fix_own_goals_iterrows(data: pd.DataFrame, own_goal_mask: np.ndarray) -> pd.DataFrame:
+    data = data.copy()
+    data["own_goal"] = 0
+    own_goals = data[own_goal_mask]
+    both_team_ids = data["teamId"].unique()
+    both_teams_names = data["team"].unique()
+    for i, row in own_goals.iterrows():
+        data.loc[i, "x"] = 100 - row["x"]
+        data.loc[i, "y"] = 100 - row["y"]
+        data.loc[i, "is_home_team"] = 1 - row["is_home_team"]
+        data.loc[i, "team"] = next(team for team in both_teams_names if team != row["team"])
+        data.loc[i, "teamId"] = next(t for t in both_team_ids if t != row["teamId"])
+        data.loc[i, "own_goal"] = 1
+    return data
+
+
+def orient_by_team_side_apply(data: pd.DataFrame) -> pd.DataFrame:
+    data = data.copy()
+    data["possession_side"] = data["is_home_team"].apply(lambda x: 1 if x == 1 else -1)
+    data["x"] = data.apply(lambda x: x["x"] if x["possession_side"] == 1 else 100 - x["x"], axis=1)
+    data["y"] = data.apply(lambda x: x["y"] if x["possession_side"] == 1 else 100 - x["y"], axis=1)
+    return data
+
+
+def report(title, data, implementations, runs=200):
+    print(title)
+    for name, func in implementations:
+        seconds = timeit.timeit(lambda func=func: func(*data), number=runs)
+        print(f"{name:>10}: {seconds / runs * 1000:.3f} ms per match")
+
+
+def main():
+    data, own_goal_mask = make_match()
+    pd.testing.assert_frame_equal(
+        fix_own_goals(data, own_goal_mask), fix_own_goals_iterrows(data, own_goal_mask)
+    )
+    report(
+        "own goal fix",
+        (data, own_goal_mask),
+        [("iterrows", fix_own_goals_iterrows), ("vectorized", fix_own_goals)],
+    )
+    pd.testing.assert_frame_equal(orient_by_team_side(data), orient_by_team_side_apply(data))
+    report(
+        "orientation",
+        (data,),
+        [("apply", orient_by_team_side_apply), ("vectorized", orient_by_team_side)],
+        runs=50,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,14 @@ class _DataAccessor(ABC):  # pylint: disable=too-few-public-methods
     """
     Defines a duck type for data accessor to use for type hinting.
 
+    Accessors that set supports_column_projection to True are passed a columns keyword
+    argument by dashboards that declare the columns they read, so that they can fetch
+    only those columns.  Columns that the source doesn't have are ignored.
+
     """
 
+    supports_column_projection: bool = False
+
     @abstractmethod
     def get_data(self, data_requester_name: str, **kwargs) -> pd.DataFrame:
         """
@@ -21,7 +27,8 @@ class _DataAccessor(ABC):  # pylint: disable=too-few-public-methods
 
         Args:
             data_requester_name (str): Name of the dashboard requesting the data
-            kwargs: Parameters needed to retrieve the data
+            kwargs: Parameters needed to retrieve the data, plus columns (List[str]) for
+                accessors that support column projection
 
         Returns:
             pd.DataFrame: Dataframe of the data requesteds
@@ -4,16 +4,20 @@ from footballdashboards.dashboard.dashboard import Dashboard
 from footballdashboards._types._custom_types import PlotReturnType
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List
 from mplsoccer import VerticalPitch, set_visible, Pitch
-from footballdashboards.helpers.mplsoccer_helpers import make_grid, get_ax_size
+from footballdashboards.helpers.mplsoccer_helpers import make_grid_template, get_ax_size
 from footballdashboards._types._dashboard_fields import DashboardField, ColorField
 from footballdashboards.helpers.fonts import font_bold, font_italic, font_normal
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
 from PIL.PngImagePlugin import PngImageFile
 from footballdashboards.helpers.matplotlib import get_aspect
 from highlight_text import ax_text
-from footballdashboards.helpers.mclachbot_helpers import get_ball_logo2
+from footballdashboards.helpers.mclachbot_helpers import (
+    get_ball_logo2,
+    image_asset,
+    BALL_LOGO2_URL,
+)
+from footballdashboards.helpers.image_cache import ImageAsset
 
 
 class BestElevenDashboard(Dashboard):
@@ -42,6 +46,17 @@ class BestElevenDashboard(Dashboard):
             "squad": "Team name",
         }
 
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        league = data["league"].iloc[0]
+        assets = [
+            self.badge_service.team_badge_asset(league, team_name)
+            for team_name in data["squad"].unique()
+        ]
+        if len(data["league"].unique()) == 1:
+            assets.append(self.badge_service.league_badge_asset(league))
+        assets.append(image_asset(BALL_LOGO2_URL))
+        return assets
+
     def _setup_pitch(self) -> Tuple[Figure, Axes]:
         pitch = VerticalPitch(
             pitch_type="opta",
@@ -51,8 +66,8 @@ class BestElevenDashboard(Dashboard):
             linewidth=1,
             line_alpha=0.1,
         )
-        fig, axes = make_grid(
-            pitch=pitch,
+        fig, axes = make_grid_template(
+            pitch,
             figheight=self.figheight,
             title_height=0.05,
             title_space=0,
@@ -93,7 +108,7 @@ class BestElevenDashboard(Dashboard):
         )
 
         if len(data["league"].unique()) == 1:
-            league_image = McLachBotBadgeService().league_badge(data["league"].iloc[0])
+            league_image = self.badge_service.league_badge(data["league"].iloc[0])
 
             ax_width, ax_height = get_ax_size(ax, ax.get_figure())
 
@@ -123,7 +138,7 @@ class BestElevenDashboard(Dashboard):
         team_name_table = data[["league", "squad"]].drop_duplicates()
         league = data["league"].iloc[0]
         team_badges = {
-            team_name: McLachBotBadgeService().team_badge(league, team_name)
+            team_name: self.badge_service.team_badge(league, team_name)
             for team_name in team_name_table["squad"]
         }
         return team_badges
@@ -238,7 +253,7 @@ class BestElevenDashboard(Dashboard):
 
         logo_ax = pitch.inset_axes(0.5, 0.90, length=0.8, aspect=1, ax=ax)
         logo_ax.axis("off")
-        logo_ax.imshow(get_ball_logo2())
+        logo_ax.imshow(get_ball_logo2(cache=self.badge_service.cache))
 
         ax.text(
             0.90,
@@ -9,7 +9,7 @@ from matplotlib.axes import Axes
 from typing import Dict, Tuple
 from matplotlib.lines import Line2D
 from footballdashboards.helpers.matplotlib import get_aspect
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService, get_ball_logo2
+from footballdashboards.helpers.mclachbot_helpers import get_ball_logo2
 
 from matplotlib.patches import FancyBboxPatch
 
@@ -314,10 +314,10 @@ class ButterflyDashboard(Dashboard):
             fontproperties=font_normal.prop,
             fontsize=14,
         )
-        home_img = McLachBotBadgeService().team_badge(
+        home_img = self.badge_service.team_badge(
             league, data.loc[data["is_home_team"] == True, "team"].iloc[0]
         )
-        away_img = McLachBotBadgeService().team_badge(
+        away_img = self.badge_service.team_badge(
             league, data.loc[data["is_home_team"] == False, "team"].iloc[0]
         )
         ax.text(
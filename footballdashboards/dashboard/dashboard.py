@@ -4,13 +4,19 @@ to all dashboards.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import pandas as pd
 from footballdashboards._types._data_accessor import _DataAccessor
 from footballdashboards._types._dashboard_fields import ColorField, DashboardField
 from footballdashboards._defaults._colours import FIGURE_FACECOLOUR, TEXT_COLOUR
 from footballdashboards._types._custom_types import PlotReturnType
 from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
+from footballdashboards.helpers.image_cache import ImageAsset
+from footballdashboards.helpers.copy_on_write import CopyReport, copy_on_write, count_copies
+from footballdashboards.helpers.dtype_compaction import CompactionReport, compact_dtypes
+from footballdashboards.helpers.matplotlib import VECTOR_FORMATS, render_figure
+from footballdashboards.helpers.pitch_backgrounds import vector_pitches
 
 
 class Dashboard(ABC):  # pylint: disable=too-few-public-methods
@@ -27,7 +33,25 @@ class Dashboard(ABC):  # pylint: disable=too-few-public-methods
     facecolor = ColorField(description="Figure background colour", default=FIGURE_FACECOLOUR)
     textcolor = ColorField(description="Figure text colour", default=TEXT_COLOUR)
     watermark = DashboardField(description="Watermark to add to the figure", default="McLachBot")
+    compact_data = DashboardField(
+        description="Downcast the data to the compact dtypes of the dashboard before plotting",
+        default=False,
+    )
+    debug_copies = DashboardField(
+        description="Count and size the DataFrame copies made by each render, for debugging",
+        default=False,
+    )
+    raster_pitches = DashboardField(
+        description="Draw pitch markings from a cached bitmap, faster for bitmap output only",
+        default=False,
+    )
     badge_service = McLachBotBadgeService()
+    prefetch_workers = 8
+    # plot under pandas copy-on-write.  Only turn on for dashboards whose plotting code,
+    # including the footmav/footballmodels helpers it calls, never relies on chained
+    # assignment, which copy-on-write silently turns into a no-op.  Such renders run one at
+    # a time, the option is process wide
+    use_copy_on_write = False
 
     @classmethod
     def get_full_field_descriptor_list(cls) -> List[Tuple[str, str]]:
@@ -55,6 +79,8 @@ class Dashboard(ABC):  # pylint: disable=too-few-public-methods
             data_accessor (_DataAccessor): Data accessor to use for retrieving data
         """
         self.data_accessor = data_accessor
+        self.last_compaction: Optional[CompactionReport] = None
+        self.last_copy_report: Optional[CopyReport] = None
 
     @property
     @abstractmethod
@@ -76,6 +102,112 @@ class Dashboard(ABC):  # pylint: disable=too-few-public-methods
             Dict[str, str]: Dictionary of required data columns and their descriptions
         """
 
+    def _optional_data_columns(self) -> Optional[Dict[str, str]]:
+        """
+        Function that returns the columns the dashboard reads when they are present, in
+        addition to the required data columns.  Dashboards that return a dictionary
+        declare that they read no other columns, so their data is projected to these
+        columns before plotting and accessors that support it only fetch these columns.
+        Columns the dashboard derives itself don't need to be listed.
+
+        Returns:
+            Optional[Dict[str, str]]: Dictionary of optional columns and their
+                descriptions, or None (the default) to receive every column
+        """
+        return None
+
+    def consumed_data_columns(self) -> Optional[List[str]]:
+        """
+        Function that returns every column the dashboard reads
+
+        Returns:
+            Optional[List[str]]: Required and optional columns, or None if the dashboard
+                hasn't declared the columns it reads
+        """
+        optional = self._optional_data_columns()
+        if optional is None:
+            return None
+        return list(dict.fromkeys([*self._required_data_columns(), *optional]))
+
+    def _project_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Function that drops the columns the dashboard doesn't read.  The projected frame
+        shares the column data of the original rather than copying it.
+
+        Args:
+            data (pd.DataFrame): Validated data
+
+        Returns:
+            pd.DataFrame: Data with only the consumed columns
+        """
+        columns = self.consumed_data_columns()
+        if columns is None:
+            return data
+        present = [column for column in columns if column in data.columns]
+        if len(present) == len(data.columns):
+            return data
+        return pd.DataFrame({column: data[column] for column in present}, copy=False)
+
+    def _column_dtypes(self) -> Dict[str, str]:
+        """
+        Function that returns the compact dtype of the columns the dashboard reads, used
+        when compact_data is on.  Keys are any of the required data columns and optional
+        columns; dtypes are float32, int8, int16, int32, bool or category.  Dashboards
+        that plot large frames should override this.
+
+        Returns:
+            Dict[str, str]: Dictionary of columns and their compact dtypes
+        """
+        return {}
+
+    def _compact_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Function that downcasts the data to the compact dtypes of the dashboard if
+        compact_data is on, recording the bytes saved in last_compaction
+
+        Args:
+            data (pd.DataFrame): Validated data
+
+        Returns:
+            pd.DataFrame: Data with compacted columns
+        """
+        if not self.compact_data:
+            return data
+        data, self.last_compaction = compact_dtypes(data, self._column_dtypes())
+        return data
+
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        """
+        Function that returns every badge, cutout and logo the dashboard will draw
+        for this data, so that they can be downloaded before plotting starts.
+        Dashboards that draw remote images should override this.
+
+        Args:
+            data (pd.DataFrame): Data that will be plotted
+
+        Returns:
+            List[ImageAsset]: Images that will be requested while plotting
+        """
+        return []
+
+    def prefetch_assets(self, data: pd.DataFrame) -> int:
+        """
+        Function that downloads all the images the dashboard needs in parallel, so
+        that plotting never waits on more than the slowest single image
+
+        Args:
+            data (pd.DataFrame): Data that will be plotted
+
+        Returns:
+            int: Number of images that were not already cached
+        """
+        try:
+            assets = [asset for asset in self._required_assets(data) if asset is not None]
+        except Exception:  # pylint: disable=broad-except
+            # listing assets is best effort, plotting fetches anything that is missing
+            return 0
+        return self.badge_service.cache.prefetch(assets, max_workers=self.prefetch_workers)
+
     @abstractmethod
     def _plot_data(self, data: pd.DataFrame) -> PlotReturnType:
         """
@@ -85,6 +217,28 @@ class Dashboard(ABC):  # pylint: disable=too-few-public-methods
             data (pd.DataFrame): Data to plot
         """
 
+    @contextmanager
+    def _render_context(self):
+        """
+        Context manager that a render runs in: pandas copy-on-write if use_copy_on_write
+        is set, and copy counting into last_copy_report if debug_copies is on
+        """
+        with ExitStack() as stack:
+            if self.use_copy_on_write:
+                stack.enter_context(copy_on_write())
+            counter = stack.enter_context(count_copies()) if self.debug_copies else None
+            try:
+                yield
+            finally:
+                if counter is not None:
+                    self.last_copy_report = counter.report()
+
+    def _prepare_and_plot(self, data: pd.DataFrame) -> PlotReturnType:
+        self._validate_data(data)
+        data = self._compact_data(self._project_data(data))
+        self.prefetch_assets(data)
+        return self._plot_data(data)
+
     def plot(self, **kwargs) -> PlotReturnType:
         """
         Function that plots the dashboard
@@ -92,9 +246,16 @@ class Dashboard(ABC):  # pylint: disable=too-few-public-methods
         Args:
             kwargs: Keyword arguments to pass to the plot function
         """
-        data = self.data_accessor.get_data(self.datasource_name, **kwargs)
-        self._validate_data(data)
-        return self._plot_data(data)
+        columns = self.consumed_data_columns()
+        if (
+            columns is not None
+            and "columns" not in kwargs
+            and getattr(self.data_accessor, "supports_column_projection", False)
+        ):
+            kwargs["columns"] = columns
+        with self._render_context():
+            data = self.data_accessor.get_data(self.datasource_name, **kwargs)
+            return self._prepare_and_plot(data)
 
     def plot_dataframe(self, data: pd.DataFrame) -> PlotReturnType:
         """
@@ -103,8 +264,40 @@ class Dashboard(ABC):  # pylint: disable=too-few-public-methods
         Args:
             data (pd.DataFrame): Data to plot
         """
-        self._validate_data(data)
-        return self._plot_data(data)
+        with self._render_context():
+            return self._prepare_and_plot(data)
+
+    def render(
+        self,
+        fmt: str = "png",
+        dpi: Optional[float] = None,
+        rasterize_layers: Optional[Iterable[str]] = None,
+        optimize: bool = False,
+        quality: Optional[int] = None,
+        **kwargs,
+    ) -> Union[bytes, memoryview]:
+        """
+        Function that plots the dashboard and renders it straight to an in-memory image.
+        Pitches are drawn as vectors for vector formats, even if raster_pitches is on.
+
+        Args:
+            fmt (str): "png", "webp", "rgba" for the raw Agg buffer, or any other savefig
+                format
+            dpi (float, optional): Resolution of raster output. Defaults to the figure dpi
+            rasterize_layers (Iterable[str], optional): Dense layers to rasterize in vector
+                output, any of "scatter", "lines", "kde" and "mesh"
+            optimize (bool): Optimize png encoding, smaller files but slower
+            quality (int, optional): webp quality, 1-100.  Defaults to lossless
+            kwargs: Keyword arguments to pass to the plot function
+
+        Returns:
+            Union[bytes, memoryview]: Encoded image, or a memoryview of the RGBA canvas
+        """
+        with vector_pitches() if fmt.lower() in VECTOR_FORMATS else nullcontext():
+            fig, _ = self.plot(**kwargs)
+        return render_figure(
+            fig, fmt, dpi, rasterize=rasterize_layers, optimize=optimize, quality=quality
+        )
 
     def _validate_data(self, data: pd.DataFrame):
         """
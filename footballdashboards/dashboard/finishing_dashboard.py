@@ -5,21 +5,24 @@ import pandas as pd
 from footballdashboards._types._custom_types import PlotReturnType
 from footballdashboards._types._dashboard_fields import ColorField, DashboardField
 from footballdashboards.dashboard.dashboard import Dashboard
-from footmav.utils.whoscored_funcs import in_rectangle
 import matplotlib.cm as cm
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import Normalize
 from footballdashboards.helpers.fonts import font_normal, font_bold, font_italic
 from footballdashboards.helpers.formatters import full_name_formatter, simplified_opta_position
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService, get_image
+from footballdashboards.helpers.mclachbot_helpers import get_image
 from footballdashboards.helpers.matplotlib import get_aspect
 from matplotlib.colorbar import Colorbar
 from highlight_text import ax_text
 import cmasher as cmr
 from mplsoccer.pitch import VerticalPitch
+from footballdashboards.helpers.pitch_backgrounds import draw_pitch
+from footballdashboards.helpers.pitch_zones import PitchZones
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 
+OPTA_DIMS = opta_dims()
+
 
 class FinishingDashboard(Dashboard):
     linecolor = ColorField("Line color", "black")
@@ -28,55 +31,56 @@ class FinishingDashboard(Dashboard):
 
     RECTANGLES = {
         "left_near_box": (
-            (100, opta_dims().penalty_area_top),
+            (100, OPTA_DIMS.penalty_area_top),
             (
-                100 - (100 - opta_dims().penalty_area_right) / 2,
-                opta_dims().penalty_area_top - opta_dims().penalty_area_width / 3,
+                100 - (100 - OPTA_DIMS.penalty_area_right) / 2,
+                OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width / 3,
             ),
         ),
         "left_far_box": (
-            (100 - (100 - opta_dims().penalty_area_right) / 2, opta_dims().penalty_area_top),
+            (100 - (100 - OPTA_DIMS.penalty_area_right) / 2, OPTA_DIMS.penalty_area_top),
             (
-                opta_dims().penalty_area_right,
-                opta_dims().penalty_area_top - opta_dims().penalty_area_width / 3,
+                OPTA_DIMS.penalty_area_right,
+                OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width / 3,
             ),
         ),
         "center_near_box": (
-            (100, opta_dims().penalty_area_top - opta_dims().penalty_area_width / 3),
+            (100, OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width / 3),
             (
-                100 - (100 - opta_dims().penalty_area_right) / 2,
-                opta_dims().penalty_area_top - opta_dims().penalty_area_width * 2 / 3,
+                100 - (100 - OPTA_DIMS.penalty_area_right) / 2,
+                OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width * 2 / 3,
             ),
         ),
         "center_far_box": (
             (
-                100 - (100 - opta_dims().penalty_area_right) / 2,
-                opta_dims().penalty_area_top - opta_dims().penalty_area_width / 3,
+                100 - (100 - OPTA_DIMS.penalty_area_right) / 2,
+                OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width / 3,
             ),
             (
-                opta_dims().penalty_area_right,
-                opta_dims().penalty_area_top - opta_dims().penalty_area_width * 2 / 3,
+                OPTA_DIMS.penalty_area_right,
+                OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width * 2 / 3,
             ),
         ),
         "right_near_box": (
-            (100, opta_dims().penalty_area_top - opta_dims().penalty_area_width * 2 / 3),
-            (100 - (100 - opta_dims().penalty_area_right) / 2, opta_dims().penalty_area_bottom),
+            (100, OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width * 2 / 3),
+            (100 - (100 - OPTA_DIMS.penalty_area_right) / 2, OPTA_DIMS.penalty_area_bottom),
         ),
         "right_far_box": (
             (
-                100 - (100 - opta_dims().penalty_area_right) / 2,
-                opta_dims().penalty_area_top - opta_dims().penalty_area_width * 2 / 3,
+                100 - (100 - OPTA_DIMS.penalty_area_right) / 2,
+                OPTA_DIMS.penalty_area_top - OPTA_DIMS.penalty_area_width * 2 / 3,
             ),
-            (opta_dims().penalty_area_right, opta_dims().penalty_area_bottom),
+            (OPTA_DIMS.penalty_area_right, OPTA_DIMS.penalty_area_bottom),
         ),
-        "wide_left": ((100, 100), (75, opta_dims().penalty_area_top)),
-        "wide_right": ((100, opta_dims().penalty_area_bottom), (75, 0)),
+        "wide_left": ((100, 100), (75, OPTA_DIMS.penalty_area_top)),
+        "wide_right": ((100, OPTA_DIMS.penalty_area_bottom), (75, 0)),
         "outside_box": (
-            (opta_dims().penalty_area_right, opta_dims().penalty_area_top),
-            (75, opta_dims().penalty_area_bottom),
+            (OPTA_DIMS.penalty_area_right, OPTA_DIMS.penalty_area_top),
+            (75, OPTA_DIMS.penalty_area_bottom),
         ),
         "far": ((75, 100), (0, 0)),
     }
+    ZONES = PitchZones(RECTANGLES)
 
     @staticmethod
     def _corners_to_vertices(
@@ -91,17 +95,6 @@ class FinishingDashboard(Dashboard):
             ]
         )
 
-    @staticmethod
-    def _in_rectange(r: pd.Series):
-        try:
-            return next(
-                key
-                for key, value in FinishingDashboard.RECTANGLES.items()
-                if in_rectangle(r["x"], r["y"], value[0][0], value[0][1], value[1][0], value[1][1])
-            )
-        except StopIteration:
-            return ""
-
     @staticmethod
     def _rescale_colormap(data, vmin, vmax, cmap_name):
         norm = lambda x: (min(max(x, vmin), vmax) - vmin) / (vmax - vmin)
@@ -115,6 +108,38 @@ class FinishingDashboard(Dashboard):
     def _required_data_columns(self) -> Dict[str, str]:
         return {}
 
+    def _optional_data_columns(self) -> Dict[str, str]:
+        return {
+            "player_name": "Player name",
+            "team": "Team name",
+            "competition": "Competition, used to find the team badge",
+            "decorated_team_name": "Team name to use for display purposes",
+            "decorated_league_name": "Comma separated league names to use for display purposes",
+            "season": "Season",
+            "position": "Opta position of the player for each shot",
+            "minutes": "Minutes played",
+            "box_touches": "Touches in the opposition box",
+            "meta_id": "Id of the shot",
+            "x": "X coordinate of the shot",
+            "y": "Y coordinate of the shot",
+            "xg": "Non-penalty expected goals of the shot",
+            "is_goal": "Whether the shot was a goal",
+            "right_foot": "Whether the shot was taken with the right foot",
+            "left_foot": "Whether the shot was taken with the left foot",
+            "header": "Whether the shot was a header",
+        }
+
+    def _column_dtypes(self) -> Dict[str, str]:
+        return {
+            "player_name": "category",
+            "x": "float32",
+            "y": "float32",
+            "is_goal": "int8",
+            "right_foot": "int8",
+            "left_foot": "int8",
+            "header": "int8",
+        }
+
     def _setup_fig(self) -> Figure:
         fig = Figure(figsize=(8, 8 * 0.6), dpi=300)
         fig.set_facecolor(self.facecolor)
@@ -138,8 +163,7 @@ class FinishingDashboard(Dashboard):
             half=True,
             linewidth=1,
         )
-        pitch.draw(ax=axes["pitch"])
-        axes["pitch"].set_ylim((70, 104))
+        draw_pitch(pitch, axes["pitch"], raster=self.raster_pitches, ylim=(70, 104))
         return fig, axes, pitch
 
     def _draw_pitch_rectangles(self, pitch: VerticalPitch, ax: Axes):
@@ -157,7 +181,7 @@ class FinishingDashboard(Dashboard):
     def _plot_agg_shots(
         self, data: pd.DataFrame, pitch: VerticalPitch, ax: Axes, fig: Figure
     ) -> None:
-        data["rectange"] = data.apply(self._in_rectange, axis=1)
+        data["rectange"] = self.ZONES.classify(data["x"], data["y"])
         agg_data = (
             data.groupby("rectange").agg({"xg": "sum", "meta_id": "count", "is_goal": "sum"})
             / data["minutes"].iloc[0]
@@ -314,7 +338,7 @@ class FinishingDashboard(Dashboard):
             fontsize=10,
         )
 
-        badge_image = McLachBotBadgeService().team_badge(
+        badge_image = self.badge_service.team_badge(
             data["competition"].values[0], data["team"].values[0]
         )
 
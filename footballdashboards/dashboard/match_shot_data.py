@@ -6,12 +6,13 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 from mplsoccer import VerticalPitch
 from footballdashboards.helpers.matplotlib import get_aspect
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
 from footballdashboards.helpers.fonts import font_normal, font_bold, font_mono
 from matplotlib.patches import FancyBboxPatch
 import datetime as dt
 from mpltable import Table
 from footballdashboards.helpers.mclachbot_helpers import get_ball_logo2
+from footballdashboards.helpers.pitch_backgrounds import draw_pitch
+from footballdashboards.helpers.copy_on_write import select_rows
 import pandas as pd
 from footmav.data_definitions.whoscored.constants import EventType
 from footmav.utils import whoscored_funcs as WF
@@ -59,7 +60,7 @@ class MatchShotDashboard(Dashboard):
         pitch = VerticalPitch(
             "opta", pitch_color=self.facecolor, linewidth=1, line_color=self.textcolor
         )
-        pitch.draw(ax=axes["pitch"])
+        draw_pitch(pitch, axes["pitch"], raster=self.raster_pitches)
         #logo_ax = pitch.inset_axes(6, 6 / 65 * 105, 11, 11 / 65 * 105, ax=axes["pitch"], zorder=200)
         #logo_ax.axis("off")
         #logo_ax.imshow(get_ball_logo2())
@@ -78,7 +79,7 @@ class MatchShotDashboard(Dashboard):
             #img_ax = pitch.inset_axes(50 + i * 15, 50, 20, 20 * get_aspect(ax), ax=ax, zorder=200)
             #img_ax.axis("off")
             #img_ax.imshow(McLachBotBadgeService().team_badge(league_name, img_name), zorder=200)
-            pitch.inset_image(50 + i * 15, 50, McLachBotBadgeService().team_badge(league_name, img_name), 30, ax=ax, alpha=0.2)
+            pitch.inset_image(50 + i * 15, 50, self.badge_service.team_badge(league_name, img_name), 30, ax=ax, alpha=0.2)
 
     @staticmethod
     def _player_name_format(name: str) -> str:
@@ -130,22 +131,23 @@ class MatchShotDashboard(Dashboard):
 
     def _plot_pitch_data(self, data: pd.DataFrame, ax: Axes, pitch: VerticalPitch):
         self._plot_shots(data, ax, pitch)
-        events = data.loc[
+        events = select_rows(
+            data,
             (data["event_type"] != EventType.Carry)
-            & (~WF.col_has_qualifier(data, qualifier_code=28))
-        ].copy()
+            & (~WF.col_has_qualifier(data, qualifier_code=28)),
+        )
         events["Goals"] = events["event_type"].apply(lambda x: 1 if x == EventType.Goal else 0)
-        home_events = events.loc[
-            (data["is_home_team"] == 1) & (events["event_type"] != EventType.Carry)
-        ].copy()
-        away_events = events.loc[
-            (data["is_home_team"] == 0) & (events["event_type"] != EventType.Carry)
-        ].copy()
+        home_events = select_rows(
+            events, (data["is_home_team"] == 1) & (events["event_type"] != EventType.Carry)
+        )
+        away_events = select_rows(
+            events, (data["is_home_team"] == 0) & (events["event_type"] != EventType.Carry)
+        )
         home_team_name = home_events["team"].tolist()[0]
         away_team_name = away_events["team"].tolist()[0]
         league_name = home_events["competition"].tolist()[0]
-        home_events["xG"].fillna(0, inplace=True)
-        away_events["xG"].fillna(0, inplace=True)
+        home_events["xG"] = home_events["xG"].fillna(0)
+        away_events["xG"] = away_events["xG"].fillna(0)
         home_table = (
             home_events.groupby("player_name")
             .agg({"xG": "sum", "id": "count", "Goals": "sum"})
@@ -172,14 +174,14 @@ class MatchShotDashboard(Dashboard):
             data["event_type"].isin(
                 [EventType.ShotOnPost, EventType.MissedShots, EventType.SavedShot]
             )
-        ].copy()
+        ]
         goals = data.loc[
             (data["event_type"] == EventType.Goal)
             & (~WF.col_has_qualifier(data, qualifier_code=28))
-        ].copy()
+        ]
         own_goals = data.loc[
             (data["event_type"] == EventType.Goal) & (WF.col_has_qualifier(data, qualifier_code=28))
-        ].copy()
+        ]
         if len(shots) > 0:
             pitch.scatter(
                 shots["x"],
@@ -213,9 +215,9 @@ class MatchShotDashboard(Dashboard):
 
     def _plot_title(self, data: pd.DataFrame, ax: Axes):
         ax.axis("off")
-        events = data.loc[data["event_type"] != EventType.Carry].copy()
-        home_events = events.loc[events["is_home_team"] == 1].copy()
-        away_events = events.loc[events["is_home_team"] == 0].copy()
+        events = data.loc[data["event_type"] != EventType.Carry]
+        home_events = events.loc[events["is_home_team"] == 1]
+        away_events = events.loc[events["is_home_team"] == 0]
         date = data["match_date"].iloc[0]
         league = home_events["competition"].tolist()[0]
         decorated_league_name = events["decorated_league_name"].tolist()[0]
@@ -302,8 +304,8 @@ class MatchShotDashboard(Dashboard):
             fontproperties=font_normal.prop,
             fontsize=14,
         )
-        home_img = McLachBotBadgeService().team_badge(league, home_team)
-        away_img = McLachBotBadgeService().team_badge(league, away_team)
+        home_img = self.badge_service.team_badge(league, home_team)
+        away_img = self.badge_service.team_badge(league, away_team)
 
         ax2 = ax.inset_axes((-0.03, 0.105, get_aspect(ax) * 0.79, 0.79))
         ax2.imshow(home_img)
@@ -1,4 +1,5 @@
 from typing import Tuple
+import pandas as pd
 from footmav.event_aggregation import aggregators as agg
 from footmav.utils import whoscored_funcs as WF
 from footmav.data_definitions.whoscored.constants import EventType
@@ -7,11 +8,11 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 from matplotlib.patches import FancyBboxPatch
 from footballdashboards.helpers.fonts import font_bold, font_normal, font_italic, font_mono
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
 from footballdashboards.dashboard.dashboard import Dashboard
 from footballdashboards._types._dashboard_fields import ColorField, FigSizeField
 from footballmodels.opta.actions import set_piece_second_ball, open_play_second_ball
 from footballmodels.opta.event_type import EventType as FootballmodelsEventType
+from footballdashboards.helpers.event_types import convert_event_types
 
 
 @event_aggregator
@@ -28,10 +29,12 @@ def open_play_box_entries(data):
 
 
 def total_second_balls(data):
-    data = data.copy()
-
-    data["event_type"] = data["event_type"].apply(lambda x: FootballmodelsEventType(x.value))
-    data = data.loc[data["event_type"] != FootballmodelsEventType.Carry]
+    # convert once and compare the converted members directly, going through the codes
+    # would factorize the enum column a second time.  assign returns a new frame of the
+    # remaining events, so the caller's data is never modified
+    event_types = convert_event_types(data["event_type"], FootballmodelsEventType)
+    keep = event_types != FootballmodelsEventType.Carry
+    data = data.loc[keep].assign(event_type=event_types[keep])
     data["total_second_balls"] = (set_piece_second_ball(data) | open_play_second_ball(data)).astype(
         int
     )
@@ -64,40 +67,33 @@ def agg_minutes(dataframe):
     )
 
 
+def _home_and_away(dataframe, values):
+    # sum per team without adding the values as a column, so the events are never copied
+    group = pd.Series(values, index=dataframe.index).groupby(dataframe["team"]).sum()
+    home = dataframe.loc[dataframe["is_home_team"] == True, "team"].iloc[0]
+    away = dataframe.loc[dataframe["is_home_team"] == False, "team"].iloc[0]
+    return group[home], group[away]
+
+
 def stat_wrapper(f):
     def wrapper(dataframe, *args, **kwargs):
-        data = dataframe.copy()
-        data[f.col_name] = f(data, *args, **kwargs)
-        group = data.groupby("team").agg({f.col_name: "sum"}).to_dict()[f.col_name]
-        home = data.loc[data["is_home_team"] == True, "team"].iloc[0]
-        away = data.loc[data["is_home_team"] == False, "team"].iloc[0]
-        return (group[home], group[away])
+        return _home_and_away(dataframe, f(dataframe, *args, **kwargs))
 
     return wrapper
 
 
 def stat_wrapper_success(f):
     def wrapper(dataframe, *args, **kwargs):
-        data = dataframe.copy()
-        data[f.col_name] = f.success(data, *args, **kwargs)
-        group = data.groupby("team").agg({f.col_name: "sum"}).to_dict()[f.col_name]
-        home = data.loc[data["is_home_team"] == True, "team"].iloc[0]
-        away = data.loc[data["is_home_team"] == False, "team"].iloc[0]
-        return (group[home], group[away])
+        return _home_and_away(dataframe, f.success(dataframe, *args, **kwargs))
 
     return wrapper
 
 
 def stat_wrapper_success_pct(f):
     def wrapper(dataframe, *args, **kwargs):
-        data = dataframe.copy()
-        data[f"{f.col_name}_success"] = f.success(data, *args, **kwargs)
-        data[f.col_name] = f(data, *args, **kwargs)
-        group = data.groupby("team").agg({f.col_name: "sum", f"{f.col_name}_success": "sum"})
-        group = (group[f"{f.col_name}_success"] / group[f.col_name] * 100).to_dict()
-        home = data.loc[data["is_home_team"] == True, "team"].iloc[0]
-        away = data.loc[data["is_home_team"] == False, "team"].iloc[0]
-        return (group[home], group[away])
+        success = _home_and_away(dataframe, f.success(dataframe, *args, **kwargs))
+        total = _home_and_away(dataframe, f(dataframe, *args, **kwargs))
+        return (success[0] / total[0] * 100, success[1] / total[1] * 100)
 
     return wrapper
 
@@ -290,10 +286,10 @@ class MatchSummaryDashboard(Dashboard):
             fontproperties=font_normal.prop,
             fontsize=14,
         )
-        home_img = McLachBotBadgeService().team_badge(
+        home_img = self.badge_service.team_badge(
             league, data.loc[data["is_home_team"] == True, "team"].iloc[0]
         )
-        away_img = McLachBotBadgeService().team_badge(
+        away_img = self.badge_service.team_badge(
             league, data.loc[data["is_home_team"] == False, "team"].iloc[0]
         )
         ax2 = fig.add_axes([0.05, 0.89, 0.09, 0.09])
@@ -3,10 +3,12 @@ import os
 from matplotlib.axes import Axes
 from footballdashboards.dashboard.pizzadashboard import PizzaDashboard
 from footballdashboards.helpers.mclachbot_helpers import (
-    McLachBotBadgeService,
     TeamColorHelper,
     CachedPlayerImageHelper,
+    get_image,
+    image_asset,
 )
+from footballdashboards.helpers.image_cache import ImageAsset
 from footballdashboards.helpers.matplotlib import get_aspect
 from scipy.ndimage import rotate
 from footballdashboards.helpers.fonts import font_europa, font_normal, font_italic
@@ -15,9 +17,8 @@ from footballdashboards.helpers.utils import is_high_luminance
 from footballdashboards._types._custom_types import PlotReturnType
 from matplotlib.figure import Figure
 from matplotlib.cm import get_cmap
-from PIL import Image
 import numpy as np
-from urllib.request import urlopen
+from typing import List
 
 
 class NewDesignPizzaDashboard(PizzaDashboard):
@@ -25,6 +26,16 @@ class NewDesignPizzaDashboard(PizzaDashboard):
     PRESERVE_FULLSIZE_CUTOUT = False
     SCOUTED_IMAGE_LOCATION = None
 
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        assets = super()._required_assets(data)
+        image_helper = CachedPlayerImageHelper(
+            self.PLAYER_IMAGE_CACHE_URL, self.badge_service.cache
+        )
+        assets.append(image_helper.player_image_asset(data["player_id"].unique()[0]))
+        if self.SCOUTED_IMAGE_LOCATION:
+            assets.append(image_asset(self.SCOUTED_IMAGE_LOCATION))
+        return assets
+
     def _template_color(self):
         templates = {
             "CMPizza": "blue",
@@ -85,7 +96,7 @@ class NewDesignPizzaDashboard(PizzaDashboard):
 
     def _plot_endnote(self, data: pd.DataFrame, ax: Axes) -> Axes:
         if self.SCOUTED_IMAGE_LOCATION:
-            image = Image.open(urlopen(self.SCOUTED_IMAGE_LOCATION))
+            image = get_image(self.SCOUTED_IMAGE_LOCATION, self.badge_service.cache)
             image_aspect = image.size[1] / image.size[0]
             ax_aspect = get_aspect(ax)
             inset_scouted = ax.inset_axes([0.02, 4.6, 0.15, 0.15 / ax_aspect * image_aspect])
@@ -162,7 +173,7 @@ class NewDesignPizzaDashboard(PizzaDashboard):
         )
 
     def _place_team_logo(self, team: str, league, ax: Axes, fig: Figure):
-        img = McLachBotBadgeService().team_badge(league, team)
+        img = self.badge_service.team_badge(league, team)
         img = np.array(list(img.convert("RGBA").getdata())).reshape(img.height, img.width, 4)
         rotated_img = rotate(img, 10, reshape=True)
         rotated_img = rotated_img[
@@ -264,7 +275,9 @@ class NewDesignPizzaDashboard(PizzaDashboard):
         aspect = get_aspect(ax)
         insert_ax = ax.inset_axes([1 - aspect - 0.04, 0, aspect, 1])
         insert_ax.axis("off")
-        img = CachedPlayerImageHelper(self.PLAYER_IMAGE_CACHE_URL).get_player_image(player_id)
+        img = CachedPlayerImageHelper(
+            self.PLAYER_IMAGE_CACHE_URL, self.badge_service.cache
+        ).get_player_image(player_id)
         if img is None:
             return
         img = np.array(list(img.convert("RGBA").getdata())).reshape(img.height, img.width, 4)
@@ -2,6 +2,7 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 import pandas as pd
 import numpy as np
+from typing import List
 from footballdashboards._types._dashboard_fields import (
     ColorField,
     FigSizeField,
@@ -11,15 +12,15 @@ from footballdashboards._types._dashboard_fields import (
 from footballdashboards.helpers.utils import is_high_luminance
 from footballdashboards._types._custom_types import PlotReturnType
 from footballdashboards.helpers.mclachbot_helpers import (
-    McLachBotBadgeService,
     CachedPlayerImageHelper,
+    get_image,
+    image_asset,
 )
+from footballdashboards.helpers.image_cache import ImageAsset
 from footballdashboards.helpers.matplotlib import get_aspect
 from footballdashboards.helpers.formatters import smartest_name_formatter_yet
 from footballdashboards.helpers.fonts import font_europa, font_normal, font_italic
 from scipy.ndimage import rotate
-from PIL import Image
-from urllib.request import urlopen
 from footballdashboards.dashboard.radardashboard import RadarDashboard
 
 
@@ -30,6 +31,18 @@ class NewStyleRadarDashboard(RadarDashboard):
     FIG_SIZE_DEFAULT = (4 * 1.5, 6 * 1.5)
     fig_size = FigSizeField(description="Figure size", default=FIG_SIZE_DEFAULT)
 
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        assets = super()._required_assets(data)
+        image_helper = CachedPlayerImageHelper(
+            self.PLAYER_IMAGE_CACHE_URL, self.badge_service.cache
+        )
+        assets.extend(
+            image_helper.player_image_asset(player_id) for player_id in data["player_id"].iloc[:2]
+        )
+        if self.SCOUTED_IMAGE_LOCATION:
+            assets.append(image_asset(self.SCOUTED_IMAGE_LOCATION))
+        return assets
+
     def _template_color(self, template_name: str = None):
         templates = {
             "Midfielder": "blue",
@@ -55,7 +68,7 @@ class NewStyleRadarDashboard(RadarDashboard):
         return fig, axes
 
     def _place_team_logo(self, team: str, league, ax: Axes, fig: Figure, side: str):
-        img = McLachBotBadgeService().team_badge(league, team)
+        img = self.badge_service.team_badge(league, team)
         img = np.array(list(img.convert("RGBA").getdata())).reshape(img.height, img.width, 4)
         rotate_angle = 10 if side == "left" else -10
         rotated_img = rotate(img, rotate_angle, reshape=True)
@@ -210,7 +223,9 @@ class NewStyleRadarDashboard(RadarDashboard):
             height = 0.4
             insert_ax = ax.inset_axes([0.75 - height * aspect / 2, 0.55, height * aspect, height])
         insert_ax.axis("off")
-        img = CachedPlayerImageHelper(self.PLAYER_IMAGE_CACHE_URL).get_player_image(player_id)
+        img = CachedPlayerImageHelper(
+            self.PLAYER_IMAGE_CACHE_URL, self.badge_service.cache
+        ).get_player_image(player_id)
         if img is None:
             return
         img = np.array(list(img.convert("RGBA").getdata())).reshape(img.height, img.width, 4)
@@ -270,7 +285,7 @@ class NewStyleRadarDashboard(RadarDashboard):
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         if self.SCOUTED_IMAGE_LOCATION:
-            image = Image.open(urlopen(self.SCOUTED_IMAGE_LOCATION))
+            image = get_image(self.SCOUTED_IMAGE_LOCATION, self.badge_service.cache)
             image_aspect = image.size[1] / image.size[0]
             ax_aspect = get_aspect(ax)
             inset_scouted = ax.inset_axes([0.02, 4.6, 0.15, 0.15 / ax_aspect * image_aspect])
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from typing import Dict, Any
 from footballmodels.opta.actions import (
     is_kickoff,
     assign_possession_team_id,
@@ -13,6 +14,10 @@ from footballmodels.opta.aggregation.team_aggregation import (
 )
 from footballmodels.opta.event_type import EventType
 from footballdashboards.helpers.mplsoccer_helpers import bin_statistic
+from footballdashboards.helpers import event_preprocessing
+from footballdashboards.helpers.figure_templates import cached_figure
+from footballdashboards.helpers.pitch_backgrounds import draw_pitch
+from footballdashboards.helpers.xthreat import assign_xthreat
 from matplotlib.figure import Figure
 
 from matplotlib import patches as mpatches
@@ -25,11 +30,12 @@ from mpl_pe_fancy_bar import BarToRoundBar
 import mpl_visual_context.patheffects as pe
 from mplsoccer.pitch import Pitch, VerticalPitch
 import matplotlib.colors as mcolors
-import requests
 from footballmodels.opta.functions import col_get_qualifier_value
 from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
 from footballdashboards.helpers.mclachbot_helpers import TeamColorHelper
 from footballdashboards.helpers.data_helpers import extract_names_sorted_by_position
+from footballdashboards.helpers.lineups import insert_substitutes, player_minutes, substitutions
+from footballdashboards.helpers.pass_networks import aggregate_edges, aggregate_nodes
 from footballdashboards.helpers.formatters import smartest_name_formatter_yet
 from footballmodels.opta.functions import col_has_qualifier
 
@@ -51,30 +57,22 @@ from footballmodels.opta.distance import (
 import highlight_text as ht
 from footballdashboards.helpers.mclachbot_helpers import get_ball_logo2
 from footballdashboardsdata.funnels.funnel_api import get_dataframe_for_match
+from footballdashboards.helpers.event_store import EventStore
+from footballdashboards.helpers.event_types import convert_event_types
+from footballdashboards.helpers.copy_on_write import copy_on_write, select_rows
 
-def fix_own_goals(data:pd.DataFrame) -> pd.DataFrame:
-        """
-        Fix own goals by subtracting the xthreat value from the team that conceded the goal
-        """
-        data = data.copy()
-        data['own_goal']=0
-        goals = data[data["event_type"] == EventType.Goal]
-        own_goals = goals[col_has_qualifier(goals, display_name="OwnGoal")]
-        if not own_goals.empty:
-            both_team_ids = data["teamId"].unique()
-            both_teams_names = data['team'].unique()
-            for i, row in own_goals.iterrows():
-                data.loc[i, 'x'] = 100 - row['x']
-                data.loc[i, 'y'] = 100 - row['y']
-                data.loc[i, 'is_home_team'] = 1 - row['is_home_team']
-                data.loc[i, 'team'] = next(
-                    team for team in both_teams_names if team != row['team']
-                )
-                data.loc[i, 'teamId'] = next(
-                    team_id for team_id in both_team_ids if team_id != row['teamId']
-                )
-                data.loc[i, 'own_goal'] = 1
-        return data
+def fix_own_goals(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Credit own goals to the team that benefited from them, mirroring their coordinates
+    and flipping team, teamId and is_home_team in a single masked pass
+    """
+    is_goal = (data["event_type"] == EventType.Goal).to_numpy()
+    own_goal_mask = np.zeros(len(data), dtype=bool)
+    if is_goal.any():
+        own_goal_mask[is_goal] = np.asarray(
+            col_has_qualifier(data[is_goal], display_name="OwnGoal"), dtype=bool
+        )
+    return event_preprocessing.fix_own_goals(data, own_goal_mask)
 
 
 def color_name_to_hex(color_name):
@@ -93,19 +91,8 @@ def hex_to_rgb(hex_code):
     return tuple(int(hex_code[i : i + 2], 16) / 256 for i in (0, 2, 4))
 
 
-def get_xthreat_grid() -> List[List[float]]:
-    """
-    Retrieve the xthread grid from the web
-    """
-
-    r = requests.get("https://karun.in/blog/data/open_xt_12x8_v1.json")
-    if r.status_code != 200:
-        raise Exception("Could not retrieve xthreat grid")
-    return r.json()
-
-
 def generate_match_stats(data):
-    data = data[~data["event_type"].isin([EventType.OffsideGiven])].copy()
+    data = select_rows(data, ~data["event_type"].isin([EventType.OffsideGiven]))
     data["kickoff"] = is_kickoff(data)
     possession_id_dict = data.groupby("possession_number").apply(
         lambda x: assign_possession_team_id(x), include_groups=False
@@ -163,6 +150,10 @@ def get_match_stat_history(league, conn):
 
 
 def create_layout(facecolor="white"):
+    return cached_figure(("new_match_report", facecolor), lambda: _build_layout(facecolor))
+
+
+def _build_layout(facecolor):
     fig = Figure(figsize=(20, 18), facecolor=facecolor)
     axes = fig.subplot_mosaic(
         [
@@ -442,10 +433,7 @@ class GameFlow:
         """
         Assign xthreat values to each event in the data
         """
-        xthreat_grid = get_xthreat_grid()
-        xt_idx_x = pd.cut(data["x"], bins=np.linspace(0, 100, 13), labels=range(12)).fillna(0)
-        xt_idx_y = pd.cut(data["y"], bins=np.linspace(0, 100, 9), labels=range(8)).fillna(0)
-        data["xthreat"] = [xthreat_grid[y][x] for x, y in zip(xt_idx_x, xt_idx_y)]
+        data["xthreat"] = assign_xthreat(data["x"], data["y"])
         return data
 
     @staticmethod
@@ -466,44 +454,26 @@ class GameFlow:
     @staticmethod
     def fill_missing_minutes(data: pd.DataFrame) -> pd.DataFrame:
         """
-        Fill in missing minutes in the data
+        Fill in missing minutes in the data by reindexing on the product of
+        period x minute x team
         """
-        max_minutes_in_period = data.groupby("period")["minute"].max().to_dict()
+        keys = ["period", "minute", "team"]
+        max_minutes_in_period = data.groupby("period")["minute"].max()
         home_away_teams = data.groupby("team")["is_home_team"].first().to_dict()
-        periods = data["period"].unique()
         teams = data["team"].unique()
-        full_data = []
-        for period in periods:
-            for minute in (
-                range(0, max_minutes_in_period[period] + 1)
-                if period == 1
-                else range(45, max_minutes_in_period[period] + 1)
-            ):
-                for team in teams:
-                    if (
-                        len(
-                            data[
-                                (data["period"] == period)
-                                & (data["minute"] == minute)
-                                & (data["team"] == team)
-                            ]
-                        )
-                        == 0
-                    ):
-                        full_data.append(
-                            {
-                                "period": period,
-                                "minute": minute,
-                                "team": team,
-                                "xthreat": 0,
-                                "goals": 0,
-                            }
-                        )
-        full_data = pd.DataFrame(full_data)
-
+        expected = [
+            pd.MultiIndex.from_product(
+                [[period], range(0 if period == 1 else 45, max_minute + 1), teams], names=keys
+            )
+            for period, max_minute in max_minutes_in_period.items()
+        ]
+        indexed = data.set_index(keys)
         full_data = (
-            pd.concat([data, full_data])
-            .sort_values(["period", "minute", "team"])
+            indexed.reindex(indexed.index.append(expected).unique())
+            .fillna({"xthreat": 0, "goals": 0})
+            .astype({"goals": data["goals"].dtype})
+            .reset_index()
+            .sort_values(keys)
             .reset_index(drop=True)
         )
         full_data["is_home_team"] = full_data["team"].map(home_away_teams)
@@ -658,50 +628,61 @@ class GameFlow:
         # scatter_football(away_goals['time'], [-0.135]*len(away_goals), ax=ax, s=55, edgecolors=args['away_team_color'])
 
     @staticmethod
-    def fancy_gameflow_chart(ax: Axes, data: pd.DataFrame, args: Dict[str, Any]):
+    def add_time_and_direction(data: pd.DataFrame) -> pd.DataFrame:
         """
-        Create a fancy gameflow chart
+        Convert period and minute into a single continuous time value and make the away
+        team's xthreat negative so it is drawn below the timeline.  Like the other steps of
+        prepare it modifies the frame the previous step built
         """
-        data = data.copy()
-        # simplify by converting the period and minute into a single time value
-        data["time"] = data.apply(
-            lambda x: (
-                x["minute"]
-                if x["period"] == 1
-                else x["minute"] + data.loc[data["period"] == 1, "minute"].max() + 1 - 45
-            ),
-            axis=1,
+        first_period_end = data.loc[data["period"] == 1, "minute"].max()
+        data["time"] = np.where(
+            data["period"] == 1, data["minute"], data["minute"] + first_period_end + 1 - 45
         )
         data = data.sort_values("time")
-        data["xthreat"] = data.apply(
-            lambda x: x["xthreat"] if x["is_home_team"] == 1 else -x["xthreat"], axis=1
-        )
-        GameFlow.setup_axis(ax, data)
-        GameFlow.setup_central_timeline(ax, data, args)
-        GameFlow.draw_gameflow(ax, data, args)
-        GameFlow.place_goals(ax, data, args)
+        data["xthreat"] = data["xthreat"] * event_preprocessing.team_side(data["is_home_team"])
+        return data
 
     @staticmethod
-    def process(raw_data: pd.DataFrame, ax: Axes, args: Dict[str, Any]):
+    def prepare(raw_data: pd.DataFrame) -> pd.DataFrame:
         """
-        Process the raw data and draw the gameflow chart
+        Turn raw match events into the per minute, per team frame drawn by the gameflow chart
         """
-        processed_data = (
-            raw_data.copy()
-            .pipe(fix_own_goals)
+        return (
+            raw_data.pipe(fix_own_goals)
             .pipe(GameFlow.assign_xthreat_to_events)
             .pipe(GameFlow.bin_data_into_minutes, max_xthreat_value=0.2)
             .pipe(GameFlow.fill_missing_minutes)
             .pipe(GameFlow.calculate_xthreat_ewma, minute_rolling_window=5)
+            .pipe(GameFlow.add_time_and_direction)
         )
 
-        GameFlow.fancy_gameflow_chart(ax, processed_data, args)
+    @staticmethod
+    def fancy_gameflow_chart(ax: Axes, data: pd.DataFrame, args: Dict[str, Any]):
+        """
+        Create a fancy gameflow chart from the output of GameFlow.prepare
+        """
+        GameFlow.setup_axis(ax, data)
+        GameFlow.setup_central_timeline(ax, data, args)
+        GameFlow.draw_gameflow(ax, data, args)
+        GameFlow.place_goals(ax, data, args)
+
+    @staticmethod
+    def process(
+        raw_data: pd.DataFrame, ax: Axes, args: Dict[str, Any], prepared_data: pd.DataFrame = None
+    ) -> pd.DataFrame:
+        """
+        Process the raw data and draw the gameflow chart.  Returns the prepared frame, which
+        can be passed back in as prepared_data to redraw the chart without reprocessing.
+        """
+        if prepared_data is None:
+            prepared_data = GameFlow.prepare(raw_data)
+        GameFlow.fancy_gameflow_chart(ax, prepared_data, args)
+        return prepared_data
 
 
 class Heatmap:
     @staticmethod
     def heatmap_transform_data(data):
-        data = data.copy()
         applicable_events = [
             EventType.Aerial,
             EventType.Goal,
@@ -721,14 +702,7 @@ class Heatmap:
             EventType.TakeOn,
         ]
         data = data[data["event_type"].isin(applicable_events)]
-        data["possession_side"] = data["is_home_team"].apply(lambda x: 1 if x == 1 else -1)
-        data["x"] = data.apply(
-            lambda x: x["x"] if x["possession_side"] == 1 else 100 - x["x"], axis=1
-        )
-        data["y"] = data.apply(
-            lambda x: x["y"] if x["possession_side"] == 1 else 100 - x["y"], axis=1
-        )
-        return data
+        return event_preprocessing.orient_by_team_side(data)
 
     @staticmethod
     def generate_colormap(home_color, away_color):
@@ -771,7 +745,7 @@ class Heatmap:
         cmap = Heatmap.generate_colormap(
             visualisation_parameters["home_team_color"], visualisation_parameters["away_team_color"]
         )
-        pitch.draw(ax=ax)
+        draw_pitch(pitch, ax, raster=visualisation_parameters["raster_pitches"])
         pitch.heatmap(
             bins,
             edgecolors="white",
@@ -807,12 +781,9 @@ class ShotMap:
             line_color=visualisation_parameters["pitch_line_color"],
             linewidth=1,
         )
-        pitch_left.draw(ax=left_side)
-        pitch_right.draw(ax=right_side)
-        right_side.set_xlim(15, 85)
-        right_side.set_ylim(60, 101)
-        left_side.set_xlim(15, 85)
-        left_side.set_ylim(60, 101)
+        raster = visualisation_parameters["raster_pitches"]
+        draw_pitch(pitch_left, left_side, raster=raster, xlim=(15, 85), ylim=(60, 101))
+        draw_pitch(pitch_right, right_side, raster=raster, xlim=(15, 85), ylim=(60, 101))
         return left_side, pitch_left, right_side, pitch_right
 
     @staticmethod
@@ -1348,6 +1319,10 @@ class VisualiationParameterMaker:
             "max_size_passes": 75,
             "max_size_touches": 150,
             "pitch_line_color": "grey",
+            # False draws one artist per pass network edge, for per-line z-ordering
+            "batched_drawing": True,
+            # True draws the pitch markings from a cached bitmap, only for bitmap output
+            "raster_pitches": False,
         }
         return visualisation_arguments
 
@@ -1420,12 +1395,6 @@ class PlayerStats:
         )
         return is_progressive
 
-    @staticmethod
-    def progressive_pass_received(data):
-        data = data[(data["event_type"] == EventType.Pass) & (data["outcomeType"] == 1)].copy()
-        data["prog_pass"] = PlayerStats.is_progressive(data)
-        return data.groupby("pass_receiver")["prog_pass"].sum().to_dict()
-
     @staticmethod
     def change_pos(pos):
         if len(pos) == 4:
@@ -1434,102 +1403,97 @@ class PlayerStats:
 
     @staticmethod
     def sort_player_names(data):
-        non_starters = data[data["event_type"] == EventType.SubstitutionOn]["player_name"].unique()
-        sub_offs = data[data["event_type"] == EventType.SubstitutionOff]["player_name"].unique()
-        starter_data = data[~data["player_name"].isin(non_starters)]
+        subs = substitutions(data, EventType.SubstitutionOn, EventType.SubstitutionOff)
+        starter_data = data[~data["player_name"].isin(subs["player_on"])]
         starters = extract_names_sorted_by_position(starter_data)
-        p_list = []
-        for p in starters:
-            if p not in sub_offs:
-                p_list.append(p)
-            else:
-                p_list.append(p)
-                sub_event = starter_data[
-                    (starter_data["player_name"] == p)
-                    & (starter_data["event_type"] == EventType.SubstitutionOff)
-                ].iloc[0]
-                sub_in_event = data[
-                    (data["eventId"] == sub_event["relatedEventId"])
-                    & (data["teamId"] == sub_event["teamId"])
-                ].iloc[0]
-                p_list.append(sub_in_event["player_name"])
-        return p_list
+        return insert_substitutes(starters, subs)
 
     @staticmethod
     def mins_played(data):
-        max_minute = data["minute"].max()
-        players = data["player_name"].unique()
-        subs_on = data[data["event_type"] == EventType.SubstitutionOn]
-        subs_off = data[data["event_type"] == EventType.SubstitutionOff]
-        player_minutes = {}
-        for player in players:
-            start = 0
-            end = max_minute
-            if player in subs_on["player_name"].values:
-                start = subs_on[subs_on["player_name"] == player]["minute"].values[0]
-            if player in subs_off["player_name"].values:
-                end = subs_off[subs_off["player_name"] == player]["minute"].values[0]
-            player_minutes[player] = end - start
-        return player_minutes
+        return player_minutes(data, EventType.SubstitutionOn, EventType.SubstitutionOff)[
+            "minutes"
+        ].to_dict()
 
     @staticmethod
-    def progressive_distance(data):
-        data = data.copy()
-        data["distance"] = pd_f(data)
-        data["distance"] = np.maximum(
-            data["distance"]
-            * (
-                (data["event_type"].isin([EventType.Pass, EventType.Carry])) * (data["outcomeType"])
-            ),
-            0,
-        )
-        return data.groupby("player_name")["distance"].sum().to_dict()
-
-    @staticmethod
-    def defensive_actions(data):
-        data = data.copy()
-        data["def_action"] = (
-            data["event_type"].isin(
-                [
-                    EventType.Tackle,
-                    EventType.Interception,
-                    EventType.BlockedPass,
-                    EventType.Clearance,
-                    EventType.BallRecovery,
-                ]
+    def related_event_values(
+        data: pd.DataFrame, source: pd.DataFrame, values: pd.Series
+    ) -> np.ndarray:
+        """
+        For every event in data, the value of the source event (eg a shot) whose
+        relatedEventId and teamId point at it, or 0 if there is none.  If several source
+        events point at the same event the last one wins.
+        """
+        links = (
+            pd.DataFrame(
+                {
+                    "eventId": source["relatedEventId"].to_numpy(),
+                    "teamId": source["teamId"].to_numpy(),
+                    "value": np.asarray(values, dtype=float),
+                }
             )
-        ) | ((data["event_type"] == EventType.Foul) & (data["outcomeType"] == 0))
-        return data.groupby("player_name")["def_action"].sum().to_dict()
+            .dropna(subset=["eventId"])
+            .drop_duplicates(["eventId", "teamId"], keep="last")
+        )
+        links["eventId"] = links["eventId"].astype(data["eventId"].dtype)
+        linked = data[["eventId", "teamId"]].merge(links, on=["eventId", "teamId"], how="left")
+        return linked["value"].fillna(0).to_numpy()
 
     @staticmethod
-    def calc_xa(data):
-        data = data.copy()
-        data = data[~data["event_type"].isin([EventType.Carry])]
+    def aggregate(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute every stat in the player table in one pass: flag columns are derived once,
+        shots are linked to the passes that created them with a single merge, and the
+        flags are summed with a single groupby.  Progressive passes received are counted
+        for the receiver rather than the passer.
+
+        Returns:
+            pd.DataFrame: One row per player with goals, assists, xg, xa, prog_distance,
+                def_actions, duels_won, prog_pass_rev and box_entries
+        """
+        event_type = data["event_type"]
+        is_goal = event_type == EventType.Goal
+        not_carry = (event_type != EventType.Carry).to_numpy()
         shots = data[
-            data["event_type"].isin(
+            event_type.isin(
                 [EventType.ShotOnPost, EventType.SavedShot, EventType.MissedShots, EventType.Goal]
             )
         ]
-        for _, s in shots.iterrows():
-
-            related_event_id = s["relatedEventId"]
-            data.loc[
-                (data["eventId"] == related_event_id) & (data["teamId"] == s["teamId"]), "xA"
-            ] = s["xG"]
-        return data.groupby("player_name")["xA"].sum().to_dict()
-
-    @staticmethod
-    def calc_assists(data):
-        data = data.copy()
-        data = data[~data["event_type"].isin([EventType.Carry])]
-        data["assist"] = 0
-        assists = data[data["event_type"] == EventType.Goal]
-        for _, a in assists.iterrows():
-            related_event_id = a["relatedEventId"]
-            data.loc[
-                (data["eventId"] == related_event_id) & (data["teamId"] == a["teamId"]), "assist"
-            ] = 1
-        return data.groupby("player_name")["assist"].sum().to_dict()
+        goals = data[is_goal]
+        flags = pd.DataFrame(
+            {
+                "player_name": data["player_name"],
+                "goals": is_goal & ~col_has_qualifier(data, qualifier_code=28),
+                "assists": PlayerStats.related_event_values(data, goals, np.ones(len(goals)))
+                * not_carry,
+                "xg": data["xG"].fillna(0),
+                "xa": PlayerStats.related_event_values(data, shots, shots["xG"]) * not_carry,
+                "prog_distance": np.maximum(
+                    pd_f(data)
+                    * (event_type.isin([EventType.Pass, EventType.Carry]) * data["outcomeType"]),
+                    0,
+                ),
+                "def_actions": event_type.isin(
+                    [
+                        EventType.Tackle,
+                        EventType.Interception,
+                        EventType.BlockedPass,
+                        EventType.Clearance,
+                        EventType.BallRecovery,
+                    ]
+                )
+                | ((event_type == EventType.Foul) & (data["outcomeType"] == 0)),
+                "duels_won": ground_duels_won(data) + aerial_duels_won(data),
+                "box_entries": open_play_box_entry(data),
+            },
+            index=data.index,
+        )
+        stats = flags.groupby("player_name").sum()
+        prog_pass_rev = (PlayerStats.is_progressive(data) & (data["outcomeType"] == 1)).groupby(
+            data["pass_receiver"]
+        ).sum()
+        stats = stats.join(prog_pass_rev.rename("prog_pass_rev"), how="outer").fillna(0)
+        counts = ["goals", "assists", "def_actions", "duels_won", "prog_pass_rev", "box_entries"]
+        return stats.astype({column: int for column in counts})
 
     @staticmethod
     def player_table(ax, data, team_color):
@@ -1651,26 +1615,17 @@ class PlayerStats:
 
         sub_ons = data[data["event_type"] == EventType.SubstitutionOn]
         sub_offs = data[data["event_type"] == EventType.SubstitutionOff]
-        goals = (
-            data[
-                (data["event_type"] == EventType.Goal)
-                & (~col_has_qualifier(data, qualifier_code=28))
-            ]
-            .groupby("player_name")
-            .size()
-            .to_dict()
-        )
-        xgs = data.groupby("player_name")["xG"].sum().to_dict()
-        prog_distance = PlayerStats.progressive_distance(data)
-        def_actions = PlayerStats.defensive_actions(data)
-        xa = PlayerStats.calc_xa(data)
-        assists = PlayerStats.calc_assists(data)
-        data["duels_won"] = ground_duels_won(data) + aerial_duels_won(data)
-        duels_won = data.groupby("player_name")["duels_won"].sum().to_dict()
-        pp_received = PlayerStats.progressive_pass_received(data)
+        stats = PlayerStats.aggregate(data)
+        goals = stats["goals"].to_dict()
+        xgs = stats["xg"].to_dict()
+        prog_distance = stats["prog_distance"].to_dict()
+        def_actions = stats["def_actions"].to_dict()
+        xa = stats["xa"].to_dict()
+        assists = stats["assists"].to_dict()
+        duels_won = stats["duels_won"].to_dict()
+        pp_received = stats["prog_pass_rev"].to_dict()
         bbox_props = dict(boxstyle="circle,pad=0.1", fc=team_color, ec=team_color, lw=0.5)
-        data["box_entry"] = open_play_box_entry(data)
-        box_entries = data.groupby("player_name")["box_entry"].sum().to_dict()
+        box_entries = stats["box_entries"].to_dict()
         for i, name in enumerate(names):
             if name in sub_ons["player_name"].values:
                 ax.scatter(
@@ -2062,13 +2017,7 @@ class PassNetworks:
         """
         This function aggregates the touches of each player
         """
-        data = (
-            data.groupby(["position"])
-            .agg({"x": "mean", "y": "mean", "player_name": "count"})
-            .reset_index()
-            .rename(columns={"player_name": "touches"})
-        )
-        return data
+        return aggregate_nodes(data, "position", count_column="player_name").reset_index()
 
     @staticmethod
     def aggregate_pass_pairs(data: pd.DataFrame) -> pd.DataFrame:
@@ -2076,27 +2025,10 @@ class PassNetworks:
         This function aggregates the pass pairs.  We will also filter out
         any incomplete passes. Finally we need to combine the pairs so that x->y and y->x are combined
         """
-        data = data[data["event_type"] == EventType.Pass]
-        data = data[data["is_successful"] == 1]
-
-        data = (
-            data.groupby(["position", "pass_receiver_position"])
-            .agg({"x": "count"})
-            .reset_index()
-            .rename(columns={"x": "passes"})
-        )
-        data["player_1_position"] = data.apply(
-            lambda x: min(x["position"], x["pass_receiver_position"]), axis=1
-        )
-        data["player_2_position"] = data.apply(
-            lambda x: max(x["position"], x["pass_receiver_position"]), axis=1
-        )
-        data = (
-            data.groupby(["player_1_position", "player_2_position"])
-            .agg({"passes": "sum"})
-            .reset_index()
+        data = data[(data["event_type"] == EventType.Pass) & (data["is_successful"] == 1)]
+        return aggregate_edges(data).rename(
+            columns={"player_1": "player_1_position", "player_2": "player_2_position"}
         )
-        return data
 
     @staticmethod
     def plot_average_positions(
@@ -2139,6 +2071,12 @@ class PassNetworks:
         visualisation_parameters: dict,
     ) -> None:
 
+        if visualisation_parameters.get("batched_drawing", True):
+            PassNetworks.plot_passing_lines_batched(
+                pass_data, player_location_data, pitch, ax, visualisation_parameters
+            )
+            return
+
         for _, row in pass_data.iterrows():
             if row["passes"] < visualisation_parameters["min_passes_to_show"]:
                 continue
@@ -2182,6 +2120,51 @@ class PassNetworks:
                 alpha=line_opacity,
             )
 
+    @staticmethod
+    def plot_passing_lines_batched(
+        pass_data: pd.DataFrame,
+        player_location_data: pd.DataFrame,
+        pitch: VerticalPitch,
+        ax: Axes,
+        visualisation_parameters: dict,
+    ) -> None:
+        """
+        Draw every passing line as a single LineCollection with per line widths and alphas
+        """
+        pass_data = pass_data[pass_data["passes"] >= visualisation_parameters["min_passes_to_show"]]
+        locations = player_location_data.set_index("position")
+        x_from = pass_data["player_1_position"].map(locations["x"])
+        y_from = pass_data["player_1_position"].map(locations["y"])
+        x_to = pass_data["player_2_position"].map(locations["x"])
+        y_to = pass_data["player_2_position"].map(locations["y"])
+        located = (x_from.notna() & x_to.notna()).to_numpy()
+        if not located.any():
+            return
+        scale = (
+            pass_data["passes"].to_numpy()[located] / visualisation_parameters["max_size_passes"]
+        )
+        line_widths = visualisation_parameters["min_line_width"] + scale * (
+            visualisation_parameters["max_line_width"] - visualisation_parameters["min_line_width"]
+        )
+        line_opacity = visualisation_parameters["min_pass_line_opacity"] + scale * (
+            visualisation_parameters["max_pass_line_opacity"]
+            - visualisation_parameters["min_pass_line_opacity"]
+        )
+        colors = np.tile(
+            mcolors.to_rgba(visualisation_parameters["pass_line_color"]), (len(scale), 1)
+        )
+        colors[:, 3] = np.clip(line_opacity, 0, 1)
+        pitch.lines(
+            x_from.to_numpy()[located],
+            y_from.to_numpy()[located],
+            x_to.to_numpy()[located],
+            y_to.to_numpy()[located],
+            lw=line_widths,
+            color=colors,
+            ax=ax,
+            zorder=2,
+        )
+
     @staticmethod
     def plot_pass_network(data, is_home, pitch, ax, visualisation_parameters):
         vis_parameters = visualisation_parameters.copy()
@@ -2218,7 +2201,7 @@ class PassNetworks:
             linewidth=1,
             line_alpha=0.5,
         )
-        small_pitch.draw(small_pitch_ax)
+        draw_pitch(small_pitch, small_pitch_ax, raster=visualisation_parameters["raster_pitches"])
         positionslist = small_pitch.get_formation(formation)
 
         for position in positionslist:
@@ -2234,7 +2217,7 @@ class PassNetworks:
             line_zorder=1,
             linewidth=1,
         )
-        pitch_left.draw(axes["left_pn"])
+        draw_pitch(pitch_left, axes["left_pn"], raster=visualisation_parameters["raster_pitches"])
         pitch_right = VerticalPitch(
             pitch_type="opta",
             pitch_color=visualisation_parameters["facecolor"],
@@ -2242,7 +2225,7 @@ class PassNetworks:
             line_zorder=1,
             linewidth=1,
         )
-        pitch_right.draw(axes["right_pn"])
+        draw_pitch(pitch_right, axes["right_pn"], raster=visualisation_parameters["raster_pitches"])
         PassNetworks.plot_pass_network(
             data, True, pitch_left, axes["left_pn"], visualisation_parameters
         )
@@ -2251,10 +2234,48 @@ class PassNetworks:
         )
 
 
-def create_dashboard(conn, match_id):
-    data = get_dataframe_for_match(match_id, conn)
+def load_match_events(conn, match_id, event_store: EventStore = None) -> pd.DataFrame:
+    """
+    Loads the events of a match, from the local event store when it holds the match and
+    from the database otherwise, storing the result for later renders.  Matches with
+    columns the store can't hold, eg qualifier dicts, are used straight from the database.
+
+    Args:
+        conn (Connection): Database connection
+        match_id (int): Id of the match
+        event_store (EventStore, optional): Local store of match events
+
+    Returns:
+        pd.DataFrame: Events of the match with EventType members in event_type
+    """
+    if event_store is None or match_id not in event_store:
+        data = get_dataframe_for_match(match_id, conn)
+        if event_store is None:
+            data["event_type"] = convert_event_types(data["event_type"], EventType)
+            return data
+        try:
+            event_store.write(match_id, data)
+        except ValueError:
+            data["event_type"] = convert_event_types(data["event_type"], EventType)
+            return data
+    # the report modifies its data in place and groups by names, so read a writable copy
+    # with plain string columns
+    data = event_store.read(match_id, copy=True, categories=False)
+    data["event_type"] = convert_event_types(data["event_type"], EventType)
+    return data
+
+
+def create_dashboard(
+    conn, match_id, event_store: EventStore = None, use_copy_on_write: bool = False
+):
+    # the footballmodels helpers haven't been checked for chained assignment, which is a
+    # no-op under copy-on-write, so it is opt-in
+    with copy_on_write() if use_copy_on_write else nullcontext():
+        return _create_dashboard(conn, match_id, event_store)
+
 
-    data["event_type"] = data["event_type"].apply(lambda x: EventType(x.value))
+def _create_dashboard(conn, match_id, event_store: EventStore = None):
+    data = load_match_events(conn, match_id, event_store)
     league = data["competition"].values[0]
     match_data = generate_match_stats(data)
     context_data = get_match_stat_history(league, conn)
@@ -1,5 +1,6 @@
 from mplsoccer.pitch import VerticalPitch
-from typing import Dict
+from typing import Dict, Tuple
+import numpy as np
 import pandas as pd
 from footballdashboards._types._custom_types import PlotReturnType
 from footballdashboards.dashboard.dashboard import Dashboard
@@ -14,7 +15,6 @@ import cmasher as cmr
 from matplotlib.colorbar import Colorbar
 from matplotlib.colors import Normalize
 from footballdashboards.helpers.matplotlib import get_aspect
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
 from footballdashboards.helpers.fonts import (
     font_bold,
     font_normal,
@@ -32,6 +32,8 @@ from mpltable import Table
 from footballdashboards.helpers import utils
 from footballdashboards.helpers import formatters
 from footballdashboards.helpers.data_helpers import lineup_card
+from footballdashboards.helpers.pass_networks import aggregate_edges, aggregate_nodes
+from footballdashboards.helpers.pitch_backgrounds import draw_pitch
 from footballdashboards.helpers.mclachbot_helpers import get_ball_logo2
 from matplotlib.patches import FancyBboxPatch
 
@@ -41,6 +43,11 @@ class PassNetworkDashboard(Dashboard):
     linecolor = ColorField("Color of the pitch lines", default="#000000")
     secondary_textcolor = ColorField("Secondary text color", default="#666666")
     min_pass_to_show = DashboardField("Minimum number of passes to show", default=5)
+    batched_drawing = DashboardField(
+        "Draw all nodes as one scatter and all edges as one line collection. "
+        "Set to False for one artist per node and edge",
+        default=True,
+    )
     MINSIZE = 200
     MAXSIZE = 1000
     MAX_TOUCH_QTY = 150
@@ -121,7 +128,7 @@ class PassNetworkDashboard(Dashboard):
             linewidth=1,
             line_alpha=0.5,
         )
-        pitch.draw(ax=ax)
+        draw_pitch(pitch, ax, raster=self.raster_pitches)
         #logo_ax = pitch.inset_axes(6, 6 / 65 * 105, 11, 11 / 65 * 105, ax=ax, zorder=200)
         #logo_ax.axis("off")
         #logo_ax.imshow(get_ball_logo2())
@@ -132,21 +139,33 @@ class PassNetworkDashboard(Dashboard):
     def _plot_touches(
         self, pitch: VerticalPitch, data: pd.DataFrame, ax: Axes, colors: Collection[str]
     ):
-        data["size"] = data["count"].apply(
-            lambda x: self.MINSIZE + (x / self.MAX_TOUCH_QTY) * (self.MAXSIZE - self.MINSIZE)
+        data["size"] = self.MINSIZE + (data["count"] / self.MAX_TOUCH_QTY) * (
+            self.MAXSIZE - self.MINSIZE
         )
-
-        for i, row in data.iterrows():
+        if self.batched_drawing:
             pitch.scatter(
-                row["x"],
-                row["y"],
+                data["x"],
+                data["y"],
                 ax=ax,
-                s=row["size"],
+                s=data["size"],
                 color=colors[0],
                 zorder=11,
                 ec=self.linecolor,
                 lw=1,
             )
+
+        for i, row in data.iterrows():
+            if not self.batched_drawing:
+                pitch.scatter(
+                    row["x"],
+                    row["y"],
+                    ax=ax,
+                    s=row["size"],
+                    color=colors[0],
+                    zorder=11,
+                    ec=self.linecolor,
+                    lw=1,
+                )
             if i in ["RCDM", "LCDM", "RCAM", "LCAM"]:
                 i = i.replace("C", "")
             pitch.annotate(
@@ -160,24 +179,41 @@ class PassNetworkDashboard(Dashboard):
                 zorder=11,
             )
 
+    def _pass_line_styles(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        counts = data["count"].to_numpy()
+        line_widths = np.where(
+            counts > self.MAX_PASS_QTY,
+            self.MAX_PASS_SIZE,
+            0.5 + counts / self.MAX_PASS_QTY * (self.MAX_PASS_SIZE - 0.5),
+        )
+        cmap = cmr.get_sub_cmap("cool", 0.3, 1)
+        colors = cmap(np.clip(data["xT"].to_numpy(), 0, self.MAX_PASS_XT) / self.MAX_PASS_XT)
+        return line_widths, np.atleast_2d(colors)
+
     def _plot_pass_pairings(self, pitch: VerticalPitch, data: pd.DataFrame, ax: Axes):
-        for i, row in data.iterrows():
-            line = row
-            lw = (
-                self.MAX_PASS_SIZE
-                if row["count"] > self.MAX_PASS_QTY
-                else 0.5 + row["count"] / self.MAX_PASS_QTY * (self.MAX_PASS_SIZE - 0.5)
+        if data.empty:
+            return
+        line_widths, colors = self._pass_line_styles(data)
+        if self.batched_drawing:
+            colors[:, 3] = 0.8
+            pitch.lines(
+                data["x_from"],
+                data["y_from"],
+                data["x_to"],
+                data["y_to"],
+                ax=ax,
+                lw=line_widths,
+                zorder=1,
+                color=colors,
             )
-            xt = max(min(row["xT"], self.MAX_PASS_XT), 0)
-            cmap = cmr.get_sub_cmap("cool", 0.3, 1)
-            color = xt / self.MAX_PASS_XT
-            color = cmap(color)
+            return
 
+        for (_, row), lw, color in zip(data.iterrows(), line_widths, colors):
             pitch.lines(
-                line["x_from"],
-                line["y_from"],
-                line["x_to"],
-                line["y_to"],
+                row["x_from"],
+                row["y_from"],
+                row["x_to"],
+                row["y_to"],
                 ax=ax,
                 lw=lw,
                 zorder=1,
@@ -320,12 +356,12 @@ class PassNetworkDashboard(Dashboard):
         )
         team_ax = ax.inset_axes((0.02, 0.04, aspect * 0.92, 0.92), zorder=200)
         team_ax.axis("off")
-        team_ax.imshow(McLachBotBadgeService().team_badge(league, team))
+        team_ax.imshow(self.badge_service.team_badge(league, team))
         opponent_ax = ax.inset_axes(
             (1 - 0.02 - aspect * 0.92, 0.04, aspect * 0.92, 0.92), zorder=200
         )
         opponent_ax.axis("off")
-        opponent_ax.imshow(McLachBotBadgeService().team_badge(league, opponent))
+        opponent_ax.imshow(self.badge_service.team_badge(league, opponent))
         # Add the rounded bbox patch to the axes
         ax.add_patch(rounded_bbox)
 
@@ -379,7 +415,7 @@ class PassNetworkDashboard(Dashboard):
             linewidth=1,
             line_alpha=0.5,
         )
-        small_pitch.draw(small_pitch_ax)
+        draw_pitch(small_pitch, small_pitch_ax, raster=self.raster_pitches)
         positionslist = small_pitch.get_formation(formation)
         try:
             color = TeamColorHelper().get_colours(league, team)[0]
@@ -449,34 +485,23 @@ class PassNetworkDashboard(Dashboard):
 
     def _get_average_touch_positions_and_count(self, data: pd.DataFrame, aggregation_variable: str):
         data = self._get_touch_events(data)
-        return (
-            data.groupby(aggregation_variable)
-            .agg({"x": "mean", "y": "mean", "id": "count"})
-            .rename(columns={"id": "count"})
+        return aggregate_nodes(data, aggregation_variable, count_column="id").rename(
+            columns={"touches": "count"}
         )
 
     def _get_pass_pairings(self, data: pd.DataFrame, aggregation_variable: str):
-        data = data[
-            (data["event_type"] == EventType.Pass)
-            & (data["outcomeType"] == 1)
-            & (~data["pass_receiver_position"].isna())
-            & (~data["position"].isna())
-        ].copy()
-
-        if aggregation_variable == "position":
-            for i, r in data.iterrows():
-                if r["position"] > r["pass_receiver_position"]:
-                    data.loc[i, "A"] = r["position"]
-                    data.loc[i, "B"] = r["pass_receiver_position"]
-                else:
-                    data.loc[i, "B"] = r["position"]
-                    data.loc[i, "A"] = r["pass_receiver_position"]
-            pass_pairings = (
-                data.groupby(["A", "B"])
-                .agg({"id": "count", "xT": "mean"})
-                .rename(columns={"id": "count"})
+        data = data[(data["event_type"] == EventType.Pass) & (data["outcomeType"] == 1)]
+        pass_pairings = (
+            aggregate_edges(
+                data,
+                source=aggregation_variable,
+                target=f"pass_receiver_{aggregation_variable}",
+                value_column="xT",
             )
-
+            .rename(columns={"player_2": "A", "player_1": "B", "passes": "count"})
+            .set_index(["A", "B"])
+            .sort_index()
+        )
         pass_pairings = pass_pairings[pass_pairings["count"] >= self.min_pass_to_show]
 
         return pass_pairings
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, List
 from mplsoccer import add_image
 from matplotlib.cm import get_cmap
 from mplsoccer.py_pizza import PyPizza
@@ -19,9 +19,12 @@ from footballdashboards._types._dashboard_fields import (
 from footballdashboards.helpers.fonts import font_normal, font_bold, font_italic
 from footballdashboards.helpers.formatters import full_name_formatter
 from footballdashboards.helpers.matplotlib import get_aspect
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService, get_ball_logo
-from urllib.request import urlopen
-from PIL import Image
+from footballdashboards.helpers.mclachbot_helpers import (
+    get_ball_logo,
+    get_image,
+    image_asset,
+)
+from footballdashboards.helpers.image_cache import ImageAsset
 from highlight_text import ax_text
 from footballdashboards.helpers.utils import is_high_luminance
 
@@ -48,6 +51,18 @@ class PizzaDashboard(Dashboard):
     def datasource_name(self) -> str:
         return self.data_name
 
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        assets = []
+        if data["image_team"].values[0] is not None:
+            assets.append(
+                self.badge_service.team_badge_asset(
+                    data["image_league"].values[0], data["image_team"].values[0]
+                )
+            )
+        if self.center_logo_url:
+            assets.append(image_asset(self.center_logo_url))
+        return assets
+
     def _setup_figure(self):
         fig = Figure(figsize=self.fig_size, dpi=100, facecolor=self.facecolor)
         axes = {}
@@ -155,7 +170,7 @@ class PizzaDashboard(Dashboard):
         )
         if data["image_team"].values[0] is not None:
             try:
-                badge_image = McLachBotBadgeService().team_badge(
+                badge_image = self.badge_service.team_badge(
                     data["image_league"].values[0], data["image_team"].values[0]
                 )
 
@@ -277,7 +292,7 @@ class PizzaDashboard(Dashboard):
         )
         if self.center_logo_url:
             try:
-                img = Image.open(urlopen(self.center_logo_url))
+                img = get_image(self.center_logo_url, self.badge_service.cache)
                 ax_insert = ax.inset_axes((0.46, 0.46, 0.08, 0.08), zorder=0)
                 ax_insert.axis("off")
 
@@ -374,7 +389,7 @@ class TeamPizzaDashboard(Dashboard):
 
         if data["Team"].values[0] is not None:
             try:
-                badge_image = McLachBotBadgeService().team_badge(
+                badge_image = self.badge_service.team_badge(
                     data["Competition"].values[0], data["Team"].values[0]
                 )
 
@@ -386,7 +401,7 @@ class TeamPizzaDashboard(Dashboard):
                 pass
         if data["Competition"].values[0] is not None:
             try:
-                badge_image = McLachBotBadgeService().league_badge(data["Competition"].values[0])
+                badge_image = self.badge_service.league_badge(data["Competition"].values[0])
 
                 inset_ax = ax.inset_axes(
                     (1.08 - get_aspect(ax) * 0.8, 0.2, get_aspect(ax) * 0.8, 0.8)
@@ -516,7 +531,7 @@ class TeamPizzaDashboard(Dashboard):
         )
         if self.center_logo_url:
             try:
-                img = Image.open(urlopen(self.center_logo_url))
+                img = get_image(self.center_logo_url, self.badge_service.cache)
                 ax_insert = ax.inset_axes((0.46, 0.46, 0.08, 0.08), zorder=0)
                 ax_insert.axis("off")
 
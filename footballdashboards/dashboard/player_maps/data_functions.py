@@ -1,30 +1,11 @@
 import pandas as pd
-import datetime as dt
 from typing import Dict, Any
 from footballmodels.opta.event_type import EventType
 from dbconnect.connector import Connection
-from functools import wraps
-from hashlib import sha256
+from footballdashboards.helpers.timed_cache import TimedCache
 
-class TimedCache:
-    def __init__(self, timeout: int):
-        self.cache = {}
-        self.timeout = timeout
 
-    def __call__(self, func):
-        @wraps(func)
-        def wrapper(config: Dict[str, Any]):
-            key = sha256(str(config).encode()).hexdigest()
-            if key in self.cache:
-                if dt.datetime.now() - self.cache[key]["time"] < dt.timedelta(seconds=self.timeout):
-                    return self.cache[key]["data"]
-            data = func(config)
-            self.cache[key] = {"data": data, "time": dt.datetime.now()}
-            return data
-
-        return wrapper
-
-@TimedCache(60*5)
+@TimedCache(60 * 5, max_entries=64, max_bytes=512 * 1024 * 1024)
 def get_player_pass_data(config: Dict[str, Any]) -> pd.DataFrame:
     comp_str = ",".join(f"'{s}'" for s in config["competitions"])
     team = config["team"]
@@ -5,13 +5,14 @@ from matplotlib.axes import Axes
 from mplsoccer.pitch import Pitch
 from footmav.data_definitions.whoscored.constants import EventType as EventTypeOld
 from footmav.utils import whoscored_funcs as WF
+from footballdashboards.helpers.copy_on_write import lazy_copy
 
 def fwd_passes(data:pd.DataFrame, _)->pd.DataFrame:
     return data[data['endX']>=data['x']]
 
 
 def __pass_type_mask(data:pd.DataFrame, pass_type:int)->pd.Series:
-    data=data.copy()    
+    data=lazy_copy(data)
     data["event_type"] = EventTypeOld.Pass
     data["passtypes"] = WF.classify_passes(data)
     if pass_type == 0:
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pandas as pd
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
@@ -19,8 +19,15 @@ from scipy.ndimage import rotate
 from footballdashboards.dashboard.player_maps.filter_applicator import apply_filters
 
 def draw_title(
-    config: Dict[str, Any], data: pd.DataFrame, fig: Figure, axes: Axes, pitch: Pitch, filters: List[str]
+    config: Dict[str, Any],
+    data: pd.DataFrame,
+    fig: Figure,
+    axes: Axes,
+    pitch: Pitch,
+    filters: List[str],
+    badge_service: Optional[McLachBotBadgeService] = None,
 ) -> Axes:
+    badge_service = badge_service or McLachBotBadgeService()
 
     def _draw_subheader(
         minutes: str,
@@ -73,7 +80,9 @@ def draw_title(
         aspect = get_aspect(ax)
         insert_ax = ax.inset_axes([1 - aspect - 0.04, 0, aspect, 1])
         insert_ax.axis("off")
-        img = CachedPlayerImageHelper(None).get_player_image(player_id, ws=True)
+        img = CachedPlayerImageHelper(None, cache=badge_service.cache).get_player_image(
+            player_id, ws=True
+        )
         if img is None:
             return
         img = np.array(list(img.convert("RGBA").getdata())).reshape(img.height, img.width, 4)
@@ -87,7 +96,7 @@ def draw_title(
         insert_ax.imshow(img, alpha=1)
 
     def _place_team_logo(team: str, league, ax: Axes, fig: Figure):
-        img = McLachBotBadgeService().team_badge(league, team)
+        img = badge_service.team_badge(league, team)
         img = np.array(list(img.convert("RGBA").getdata())).reshape(img.height, img.width, 4)
         rotated_img = rotate(img, 10, reshape=True)
         rotated_img = rotated_img[
@@ -2,6 +2,7 @@ from typing import Dict, Any
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 from mplsoccer.pitch import Pitch, VerticalPitch
+from footballdashboards.helpers.pitch_backgrounds import draw_pitch
 from footballdashboards.dashboard.player_maps.plot_builder import GraphicComponents
 
 def full_pitch_layout(config:Dict[str, Any])->GraphicComponents:
@@ -26,6 +27,6 @@ def full_pitch_layout(config:Dict[str, Any])->GraphicComponents:
         ax.set_xlim(0,1)
         ax.set_ylim(0,1)
     pitch = VerticalPitch(pitch_type="opta", pitch_color=config['pitch_color'], line_color=config['line_color'], linewidth=1)
-    pitch.draw(ax=axes['pitch'])
     fig.subplots_adjust(left=0, right=1, top=1, bottom=0, wspace=0, hspace=0)
+    draw_pitch(pitch, axes['pitch'])
     return GraphicComponents(fig, axes, {"pitch": pitch})
@@ -16,9 +16,12 @@ from typing import Dict
 from footballdashboards._types._custom_types import PlotReturnType
 from mplsoccer import Pitch
 from footballdashboards._types._dashboard_fields import ColorField
-from footballdashboards.helpers.mplsoccer_helpers import make_grid
+from footballdashboards.helpers.mplsoccer_helpers import make_grid_template
 from footmav.data_definitions.whoscored.constants import EventType
-from footballdashboards.helpers.data_helpers import extract_names_sorted_by_position
+from footballdashboards.helpers.data_helpers import (
+    extract_names_sorted_by_position,
+    split_by_player,
+)
 from footballdashboards.helpers.fonts import font_normal
 from footmav.utils import whoscored_funcs as WF
 from footballdashboards.helpers.formatters import length_based_name_formatter
@@ -56,7 +59,7 @@ class MatchDashboard(Dashboard):
         return pitch
 
     def _setup_figure(self, pitch) -> PlotReturnType:
-        fig, axes = make_grid(
+        fig, axes = make_grid_template(
             pitch,
             nrows=self.GRID_NROWS,
             ncols=self.GRID_NCOLS,
@@ -108,6 +111,7 @@ class MatchDashboard(Dashboard):
             self.facecolor,
             self.secondary_textcolor,
             home_away,
+            badge_service=self.badge_service,
         )
 
     def _plot_watermark(self, ax: Axes):
@@ -200,11 +204,12 @@ class PlayerMatchPassingDashboard(MatchDashboard):
 
     def _plot_pitches(self, data: pd.DataFrame, pitch: Pitch, axes: Dict[str, Axes]) -> None:
         names = extract_names_sorted_by_position(data)
+        players = split_by_player(data)
 
         for i, name in enumerate(names):
             r_i = int(math.floor(i / 3))
             r_j = i % 3
-            player_data = data[data["player_name"] == name].copy()
+            player_data = players.get(name, data.iloc[:0]).copy()
             draw_passes_on_axes(axes["pitch"][(r_i, r_j)], player_data, pitch)
             self._player_name_and_info(axes["pitch"][(r_i, r_j)], player_data, self.linecolor)
 
@@ -318,6 +323,7 @@ class PlayerMatchDefensiveDashboard(MatchDashboard):
     def _plot_pitches(self, data, pitch, ax):
         data = data[data["event_type"] != EventType.Card]
         names = extract_names_sorted_by_position(data, exclude_positions=["GK"])
+        players = split_by_player(data)
         draw_defensive_event_legend(
             ax["endnote"],
             self.markercolor,
@@ -334,9 +340,10 @@ class PlayerMatchDefensiveDashboard(MatchDashboard):
             r_j = i % self.GRID_NCOLS
 
             if name:
+                player_data = players.get(name, data.iloc[:0])
                 draw_defensive_events_on_axes(
                     ax["pitch"][(r_i, r_j)],
-                    data.loc[data["player_name"] == name],
+                    player_data,
                     pitch,
                     25,
                     self.markercolor,
@@ -344,12 +351,12 @@ class PlayerMatchDefensiveDashboard(MatchDashboard):
                 )
                 draw_convex_hull_without_outliers_on_axes(
                     ax["pitch"][(r_i, r_j)],
-                    data.loc[data["player_name"] == name],
+                    player_data,
                     pitch,
                     0.1,
                 )
                 self._player_name_and_info(
                     ax["pitch"][(r_i, r_j)],
-                    data.loc[data["player_name"] == name],
+                    player_data,
                     self.linecolor,
                 )
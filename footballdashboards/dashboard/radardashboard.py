@@ -12,12 +12,14 @@ from footballdashboards.helpers.fonts import font_normal, font_bold, font_italic
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 from mplsoccer import Radar
-from urllib.request import urlopen
-from PIL import Image
 import numpy as np
 from footballdashboards.helpers.formatters import smart_name_formatter, full_name_formatter
 from footballdashboards.helpers.matplotlib import get_aspect
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
+from footballdashboards.helpers.mclachbot_helpers import (
+    get_image,
+    image_asset,
+)
+from footballdashboards.helpers.image_cache import ImageAsset
 
 
 class ColorListField(DashboardField):
@@ -55,6 +57,15 @@ class RadarDashboard(Dashboard):
     def datasource_name(self) -> str:
         return self.data_name
 
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        assets = [
+            self.badge_service.team_badge_asset(league, team)
+            for league, team in zip(data["image_league"].iloc[:2], data["image_team"].iloc[:2])
+        ]
+        if self.center_logo_url:
+            assets.append(image_asset(self.center_logo_url))
+        return assets
+
     def _required_data_columns(self) -> Dict[str, str]:
         return {
             "Player": "Player Name",
@@ -129,12 +140,12 @@ class RadarDashboard(Dashboard):
         ax_left_inset = ax.inset_axes([0, 0, get_aspect(ax), 1])
         ax_left_inset.axis("off")
         ax_left_inset.imshow(
-            McLachBotBadgeService().team_badge(image_league_1, image_name_1),
+            self.badge_service.team_badge(image_league_1, image_name_1),
         )
         ax_right_inset = ax.inset_axes([1 - get_aspect(ax), 0, get_aspect(ax), 1])
         ax_right_inset.axis("off")
         ax_right_inset.imshow(
-            McLachBotBadgeService().team_badge(image_league_2, image_name_2),
+            self.badge_service.team_badge(image_league_2, image_name_2),
         )
         ax.text(
             0.5,
@@ -298,7 +309,7 @@ class RadarDashboard(Dashboard):
 
         if self.center_logo_url:
             try:
-                img = Image.open(urlopen(self.center_logo_url))
+                img = get_image(self.center_logo_url, self.badge_service.cache)
                 ax_insert = ax.inset_axes((0.44, 0.44, 0.12, 0.12), zorder=20)
                 ax_insert.axis("off")
 
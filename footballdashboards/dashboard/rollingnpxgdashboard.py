@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 import pandas as pd
 from footballdashboards.dashboard.dashboard import Dashboard
 from footballdashboards._types._custom_types import PlotReturnType
@@ -6,11 +6,14 @@ from footballdashboards._types._dashboard_fields import FigSizeField, ColorField
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 from footballdashboards.helpers.fonts import font_normal, font_bold, font_italic
-from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService, get_ball_logo
+from footballdashboards.helpers.mclachbot_helpers import (
+    get_ball_logo,
+    get_image,
+    image_asset,
+)
+from footballdashboards.helpers.image_cache import ImageAsset
 from footballdashboards.helpers.matplotlib import get_aspect
 import numpy as np
-from urllib.request import urlopen
-from PIL import Image
 
 
 
@@ -46,6 +49,20 @@ class RollingNPxGDashboardBase(Dashboard):
             "team_img": "name of the team to use in sportsdb service to retrieve team logo",
         }
 
+    def _required_assets(self, data: pd.DataFrame) -> List[ImageAsset]:
+        league = data["league"].iloc[0]
+        assets = [
+            self.badge_service.team_badge_asset(league, data["team_img"].iloc[0]),
+            self.badge_service.league_badge_asset(league),
+        ]
+        assets.extend(
+            self.badge_service.team_badge_asset(league, opp_name)
+            for opp_name in data["opponent"].unique()
+        )
+        if self.watermark_image:
+            assets.append(image_asset(self.watermark_image))
+        return assets
+
     def _setup_figure(self):
         fig = Figure(figsize=self.fig_size, dpi=100, facecolor=self.facecolor)
         axes = fig.subplot_mosaic(
@@ -88,7 +105,7 @@ class RollingNPxGDashboardBase(Dashboard):
                 transform=ax.transData,
             )
             try:
-                ax_1.imshow(McLachBotBadgeService().team_badge(league, opp_name))
+                ax_1.imshow(self.badge_service.team_badge(league, opp_name))
             except:
                 ax_1.text(
                     0.5,
@@ -158,13 +175,13 @@ class RollingNPxGDashboardBase(Dashboard):
         team_logo_axis = ax.inset_axes(
             (0.0, 0.1, 0.8 * get_aspect(ax), 0.8), transform=ax.transAxes
         )
-        team_logo_axis.imshow(McLachBotBadgeService().team_badge(league, team_img))
+        team_logo_axis.imshow(self.badge_service.team_badge(league, team_img))
         team_logo_axis.axis("off")
 
         league_logo_axis = ax.inset_axes(
             (1.0 - get_aspect(ax) * 0.8, 0.1, 0.8 * get_aspect(ax), 0.8), transform=ax.transAxes
         )
-        league_logo_axis.imshow(McLachBotBadgeService().league_badge(league))
+        league_logo_axis.imshow(self.badge_service.league_badge(league))
         league_logo_axis.axis("off")
         title = f"{team} - Rolling NPxG For and Against"
         ax.text(
@@ -216,7 +233,7 @@ class RollingNPxGDashboardBase(Dashboard):
 
                 ratio = ax.transAxes.transform((1, 1))[1] / ax.transAxes.transform((1, 1))[0]
 
-                image = Image.open(urlopen(self.watermark_image))
+                image = get_image(self.watermark_image, self.badge_service.cache)
                 water_mark_ax = ax.inset_axes(
                     (1.0 - 0.05 * ratio - 0.005, 1 - 0.055, 0.05 * ratio, 0.05),
                     transform=ax.transAxes,
@@ -3,14 +3,19 @@ import numpy as np
 from pandas import DataFrame
 from footballdashboards._types._custom_types import PlotReturnType
 from footballdashboards.dashboard.dashboard import Dashboard
-from footballdashboards._types._dashboard_fields import FigSizeField, ColorMapField, ColorField
+from footballdashboards._types._dashboard_fields import (
+    FigSizeField,
+    ColorMapField,
+    ColorField,
+    DashboardField,
+)
 from footballdashboards.helpers.mclachbot_helpers import get_ball_logo2
 from footballdashboards.helpers.matplotlib import get_aspect
+from footballdashboards.helpers.label_placement import place_labels
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 from matplotlib.axes import Axes
 import cmasher as cmr
-from adjustText import adjust_text
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from scipy.interpolate import interp1d
 from footballdashboards.helpers.fonts import (
@@ -68,6 +73,16 @@ class ScatterDashboard(Dashboard):
     color_map = ColorMapField("color_map", default="viridis")
     categorical_color_map = ColorMapField("categorical_color_map", default="Dark2")
     default_color = ColorField("default_color", default="blue")
+    label_placement = DashboardField(
+        "Label placement, 'greedy' (fast, the default) or 'adjust_text' (slower, higher "
+        "quality, the placement used before greedy became the default)",
+        default="greedy",
+    )
+    label_time_budget = DashboardField(
+        "Seconds to spend placing labels. Defaults to the limit of the placer, 0.25 for "
+        "greedy and adjustText's own 1 second for adjust_text",
+        default=None,
+    )
     min_size = 10
     max_size = 100
     default_size = 50
@@ -274,18 +289,17 @@ class ScatterDashboard(Dashboard):
                     zorder=30,
                 )
             )
-        adjust_text(
+        options = {}
+        if self.label_time_budget is not None:
+            options["time_budget"] = self.label_time_budget
+        place_labels(
+            self.label_placement,
+            ax,
             texts,
-            ax=ax,
             objects=scatter,
-            only_move={"text": "xy"},
-            # force_text=(5,5),
-            # force_static=(5,5),
-            # force_explode=(0.2,1),
-            ensure_inside_axes=True,
-            avoid_self=True,
             arrowprops=dict(arrowstyle="simple", color="orange", lw=1),
             zorder=29,
+            **options,
         )
 
     def _draw_scatter(self, data: DataFrame, ax: Axes, fig: Figure, footer_ax: Axes):
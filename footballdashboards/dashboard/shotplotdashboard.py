@@ -5,7 +5,7 @@ from mplsoccer.pitch import VerticalPitch
 from footballdashboards.dashboard.dashboard import Dashboard
 from footballdashboards._types._custom_types import PlotReturnType
 from footballdashboards._types._dashboard_fields import ColorField, DashboardField
-from footballdashboards.helpers.mplsoccer_helpers import make_grid
+from footballdashboards.helpers.mplsoccer_helpers import make_grid_template
 from footballdashboards.dashboard._data_mixins import PlayerSeasonsLeaguesMixin
 
 
@@ -49,6 +49,21 @@ class ShotPlotDashboard(PlayerSeasonsLeaguesMixin, Dashboard):
             "big_chance": "Whether the shot was a big chance",
         }
 
+    def _optional_data_columns(self) -> Dict[str, str]:
+        return {}
+
+    def _column_dtypes(self) -> Dict[str, str]:
+        return {
+            "player": "category",
+            "season": "category",
+            "league": "category",
+            "x": "float32",
+            "y": "float32",
+            "result": "int8",
+            "assisting_player": "category",
+            "big_chance": "int8",
+        }
+
     def _setup_pitch(self) -> VerticalPitch:
         pitch = VerticalPitch(
             pitch_type="opta", half=True, pitch_color=self.pitch_color, line_color=self.line_color
@@ -56,9 +71,9 @@ class ShotPlotDashboard(PlayerSeasonsLeaguesMixin, Dashboard):
         return pitch
 
     def _setup_figure(self, pitch: VerticalPitch) -> PlotReturnType:
-        fig, axes = make_grid(
+        fig, axes = make_grid_template(
             pitch,
-            self.fig_height,
+            figheight=self.fig_height,
             endnote_height=0.05,
             title_height=0.05,
             title_space=0,
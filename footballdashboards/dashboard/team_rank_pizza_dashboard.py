@@ -8,7 +8,7 @@ from mplsoccer import Radar
 import numpy as np
 from footballdashboards.helpers.fonts import font_normal, font_europa
 from footballdashboards._types._dashboard_fields import ColorField, ColorListField
-from footballdashboards.helpers.mclachbot_helpers import get_ball_logo, McLachBotBadgeService
+from footballdashboards.helpers.mclachbot_helpers import get_ball_logo
 from matplotlib.colors import to_rgba
 from footballdashboards.helpers.matplotlib import get_aspect
 from matplotlib.patches import Rectangle
@@ -103,7 +103,7 @@ class TeamRankRadarDashboard(Dashboard):
 
             logo_axis.axis("off")
             try:
-                badge = McLachBotBadgeService().team_badge(r["competition"], r["team_name"])
+                badge = self.badge_service.team_badge(r["competition"], r["team_name"])
                 logo_axis.imshow(badge, zorder=1, alpha=0.8)
             except Exception as exc:
                 print(exc)
@@ -1,7 +1,7 @@
 """
 Functions for styling various headers on a given axis.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from matplotlib.axes import Axes
 from footballdashboards.helpers.fonts import font_bold, font_italic
 from matplotlib.patches import FancyBboxPatch
@@ -55,7 +55,11 @@ def match_dashboard_header(
     facecolor: str,
     sublabel_color: str,
     home_away: str = None,
+    badge_service: Optional[McLachBotBadgeService] = None,
 ):
+    # dashboards pass their own badge service so that the badges come from the cache they
+    # prefetched into
+    badge_service = badge_service or McLachBotBadgeService()
     aspect = get_aspect(ax)
     ax.set_xlim(0, 1)
     y_max = 1 * aspect
@@ -159,9 +163,9 @@ def match_dashboard_header(
         )
     team_ax = ax.inset_axes((0.02, 0.04, aspect * 0.92, 0.92), zorder=200)
     team_ax.axis("off")
-    team_ax.imshow(McLachBotBadgeService().team_badge(league, team_image_names[0]))
+    team_ax.imshow(badge_service.team_badge(league, team_image_names[0]))
     opponent_ax = ax.inset_axes((1 - 0.02 - aspect * 0.92, 0.04, aspect * 0.92, 0.92), zorder=200)
     opponent_ax.axis("off")
-    opponent_ax.imshow(McLachBotBadgeService().team_badge(league, team_image_names[1]))
+    opponent_ax.imshow(badge_service.team_badge(league, team_image_names[1]))
     # Add the rounded bbox patch to the axes
     ax.add_patch(rounded_bbox)
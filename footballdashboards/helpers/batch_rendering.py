@@ -0,0 +1,146 @@
+"""
+Render many copies of one dashboard across a pool of worker processes.
+
+matplotlib drawing is CPU bound and holds the GIL, so rendering hundreds of pizzas or
+radars in a loop only ever uses one core.  Each worker process here imports matplotlib
+and the bundled fonts once, builds its own dashboard instance, and sends back the
+encoded image bytes rather than the figure, which keeps the data crossing process
+boundaries small.
+"""
+
+import importlib
+import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Set, Type
+
+import matplotlib
+
+_WORKER_DASHBOARD = None
+
+
+class RenderResult(NamedTuple):
+    """
+    Outcome of rendering one set of plot kwargs.  Exactly one of content and error is set.
+    Errors are reported as the repr of the exception and its formatted traceback, as not
+    every exception can be sent back from a worker process.
+    """
+
+    index: int
+    kwargs: Dict[str, Any]
+    content: Optional[bytes]
+    error: Optional[str]
+    traceback: Optional[str] = None
+
+
+def _build_dashboard(
+    dashboard_cls: Type, dashboard_args: Sequence[Any], field_overrides: Dict[str, Any]
+):
+    dashboard = dashboard_cls(*dashboard_args)
+    for name, value in field_overrides.items():
+        if not hasattr(dashboard, name):
+            raise ValueError(f"{dashboard_cls.__name__} has no field {name}")
+        setattr(dashboard, name, value)
+    return dashboard
+
+
+def _init_worker(
+    dashboard_cls: Type, dashboard_args: Sequence[Any], field_overrides: Dict[str, Any]
+):
+    # pylint: disable=global-statement
+    global _WORKER_DASHBOARD
+    matplotlib.use("Agg")
+    # registers the bundled fonts once per worker
+    importlib.import_module("footballdashboards.helpers.fonts")
+
+    _WORKER_DASHBOARD = _build_dashboard(dashboard_cls, dashboard_args, field_overrides)
+
+
+def _render(
+    dashboard, index: int, kwargs: Dict[str, Any], fmt: str, dpi: Optional[float]
+) -> RenderResult:
+    try:
+        return RenderResult(index, kwargs, dashboard.render(fmt=fmt, dpi=dpi, **kwargs), None)
+    except Exception as exc:  # pylint: disable=broad-except
+        return RenderResult(index, kwargs, None, repr(exc), traceback.format_exc())
+
+
+def _render_in_worker(
+    index: int, kwargs: Dict[str, Any], fmt: str, dpi: Optional[float]
+) -> RenderResult:
+    return _render(_WORKER_DASHBOARD, index, kwargs, fmt, dpi)
+
+
+def render_batch(
+    dashboard_cls: Type,
+    field_overrides: Optional[Dict[str, Any]],
+    list_of_kwargs: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    dashboard_args: Sequence[Any] = (),
+    fmt: str = "png",
+    dpi: Optional[float] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[RenderResult]:
+    """
+    Function that calls plot(**kwargs) for every entry of list_of_kwargs on a process
+    pool and yields the encoded images as soon as each one is finished.
+
+    Example:
+        >>> for result in render_batch(
+        ...     PizzaDashboard,
+        ...     {"tables_face_color": "white"},
+        ...     [{"player": name} for name in players],
+        ...     workers=8,
+        ...     dashboard_args=("pizza", data_accessor),
+        ... ):
+        ...     if result.error is None:
+        ...         save(players[result.index], result.content)
+
+    Args:
+        dashboard_cls (Type): Dashboard class to render
+        field_overrides (Dict[str, Any], optional): Dashboard fields to set on every
+            instance, eg colours or watermark
+        list_of_kwargs (Iterable[Dict[str, Any]]): One set of plot kwargs per image
+        workers (int, optional): Number of worker processes.  Defaults to the number of
+            cpus.  With 1 worker everything is rendered in the calling process.
+        dashboard_args (Sequence[Any]): Positional arguments for the dashboard
+            constructor, usually the data accessor.  Must be picklable.
+        fmt (str): Image format, eg "png" or "svg"
+        dpi (float, optional): Resolution of raster output
+        max_pending (int, optional): Maximum number of submitted but unfinished jobs,
+            which bounds memory when list_of_kwargs is a long generator.
+            Defaults to 4 per worker.
+
+    Returns:
+        Iterator[RenderResult]: Results in completion order.  Use result.index to match
+            them back to list_of_kwargs.  A failed render is reported in result.error
+            and result.traceback rather than stopping the batch.
+    """
+    field_overrides = field_overrides or {}
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    if workers == 1:
+        dashboard = _build_dashboard(dashboard_cls, dashboard_args, field_overrides)
+        for index, kwargs in enumerate(list_of_kwargs):
+            yield _render(dashboard, index, kwargs, fmt, dpi)
+        return
+
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(dashboard_cls, tuple(dashboard_args), field_overrides),
+    ) as executor:
+        pending: Set[Future] = set()
+        for index, kwargs in enumerate(list_of_kwargs):
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(_render_in_worker, index, kwargs, fmt, dpi))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,192 @@
+"""
+Copy-on-write helpers and copy instrumentation.
+
+Dashboards that set use_copy_on_write plot under pandas copy-on-write, where a shallow
+copy is as safe to modify as a deep one and only the columns that are actually written get
+copied.  Helpers that used to take a defensive data.copy() take lazy_copy(data) instead,
+which is free inside a copy_on_write block and a deep copy otherwise, so they stay safe in
+every dashboard.  Boolean selections already copy their rows, select_rows hands those out
+without copying them again.
+
+pandas options are process wide, so copy_on_write holds a lock for its whole block: renders
+under copy-on-write run one at a time, and lazy_copy only skips the deep copy in the thread
+that holds the lock.  Code running in other threads at the same time still sees the option,
+so only turn it on for code that doesn't rely on chained assignment either.
+
+count_copies is a debugging aid that counts and sizes the DataFrame.copy calls made inside
+its block, eg to catch a render that copies the full event frame again and again:
+
+    >>> with count_copies() as copies:
+    ...     dashboard.plot_dataframe(data)
+    >>> copies.report()
+    CopyReport(copies=3, deep_copies=1, bytes_copied=1843200)
+
+Dashboards record the same report per render when their debug_copies field is on.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+import pandas as pd
+
+_lock = threading.Lock()
+_copy_on_write_lock = threading.RLock()
+_state = threading.local()
+_counters: List["CopyCounter"] = []
+_original_copy = pd.DataFrame.copy
+_defines_copy = "copy" in vars(pd.DataFrame)
+
+
+def copy_on_write_enabled() -> bool:
+    """
+    Function that checks whether pandas copy-on-write is on
+
+    Returns:
+        bool: Whether copy-on-write is on
+    """
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        return False
+
+
+def _in_copy_on_write_block() -> bool:
+    return getattr(_state, "copy_on_write_depth", 0) > 0 and copy_on_write_enabled()
+
+
+@contextmanager
+def copy_on_write():
+    """
+    Context manager that turns on pandas copy-on-write inside the block.  The option is
+    process wide, so blocks in different threads wait for each other rather than one
+    turning copy-on-write off under another.
+    """
+    try:
+        pd.get_option("mode.copy_on_write")
+    except KeyError:  # pandas before 1.5
+        yield
+        return
+    with _copy_on_write_lock:
+        depth = getattr(_state, "copy_on_write_depth", 0)
+        _state.copy_on_write_depth = depth + 1
+        try:
+            with pd.option_context("mode.copy_on_write", True):
+                yield
+        finally:
+            _state.copy_on_write_depth = depth
+
+
+def lazy_copy(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Function that returns a copy of data that can be modified without affecting data.
+    The copy is shallow, and so free, inside a copy_on_write block of the calling thread
+    and deep otherwise, also while another thread has copy-on-write on.
+
+    Args:
+        data (pd.DataFrame): Data to copy
+
+    Returns:
+        pd.DataFrame: Copy of data
+    """
+    return data.copy(deep=not _in_copy_on_write_block())
+
+
+def select_rows(data: pd.DataFrame, mask: Any) -> pd.DataFrame:
+    """
+    Function that selects the rows of data in a boolean mask into a frame that can be
+    modified without affecting data.  Boolean selection already copies the rows, so
+    unlike lazy_copy(data.loc[mask]) this makes no second copy outside copy-on-write.
+
+    Args:
+        data (pd.DataFrame): Data to select from
+        mask (Any): Boolean mask of the rows to select, as accepted by data.loc
+
+    Returns:
+        pd.DataFrame: Selected rows
+    """
+    # the shallow copy only detaches the selection from data, so that pandas doesn't warn
+    # about setting values on it
+    return data.loc[mask].copy(deep=False)
+
+
+class CopyReport(NamedTuple):
+    copies: int
+    deep_copies: int
+    bytes_copied: int
+
+
+class CopyCounter:
+    """
+    Counts the DataFrame.copy calls made while it is active, including those made by
+    pandas methods such as assign.  Only deep copies add to bytes_copied, which is the
+    shallow memory usage of the copied frames.
+    """
+
+    def __init__(self):
+        self.copies = 0
+        self.deep_copies = 0
+        self.bytes_copied = 0
+
+    def record(self, data: pd.DataFrame, deep: bool):
+        """
+        Function that records one copy
+
+        Args:
+            data (pd.DataFrame): Frame that was copied
+            deep (bool): Whether the copy was deep
+        """
+        self.copies += 1
+        if deep:
+            self.deep_copies += 1
+            self.bytes_copied += int(data.memory_usage(index=True).sum())
+
+    def report(self) -> CopyReport:
+        """
+        Function that returns the counts
+
+        Returns:
+            CopyReport: Number of copies, number of deep copies and bytes copied
+        """
+        return CopyReport(self.copies, self.deep_copies, self.bytes_copied)
+
+
+def _counting_copy(self: pd.DataFrame, deep: Optional[bool] = True) -> pd.DataFrame:
+    # copies pandas makes while copying are part of the outer copy
+    if getattr(_state, "copying", False):
+        return _original_copy(self, deep=deep)
+    _state.copying = True
+    try:
+        # deep=None, as used by eg assign, is lazy under copy-on-write and deep otherwise
+        is_deep = not copy_on_write_enabled() if deep is None else bool(deep)
+        with _lock:
+            for counter in _counters:
+                counter.record(self, is_deep)
+        return _original_copy(self, deep=deep)
+    finally:
+        _state.copying = False
+
+
+@contextmanager
+def count_copies() -> Iterator[CopyCounter]:
+    """
+    Context manager that counts the DataFrame.copy calls made inside the block, in every
+    thread.  It patches DataFrame.copy for the duration, so only use it for debugging.
+
+    Yields:
+        CopyCounter: Counter of the copies made in the block
+    """
+    counter = CopyCounter()
+    with _lock:
+        _counters.append(counter)
+        pd.DataFrame.copy = _counting_copy
+    try:
+        yield counter
+    finally:
+        with _lock:
+            _counters.remove(counter)
+            if not _counters:
+                if _defines_copy:
+                    pd.DataFrame.copy = _original_copy
+                else:
+                    del pd.DataFrame.copy
@@ -0,0 +1,338 @@
+"""
+Data accessor wrappers that can be used anywhere a _DataAccessor is expected.
+
+CachingDataAccessor remembers the dataframes returned by another data accessor, so that
+dashboards asking for the same datasource with the same kwargs (eg a pizza and a radar
+for the same player) share a single query.
+"""
+
+import datetime
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from footballdashboards._types._data_accessor import _DataAccessor
+
+DataKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def normalize_kwargs_value(value: Any) -> Any:
+    """
+    Function that turns a kwargs value into a hashable value that compares equal for
+    equivalent inputs, eg [1, 2] and (1, 2), or np.int64(3) and 3
+
+    Args:
+        value (Any): Value passed to get_data
+
+    Returns:
+        Any: Hashable, order independent representation of the value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), normalize_kwargs_value(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((normalize_kwargs_value(v) for v in value), key=repr))
+    if isinstance(value, (list, tuple, np.ndarray, pd.Series, pd.Index)):
+        return tuple(normalize_kwargs_value(v) for v in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime.date, datetime.datetime, pd.Timestamp)):
+        return pd.Timestamp(value).isoformat()
+    return value
+
+
+def make_data_key(data_requester_name: str, **kwargs) -> DataKey:
+    """
+    Function that builds the cache key for a get_data call
+
+    Args:
+        data_requester_name (str): Name of the datasource being requested
+        kwargs: Parameters passed to get_data
+
+    Returns:
+        DataKey: Hashable key, identical for equivalent calls
+    """
+    return data_requester_name, normalize_kwargs_value(kwargs)
+
+
+class _FileBackend(ABC):
+    """
+    Base class for the on-disk tier of CachingDataAccessor.  Each dataframe is stored in
+    its own file named after a hash of its key.
+
+    Args:
+        cache_dir (str): Directory to store the files in
+        ttl (float, optional): Lifetime of a file in seconds.  None means forever.
+    """
+
+    suffix = ""
+
+    def __init__(self, cache_dir: str, ttl: Optional[float] = None):
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError(
+                f"{type(self).__name__} requires pyarrow. "
+                "Install it with pip install footballdashboards[arrow]"
+            )
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: DataKey) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}{self.suffix}")
+
+    def load(self, key: DataKey) -> Optional[pd.DataFrame]:
+        """
+        Function that reads a dataframe from disk
+
+        Args:
+            key (DataKey): Key of the dataframe
+
+        Returns:
+            Optional[pd.DataFrame]: The dataframe, or None if it is missing or expired
+        """
+        path = self._path(key)
+        try:
+            if self.ttl is not None and os.path.getmtime(path) + self.ttl <= time.time():
+                os.remove(path)
+                return None
+            return self._read(path)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: DataKey, data: pd.DataFrame):
+        """
+        Function that writes a dataframe to disk.  Dataframes that the format cannot
+        represent are silently not stored.
+
+        Args:
+            key (DataKey): Key of the dataframe
+            data (pd.DataFrame): Dataframe to store
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self._write(data, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:  # pylint: disable=broad-except
+            # pyarrow raises its own exception types for unsupported column types
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def remove(self, key: DataKey):
+        """
+        Function that deletes the file of a dataframe if there is one
+
+        Args:
+            key (DataKey): Key of the dataframe
+        """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Function that deletes all the files of this backend
+        """
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(self.suffix):
+                os.remove(os.path.join(self.cache_dir, file_name))
+
+    @abstractmethod
+    def _read(self, path: str) -> pd.DataFrame:
+        """
+        Function that reads a dataframe from a file of this format
+
+        Args:
+            path (str): Path of the file
+
+        Returns:
+            pd.DataFrame: The stored dataframe
+        """
+
+    @abstractmethod
+    def _write(self, data: pd.DataFrame, path: str):
+        """
+        Function that writes a dataframe to a file of this format
+
+        Args:
+            data (pd.DataFrame): Dataframe to store
+            path (str): Path of the file
+        """
+
+
+class ParquetBackend(_FileBackend):
+    """
+    Stores cached dataframes as Parquet files.  Preserves the index.
+    """
+
+    suffix = ".parquet"
+
+    def _read(self, path: str) -> pd.DataFrame:
+        return pd.read_parquet(path)
+
+    def _write(self, data: pd.DataFrame, path: str):
+        data.to_parquet(path)
+
+
+class FeatherBackend(_FileBackend):
+    """
+    Stores cached dataframes as Feather files, which are faster to read than Parquet
+    but only support a default RangeIndex.  Dataframes with any other index are only
+    cached in memory.
+    """
+
+    suffix = ".feather"
+
+    def _read(self, path: str) -> pd.DataFrame:
+        return pd.read_feather(path)
+
+    def _write(self, data: pd.DataFrame, path: str):
+        data.to_feather(path)
+
+
+class CachingDataAccessor(_DataAccessor):
+    """
+    Wraps another data accessor and caches the dataframes it returns, keyed on the
+    datasource name and the normalized kwargs.
+
+    Example:
+        >>> accessor = CachingDataAccessor(MyAccessor(), max_memory_bytes=256 * 1024 ** 2)
+        >>> PizzaDashboard("pizza", accessor).plot(player="Saka")
+        >>> RadarDashboard("pizza", accessor).plot(player="Saka")  # no second query
+        >>> accessor.hits, accessor.misses
+        (1, 1)
+
+    Args:
+        data_accessor (_DataAccessor): Accessor that actually retrieves the data
+        max_memory_bytes (int): Maximum total deep memory usage of the dataframes held
+            in memory.  Least recently used dataframes are dropped first.
+        backend (_FileBackend, optional): On-disk tier, eg ParquetBackend(path)
+        copy (bool): Whether to hand out copies of cached dataframes, so that dashboards
+            that modify their data in place cannot corrupt the cache
+    """
+
+    def __init__(
+        self,
+        data_accessor: _DataAccessor,
+        max_memory_bytes: int = 512 * 1024 * 1024,
+        backend: Optional[_FileBackend] = None,
+        copy: bool = True,
+    ):
+        self.data_accessor = data_accessor
+        self.max_memory_bytes = max_memory_bytes
+        self.backend = backend
+        self.copy = copy
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[DataKey, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Total deep memory usage of the dataframes currently held in memory
+        """
+        return self._memory_bytes
+
+    def get_data(self, data_requester_name: str, **kwargs) -> pd.DataFrame:
+        key = make_data_key(data_requester_name, **kwargs)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._hand_out(entry[0])
+
+        data = self.backend.load(key) if self.backend is not None else None
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+            self._remember(key, data)
+            return self._hand_out(data)
+
+        data = self.data_accessor.get_data(data_requester_name, **kwargs)
+        with self._lock:
+            self.misses += 1
+        if self.backend is not None:
+            self.backend.save(key, data)
+        # the caller owns the dataframe it was given, the cache keeps its own copy
+        self._remember(key, data.copy() if self.copy else data)
+        return data
+
+    def invalidate(self, data_requester_name: str, **kwargs):
+        """
+        Function that drops a single cached result, eg after the underlying data changed
+
+        Args:
+            data_requester_name (str): Name of the datasource
+            kwargs: Parameters the data was requested with
+        """
+        key = make_data_key(data_requester_name, **kwargs)
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None:
+                self._memory_bytes -= entry[1]
+        if self.backend is not None:
+            self.backend.remove(key)
+
+    def clear(self, disk: bool = False):
+        """
+        Function that empties the memory cache, resets the counters and optionally
+        empties the disk backend
+
+        Args:
+            disk (bool): Whether to also delete the files of the backend
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+        if disk and self.backend is not None:
+            self.backend.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Function that returns the cache counters
+
+        Returns:
+            Dict[str, int]: hits, disk_hits, misses, entries and memory_bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    def _hand_out(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data.copy() if self.copy else data
+
+    def _remember(self, key: DataKey, data: pd.DataFrame):
+        size = int(data.memory_usage(index=True, deep=True).sum())
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            self._memory[key] = (data, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
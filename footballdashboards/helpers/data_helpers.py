@@ -1,5 +1,6 @@
 from footmav.data_definitions.whoscored.constants import EventType
 from footballdashboards.helpers import formatters
+from footballdashboards.helpers.lineups import substitution_minutes
 
 
 def lineup_card(data):
@@ -13,23 +14,20 @@ def lineup_card(data):
         lambda x: x if x not in ["RCDM", "LCDM", "RCAM", "LCAM"] else x.replace("C", "")
     )
     lineup_card = lineup_card.loc[lineup_card["shirt_number"] != -1]
-    subs = (
-        data.loc[data["event_type"] == EventType.SubstitutionOn][
-            ["player_name", "minute", "second"]
-        ]
-        .set_index("player_name")
-        .to_dict()["minute"]
+    sub_minutes = substitution_minutes(
+        data, EventType.SubstitutionOn, EventType.SubstitutionOff, ["player_name"]
     )
-    subs_off = (
-        data.loc[data["event_type"] == EventType.SubstitutionOff][
-            ["player_name", "minute", "second"]
-        ]
-        .set_index("player_name")
-        .to_dict()["minute"]
+    lineup_card["on"] = (
+        lineup_card["player_name"].map(sub_minutes["sub_on_minute"]).fillna(0).astype(int)
     )
-    lineup_card["on"] = lineup_card["player_name"].map(subs).fillna(0).astype(int)
     lineup_card["is_position"] = lineup_card["position"].apply(lambda x: 1 if x != "GK" else 0)
-    lineup_card["off"] = lineup_card["player_name"].map(subs_off).fillna(0).astype(int).astype(str)
+    lineup_card["off"] = (
+        lineup_card["player_name"]
+        .map(sub_minutes["sub_off_minute"])
+        .fillna(0)
+        .astype(int)
+        .astype(str)
+    )
     lineup_card["off"] = lineup_card["off"].apply(lambda x: x if x != "0" else "--")
     lineup_card["player_name"] = lineup_card["player_name"].apply(formatters.smart_name_formatter)
     lineup_card = lineup_card.sort_values(["is_position", "on", "shirt_number"])
@@ -52,7 +50,13 @@ def lineup_card(data):
 def extract_names_sorted_by_position(data, exclude_positions=None):
     exclude_positions = exclude_positions or []
     data = data.loc[data["event_type"] != EventType.Carry]
-    subs = data.loc[data["event_type"] == EventType.SubstitutionOn, "player_name"]
+    subs = (
+        substitution_minutes(
+            data, EventType.SubstitutionOn, EventType.SubstitutionOff, ["player_name"]
+        )
+        .dropna(subset=["sub_on_minute"])
+        .index
+    )
 
     list_of_names = (
         data.loc[
@@ -71,3 +75,19 @@ def extract_names_sorted_by_position(data, exclude_positions=None):
     if len(list_of_names) > 15:
         list_of_names = list_of_names[:15]
     return list_of_names
+
+
+def split_by_player(data, key="player_name"):
+    """
+    Function that splits the events into one frame per player with a single groupby, so
+    that dashboards drawing one pitch per player don't refilter the whole match each time
+
+    Args:
+        data (pd.DataFrame): Event data
+        key (str): Column to split on
+
+    Returns:
+        Dict[str, pd.DataFrame]: key value -> that player's events.  Use .get(name,
+            data.iloc[:0]) for players that may have no events
+    """
+    return {name: group for name, group in data.groupby(key, sort=False)}
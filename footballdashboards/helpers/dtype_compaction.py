@@ -0,0 +1,76 @@
+"""
+Downcasting of dashboard data to compact dtypes.
+
+Data usually arrives with float64 coordinates, int64 flags and object strings, and is
+copied several times on its way through a dashboard.  compact_dtypes converts the columns
+named in a schema to float32, small integers, bool or category, which roughly halves the
+memory of season-scale shot and event frames.  A conversion that would change values is
+skipped, so integer columns are only downcast when every value fits and bool columns only
+when they hold 0/1 without missing values.
+"""
+
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+
+COMPACT_DTYPES = ("float32", "int8", "int16", "int32", "bool", "category")
+
+
+class CompactionReport(NamedTuple):
+    bytes_before: int
+    bytes_after: int
+    converted: Tuple[str, ...]
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _fits(column: pd.Series, dtype: str) -> bool:
+    if dtype == "float32":
+        return column.dtype.kind in "fiub"
+    if dtype == "category":
+        return not isinstance(column.dtype, pd.CategoricalDtype)
+    if column.dtype.kind not in "iub" and not (
+        column.dtype.kind == "f" and np.array_equal(column, np.round(column))
+    ):
+        return False
+    if dtype == "bool":
+        return bool(column.isin([0, 1]).all())
+    info = np.iinfo(dtype)
+    return len(column) == 0 or (column.min() >= info.min and column.max() <= info.max)
+
+
+def compact_dtypes(
+    data: pd.DataFrame, schema: Dict[str, str]
+) -> Tuple[pd.DataFrame, CompactionReport]:
+    """
+    Function that converts the columns of data named in schema to their compact dtypes.
+    Columns missing from data and conversions that would lose information are skipped.
+
+    Args:
+        data (pd.DataFrame): Data to compact
+        schema (Dict[str, str]): Target dtype of each column, one of COMPACT_DTYPES
+
+    Returns:
+        Tuple[pd.DataFrame, CompactionReport]: Data with the converted columns, and the
+            deep memory usage before and after
+
+    Raises:
+        ValueError: If the schema names an unsupported dtype
+    """
+    unsupported = set(schema.values()) - set(COMPACT_DTYPES)
+    if unsupported:
+        raise ValueError(f"Unsupported compact dtypes {unsupported}, use {COMPACT_DTYPES}")
+    converted = {
+        column: data[column].astype(dtype)
+        for column, dtype in schema.items()
+        if column in data.columns and data[column].dtype != dtype and _fits(data[column], dtype)
+    }
+    before = int(data.memory_usage(index=True, deep=True).sum())
+    if not converted:
+        return data, CompactionReport(before, before, ())
+    compacted = data.assign(**converted)
+    after = int(compacted.memory_usage(index=True, deep=True).sum())
+    return compacted, CompactionReport(before, after, tuple(converted))
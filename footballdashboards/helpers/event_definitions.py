@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+import numpy as np
 from footmav.data_definitions.whoscored.constants import EventType
 from footmav.utils import whoscored_funcs as WF
+from footballdashboards.helpers.event_types import event_type_codes
 
 
 @dataclass
@@ -37,13 +39,13 @@ def get_touch_events(data):
         61,
         74,
     ]
-    touch_events = [EventType(e) for e in touch_events]
+    codes = event_type_codes(data["event_type"])
 
     total_touches = data.loc[
-        (data["event_type"].isin(touch_events))
-        | ((data["event_type"] == EventType.Foul) & (data["outcomeType"] == 1))
+        np.isin(codes, touch_events)
+        | ((codes == EventType.Foul.value) & (data["outcomeType"] == 1))
         | (
-            ((data["event_type"] == EventType.Pass) | (data["event_type"] == EventType.OffsidePass))
+            np.isin(codes, [EventType.Pass.value, EventType.OffsidePass.value])
             & ~(
                 WF.col_has_qualifier(data, qualifier_code=6)
                 | WF.col_has_qualifier(data, display_name="ThrowIn")
@@ -0,0 +1,147 @@
+"""
+Vectorized preprocessing stages for event dataframes.
+
+Each stage takes an event dataframe and returns a new one, so they can be chained with
+DataFrame.pipe before the data is handed to the plotting code.
+"""
+
+from typing import Dict, Hashable, Union
+
+import numpy as np
+import pandas as pd
+
+from footballdashboards.helpers.copy_on_write import lazy_copy
+
+
+def opponent_map(teams: pd.Series) -> Dict[Hashable, Hashable]:
+    """
+    Function that maps every team in a match to its opponent
+
+    Args:
+        teams (pd.Series): Team column of the event data, eg team or teamId
+
+    Returns:
+        Dict[Hashable, Hashable]: Team -> first other team appearing in the data
+    """
+    unique = [team for team in teams.unique() if pd.notna(team)]
+    return {team: next((other for other in unique if other != team), team) for team in unique}
+
+
+def team_side(is_home_team: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """
+    Function that gives the side each event's team attacks towards
+
+    Args:
+        is_home_team (Union[pd.Series, np.ndarray]): is_home_team column of the event data
+
+    Returns:
+        np.ndarray: 1 for home team events and -1 for everything else
+    """
+    return np.where(np.asarray(is_home_team) == 1, 1, -1)
+
+
+def mirror_coordinates(
+    data: pd.DataFrame,
+    mask: Union[pd.Series, np.ndarray],
+    pitch_length: float = 100,
+    pitch_width: float = 100,
+) -> pd.DataFrame:
+    """
+    Function that mirrors the x and y coordinates of the masked events through the centre
+    spot with whole column assignments
+
+    Args:
+        data (pd.DataFrame): Event data
+        mask (Union[pd.Series, np.ndarray]): Boolean mask of the events to mirror
+        pitch_length (float): Length of the pitch in the data coordinates
+        pitch_width (float): Width of the pitch in the data coordinates
+
+    Returns:
+        pd.DataFrame: Copy of data with the masked coordinates mirrored
+    """
+    data = lazy_copy(data)
+    mask = np.asarray(mask, dtype=bool)
+    if not mask.any():
+        return data
+    for column, size in [("x", pitch_length), ("y", pitch_width)]:
+        if column in data.columns:
+            values = data[column].to_numpy()
+            data[column] = np.where(mask, size - values, values)
+    return data
+
+
+def orient_by_team_side(
+    data: pd.DataFrame, pitch_length: float = 100, pitch_width: float = 100
+) -> pd.DataFrame:
+    """
+    Function that puts both teams' events on one pitch, with the home team attacking
+    left to right and the away team right to left, and records the side in a
+    possession_side column
+
+    Args:
+        data (pd.DataFrame): Event data for a single match, with is_home_team
+        pitch_length (float): Length of the pitch in the data coordinates
+        pitch_width (float): Width of the pitch in the data coordinates
+
+    Returns:
+        pd.DataFrame: Copy of data with away coordinates mirrored and possession_side set
+            to 1 for home and -1 for away events
+    """
+    side = team_side(data["is_home_team"])
+    data = mirror_coordinates(data, side == -1, pitch_length, pitch_width)
+    data["possession_side"] = side
+    return data
+
+
+def switch_team(
+    data: pd.DataFrame,
+    mask: pd.Series,
+    pitch_length: float = 100,
+    pitch_width: float = 100,
+) -> pd.DataFrame:
+    """
+    Function that reassigns the masked events to the other team in one pass: coordinates
+    are mirrored into the other team's direction of play and team, teamId and
+    is_home_team are flipped where present
+
+    Args:
+        data (pd.DataFrame): Event data for a single match
+        mask (pd.Series): Boolean mask of the events to reassign
+        pitch_length (float): Length of the pitch in the data coordinates
+        pitch_width (float): Width of the pitch in the data coordinates
+
+    Returns:
+        pd.DataFrame: Copy of data with the masked events reassigned
+    """
+    mask = np.asarray(mask, dtype=bool)
+    data = mirror_coordinates(data, mask, pitch_length, pitch_width)
+    if not mask.any():
+        return data
+    # whole column assignments are much cheaper than repeated masked .loc writes
+    if "is_home_team" in data.columns:
+        values = data["is_home_team"].to_numpy()
+        data["is_home_team"] = np.where(mask, 1 - values, values)
+    for column in ["team", "teamId"]:
+        if column in data.columns:
+            opponents = opponent_map(data[column])
+            values = data[column].to_numpy(copy=True)
+            values[mask] = [opponents.get(team, team) for team in values[mask]]
+            data[column] = values
+    return data
+
+
+def fix_own_goals(data: pd.DataFrame, own_goal_mask: pd.Series) -> pd.DataFrame:
+    """
+    Function that credits own goals to the team that benefited from them and flags them
+    in an own_goal column
+
+    Args:
+        data (pd.DataFrame): Event data for a single match
+        own_goal_mask (pd.Series): Boolean mask of the own goal events
+
+    Returns:
+        pd.DataFrame: Copy of data with own goals reassigned and an own_goal column
+    """
+    data = switch_team(data, own_goal_mask)
+    data["own_goal"] = np.asarray(own_goal_mask, dtype=int)
+    return data
@@ -0,0 +1,305 @@
+"""
+Local columnar store of match events.
+
+The event queries behind the match dashboards return wide object-dtype frames, and every
+render of a match runs them again.  EventStore keeps one Arrow IPC (Feather v2) file per
+match with compact typed columns: categorical team, player and position names and small
+integer event_type codes instead of enum objects.  Files are read through a memory map,
+so a match is read in milliseconds and its numeric columns are handed to pandas without
+a copy.
+
+Frames read without a copy are backed by the read-only file.  Assigning whole columns
+works as usual, but writing into an existing column in place raises, so read with
+copy=True for code that modifies its data in place.
+
+Columns holding nested values, such as qualifier dicts, can't be stored unchanged, so
+EventStore.write refuses them and EventStoreDataAccessor serves such matches as fetched.
+
+Requires pyarrow, pip install footballdashboards[arrow].
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from footballdashboards._types._data_accessor import _DataAccessor
+from footballdashboards.helpers.event_types import convert_event_types, event_type_codes
+
+CATEGORICAL_COLUMNS = (
+    "team",
+    "opponent",
+    "player_name",
+    "pass_receiver",
+    "position",
+    "pass_receiver_position",
+    "formation",
+    "competition",
+    "decorated_league_name",
+)
+
+
+def _pyarrow():
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        import pyarrow.ipc  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError as exc:
+        raise ImportError(
+            "EventStore requires pyarrow. Install it with pip install footballdashboards[arrow]"
+        ) from exc
+    return pyarrow
+
+
+def _nested_columns(data: pd.DataFrame) -> List[str]:
+    # Arrow would store dicts as structs over the union of their keys, adding the missing
+    # keys as None and changing int values to float, so nested values are refused
+    nested = []
+    for column in data.columns:
+        values = data[column]
+        if values.dtype != object or pd.api.types.infer_dtype(values, skipna=True) != "mixed":
+            continue
+        if any(isinstance(value, (dict, list, tuple, set)) for value in values):
+            nested.append(column)
+    return nested
+
+
+def compact_events(
+    data: pd.DataFrame, categorical_columns: Iterable[str] = CATEGORICAL_COLUMNS
+) -> pd.DataFrame:
+    """
+    Function that converts an event frame to the typed columns of the store: integer
+    event_type codes and categorical name columns
+
+    Args:
+        data (pd.DataFrame): Events, eg as returned by the database
+        categorical_columns (Iterable[str]): Columns to store as categoricals, where present
+
+    Returns:
+        pd.DataFrame: Compacted copy of data with a default index
+    """
+    converted = {}
+    if "event_type" in data.columns:
+        converted["event_type"] = pd.to_numeric(
+            event_type_codes(data["event_type"]), downcast="integer"
+        )
+    for column in categorical_columns:
+        if column in data.columns and not isinstance(data[column].dtype, pd.CategoricalDtype):
+            converted[column] = data[column].astype("category")
+    return data.assign(**converted).reset_index(drop=True)
+
+
+class EventStore:
+    """
+    Directory of Arrow IPC files, one per match
+
+    Args:
+        root (str): Directory the match files are kept in
+        categorical_columns (Iterable[str]): Columns stored as categoricals
+    """
+
+    suffix = ".arrow"
+
+    def __init__(self, root: str, categorical_columns: Iterable[str] = CATEGORICAL_COLUMNS):
+        _pyarrow()
+        self.root = root
+        self.categorical_columns = tuple(categorical_columns)
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, match_id: Hashable) -> str:
+        """
+        Function that returns the path of the file of a match
+
+        Args:
+            match_id (Hashable): Id of the match
+
+        Returns:
+            str: Path of the match file
+        """
+        return os.path.join(self.root, f"{match_id}{self.suffix}")
+
+    def __contains__(self, match_id: Hashable) -> bool:
+        return os.path.exists(self.path(match_id))
+
+    def match_ids(self) -> List[str]:
+        """
+        Function that lists the matches in the store
+
+        Returns:
+            List[str]: Ids of the stored matches, as strings
+        """
+        return sorted(
+            name[: -len(self.suffix)]
+            for name in os.listdir(self.root)
+            if name.endswith(self.suffix)
+        )
+
+    def write(self, match_id: Hashable, data: pd.DataFrame):
+        """
+        Function that stores the events of a match, replacing any previous file
+
+        Args:
+            match_id (Hashable): Id of the match
+            data (pd.DataFrame): Events of the match
+
+        Raises:
+            ValueError: If a column can't be stored in an Arrow file, or holds nested
+                values such as qualifier dicts, which would not be read back unchanged
+        """
+        pa = _pyarrow()
+        nested = _nested_columns(data)
+        if nested:
+            raise ValueError(
+                f"Events of match {match_id} can't be stored: columns {nested} hold nested "
+                "values such as dicts or lists"
+            )
+        try:
+            table = pa.Table.from_pandas(
+                compact_events(data, self.categorical_columns), preserve_index=False
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+            raise ValueError(f"Events of match {match_id} can't be stored: {exc}") from exc
+        path = self.path(match_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def read(
+        self,
+        match_id: Hashable,
+        columns: Optional[Sequence[str]] = None,
+        copy: bool = False,
+        categories: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Function that reads the events of a match through a memory map
+
+        Args:
+            match_id (Hashable): Id of the match
+            columns (Sequence[str], optional): Columns to read, ignoring any the file
+                doesn't have.  Only these are paged in
+            copy (bool): Whether to copy the data into writable memory
+            categories (bool): Whether to return name columns as categoricals rather than
+                strings.  Groupbys on categoricals include unobserved categories by default
+
+        Returns:
+            pd.DataFrame: Events of the match, with integer event_type codes
+
+        Raises:
+            ValueError: If the match isn't in the store
+        """
+        pa = _pyarrow()
+        path = self.path(match_id)
+        if not os.path.exists(path):
+            raise ValueError(f"Match {match_id} is not in the event store at {self.root}")
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        data = table.to_pandas(split_blocks=True)
+        if not categories:
+            data = data.astype(
+                {
+                    column: object
+                    for column, dtype in data.dtypes.items()
+                    if isinstance(dtype, pd.CategoricalDtype)
+                },
+                copy=False,
+            )
+        return data.copy() if copy else data
+
+    def remove(self, match_id: Hashable):
+        """
+        Function that deletes the file of a match if there is one
+
+        Args:
+            match_id (Hashable): Id of the match
+        """
+        try:
+            os.remove(self.path(match_id))
+        except OSError:
+            pass
+
+
+class EventStoreDataAccessor(_DataAccessor):
+    """
+    Data accessor that serves match events from an EventStore.  Matches missing from the
+    store are fetched once from another data accessor and written to the store, so later
+    renders of the match only read local files.
+
+    All datasources share the one file of a match, so only use this for datasources that
+    return the whole event data of a match, eg the match report.
+
+    Example:
+        >>> accessor = EventStoreDataAccessor(EventStore("events"), MyAccessor())
+        >>> MatchDashboard(accessor).plot(match_id=1729425)  # queries and stores
+        >>> MatchDashboard(accessor).plot(match_id=1729425)  # reads events/1729425.arrow
+
+    Args:
+        store (EventStore): Store to read from
+        data_accessor (_DataAccessor, optional): Accessor that fetches missing matches
+        match_key (str): Name of the get_data keyword argument holding the match id
+        copy (bool): Whether to hand out writable copies instead of the memory mapped data
+        event_type (Callable[[int], Any], optional): Enum class to decode event_type
+            codes into, eg EventType.  Codes are returned as they are by default.
+    """
+
+    supports_column_projection = True
+
+    def __init__(
+        self,
+        store: EventStore,
+        data_accessor: Optional[_DataAccessor] = None,
+        match_key: str = "match_id",
+        copy: bool = False,
+        event_type: Optional[Callable[[int], Any]] = None,
+    ):
+        self.store = store
+        self.data_accessor = data_accessor
+        self.match_key = match_key
+        self.copy = copy
+        self.event_type = event_type
+        self.hits = 0
+        self.misses = 0
+
+    def get_data(self, data_requester_name: str, **kwargs) -> pd.DataFrame:
+        if self.match_key not in kwargs:
+            raise ValueError(f"{self.match_key} is required to read from the event store")
+        match_id = kwargs[self.match_key]
+        # the store keeps whole matches, projection only applies to the read
+        columns = kwargs.pop("columns", None)
+        if match_id in self.store:
+            self.hits += 1
+            data = self.store.read(match_id, columns=columns, copy=self.copy)
+        elif self.data_accessor is None:
+            raise ValueError(f"Match {match_id} is not in the event store at {self.store.root}")
+        else:
+            self.misses += 1
+            data = self.data_accessor.get_data(data_requester_name, **kwargs)
+            try:
+                self.store.write(match_id, data)
+                data = self.store.read(match_id, columns=columns, copy=self.copy)
+            except ValueError:
+                # matches the store can't hold are served as fetched, with the same
+                # integer event_type codes as stored matches
+                data = compact_events(data, ())
+                if columns is not None:
+                    data = data[[column for column in columns if column in data.columns]]
+        if self.event_type is not None and "event_type" in data.columns:
+            data["event_type"] = convert_event_types(data["event_type"], self.event_type)
+        return data
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Function that returns the store counters
+
+        Returns:
+            Dict[str, int]: hits and misses
+        """
+        return {"hits": self.hits, "misses": self.misses}
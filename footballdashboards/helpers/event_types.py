@@ -0,0 +1,136 @@
+"""
+Integer coded event types.
+
+Event data carries its event_type as EventType enum objects from either the footmav or
+the footballmodels family, or as the integer codes both families share.  Building,
+comparing and copying object columns of enums row by row is slow, so the helpers here
+work on the integer codes and convert between representations with a lookup table that
+is built from the distinct values only.
+
+Importing this module registers the event_types series accessor:
+
+    >>> data["event_type"].event_types.isin([EventType.Pass, EventType.OffsidePass])
+    >>> data["event_type"].event_types.eq(EventType.Foul)
+    >>> data["event_type"].event_types.to(FootballmodelsEventType)
+
+which accepts members of either enum family or plain codes and gives the same results on
+enum and integer columns.  It only pays off on integer coded columns though: on an enum
+column every call factorizes the whole column again, which is slower than comparing the
+enums directly.  Convert an enum column with event_type_codes once and compare the codes
+when it is filtered more than once.
+"""
+
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+def event_type_value(event_type: Any) -> int:
+    """
+    Function that returns the integer code of an event type
+
+    Args:
+        event_type (Any): EventType member of either family, or an integer code
+
+    Returns:
+        int: Integer code of the event type
+    """
+    return int(getattr(event_type, "value", event_type))
+
+
+def event_type_codes(event_types: Any) -> np.ndarray:
+    """
+    Function that returns the integer codes of a column of event types.  Integer columns
+    are returned as they are, enum columns are converted once per distinct member.
+
+    Args:
+        event_types (Any): Event types, as enums or integer codes
+
+    Returns:
+        np.ndarray: Integer codes, in the smallest integer dtype that holds them for
+            enum columns
+    """
+    values = np.asarray(event_types)
+    if values.dtype.kind in "iu":
+        return values
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    lookup = np.array([event_type_value(value) for value in uniques], dtype=np.int64)
+    return pd.to_numeric(lookup, downcast="integer")[codes]
+
+
+def convert_event_types(event_types: Any, event_type: Callable[[int], Any]) -> np.ndarray:
+    """
+    Function that converts a column of event types to the members of an EventType
+    family, constructing each distinct member once
+
+    Args:
+        event_types (Any): Event types, as enums of either family or integer codes
+        event_type (Callable[[int], Any]): EventType class to convert to
+
+    Returns:
+        np.ndarray: Object array of event_type members
+    """
+    codes, uniques = pd.factorize(np.asarray(event_types), use_na_sentinel=False)
+    lookup = np.empty(len(uniques), dtype=object)
+    lookup[:] = [event_type(event_type_value(value)) for value in uniques]
+    return lookup[codes]
+
+
+@pd.api.extensions.register_series_accessor("event_types")
+class EventTypeAccessor:
+    """
+    Series accessor that compares event types by their integer codes.  Meant for integer
+    coded columns, on enum columns the codes are recomputed on every call
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    @property
+    def codes(self) -> np.ndarray:
+        """
+        Integer codes of the event types, recomputed on every access for enum columns
+        """
+        return event_type_codes(self._series)
+
+    def isin(self, event_types: Iterable[Any]) -> pd.Series:
+        """
+        Function that checks which events are of any of the given types
+
+        Args:
+            event_types (Iterable[Any]): EventType members of either family or codes
+
+        Returns:
+            pd.Series: Boolean mask aligned with the series
+        """
+        values = [event_type_value(value) for value in event_types]
+        return pd.Series(np.isin(self.codes, values), index=self._series.index)
+
+    def eq(self, event_type: Any) -> pd.Series:
+        """
+        Function that checks which events are of the given type
+
+        Args:
+            event_type (Any): EventType member of either family or a code
+
+        Returns:
+            pd.Series: Boolean mask aligned with the series
+        """
+        return pd.Series(self.codes == event_type_value(event_type), index=self._series.index)
+
+    def to(self, event_type: Callable[[int], Any]) -> pd.Series:
+        """
+        Function that converts the event types to the members of an EventType family
+
+        Args:
+            event_type (Callable[[int], Any]): EventType class to convert to
+
+        Returns:
+            pd.Series: Converted event types aligned with the series
+        """
+        return pd.Series(
+            convert_event_types(self._series, event_type),
+            index=self._series.index,
+            name=self._series.name,
+        )
@@ -0,0 +1,142 @@
+"""
+Cache of pre-built figure skeletons.
+
+The empty figure of a dashboard (its grid of axes, pitch lines and static styling) is the
+same for every render with the same layout, size and colours.  FigureTemplateCache builds
+it once, keeps it pickled and hands every render its own unpickled copy, so only the data
+dependent artists are drawn each time.  Unpickling a grid of pitches is several times
+cheaper than drawing it and renders identically.
+"""
+
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Tuple
+
+
+class TemplateCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+def pitch_key(pitch: Any) -> Tuple:
+    """
+    Function that builds a hashable key from the configuration of an mplsoccer pitch
+
+    Args:
+        pitch (Any): Pitch or VerticalPitch
+
+    Returns:
+        Tuple: Class name and the simple valued attributes of the pitch
+    """
+    simple = (str, int, float, bool, type(None))
+    items = [
+        (name, value if isinstance(value, simple) else tuple(value))
+        for name, value in sorted(vars(pitch).items())
+        if isinstance(value, simple)
+        or (isinstance(value, (list, tuple)) and all(isinstance(v, simple) for v in value))
+    ]
+    return (type(pitch).__name__,) + tuple(items)
+
+
+class FigureTemplateCache:
+    """
+    LRU cache of pickled figures (or tuples of a figure and its axes), keyed on anything
+    hashable that identifies the layout, eg the layout name, figure size and colours
+    """
+
+    def __init__(self, max_entries: int = 16):
+        """
+        Args:
+            max_entries (int): Maximum number of templates kept
+        """
+        self.max_entries = max_entries
+        self.enabled = True
+        self._templates: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Function that returns a fresh copy of the template for key, building it with build
+        the first time
+
+        Args:
+            key (Hashable): Identifies the layout.  Must cover everything build depends on
+            build (Callable[[], Any]): Builds the figure, eg lambda: make_grid(pitch)
+
+        Returns:
+            Any: What build returns, unpickled from the cached template
+        """
+        if not self.enabled:
+            return build()
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self._hits += 1
+        if template is None:
+            template = pickle.dumps(build(), protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._misses += 1
+                self._templates[key] = template
+                while len(self._templates) > self.max_entries:
+                    self._templates.popitem(last=False)
+        return pickle.loads(template)
+
+    def clear(self):
+        """
+        Function that drops every template
+        """
+        with self._lock:
+            self._templates.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> TemplateCacheInfo:
+        """
+        Function that reports the usage of the cache
+
+        Returns:
+            TemplateCacheInfo: hits, misses, number of templates and their pickled size
+        """
+        with self._lock:
+            return TemplateCacheInfo(
+                self._hits,
+                self._misses,
+                len(self._templates),
+                sum(len(template) for template in self._templates.values()),
+            )
+
+
+figure_templates = FigureTemplateCache()
+
+
+def cached_figure(key: Hashable, build: Callable[[], Any]) -> Any:
+    """
+    Function that returns a copy of a figure template from the shared cache
+
+    Args:
+        key (Hashable): Identifies the layout
+        build (Callable[[], Any]): Builds the figure on a cache miss
+
+    Returns:
+        Any: A fresh copy of what build returns
+    """
+    return figure_templates.get(key, build)
+
+
+def set_figure_templates_enabled(enabled: bool):
+    """
+    Function that turns the shared template cache on or off.  When off every figure is
+    built from scratch.
+
+    Args:
+        enabled (bool): Whether to use templates
+    """
+    figure_templates.enabled = enabled
+    if not enabled:
+        figure_templates.clear()
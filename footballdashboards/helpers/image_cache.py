@@ -0,0 +1,294 @@
+"""
+Two-tier (memory + disk) cache for images downloaded over HTTP.
+
+Entries are content-addressed by a hash of their key, so the same badge requested
+by different dashboards (or different processes sharing a cache directory) is only
+ever downloaded once per TTL window.  Missing images (HTTP 404) are cached as
+negative entries so that repeated lookups for unknown teams do not hit the network.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+CACHE_DIR_ENV_VAR = "FOOTBALLDASHBOARDS_CACHE_DIR"
+
+CacheKey = Tuple[str, ...]
+
+
+class ImageAsset(NamedTuple):
+    """
+    An image a dashboard will need: the cache key it is stored under and the url
+    it is downloaded from
+    """
+
+    key: CacheKey
+    url: str
+
+
+_POSITIVE_SUFFIX = ".img"
+_NEGATIVE_SUFFIX = ".missing"
+
+
+def _download(url: str) -> bytes:
+    """
+    Download the raw content of a url
+
+    Args:
+        url (str): Url to download
+
+    Returns:
+        bytes: Content of the response
+    """
+    with urlopen(url) as response:
+        return response.read()
+
+
+class ImageCache:
+    """
+    Thread-safe LRU memory cache backed by an optional on-disk directory.
+
+    Args:
+        cache_dir (str, optional): Directory for the disk tier.  If None only the
+            memory tier is used.
+        max_memory_items (int): Maximum number of entries held in memory.
+        max_disk_bytes (int): Maximum total size of the image files on disk.
+        ttl (float): Lifetime of a downloaded image in seconds.
+        negative_ttl (float): Lifetime of a cached 404 in seconds.
+        fetcher (Callable[[str], bytes]): Function used to download a url.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_items: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 7 * 24 * 60 * 60,
+        negative_ttl: float = 60 * 60,
+        fetcher: Callable[[str], bytes] = _download,
+    ):
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Optional[bytes]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.fetcher = fetcher
+        self.configure(
+            cache_dir=cache_dir,
+            max_memory_items=max_memory_items,
+            max_disk_bytes=max_disk_bytes,
+            ttl=ttl,
+            negative_ttl=negative_ttl,
+        )
+
+    def configure(self, **kwargs):
+        """
+        Change the settings of the cache in place.  Accepts the same keyword
+        arguments as the constructor (except fetcher).  Memory entries are kept.
+        """
+        for name in ["cache_dir", "max_memory_items", "max_disk_bytes", "ttl", "negative_ttl"]:
+            if name in kwargs:
+                setattr(self, name, kwargs[name])
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key_hash(key: CacheKey) -> str:
+        """
+        Function that returns the content address of a cache key
+
+        Args:
+            key (CacheKey): Tuple of strings identifying the image
+
+        Returns:
+            str: Hex digest used as the memory key and disk file name
+        """
+        return hashlib.sha256("\x1f".join(key).encode("utf-8")).hexdigest()
+
+    def fetch(self, key: CacheKey, url: str) -> Optional[bytes]:
+        """
+        Function that returns the content for a key, downloading it from url if it is
+        not cached or has expired.
+
+        Args:
+            key (CacheKey): Tuple of strings identifying the image, eg (league, team)
+            url (str): Url to download the image from on a cache miss
+
+        Returns:
+            Optional[bytes]: Raw image content, or None if the url returned a 404
+
+        Raises:
+            HTTPError: For any HTTP error other than 404.  These are not cached.
+        """
+        digest = self.key_hash(key)
+        found, content = self._lookup(digest)
+        if found:
+            return content
+        try:
+            content = self.fetcher(url)
+        except HTTPError as exc:
+            if exc.code != 404:
+                raise
+            content = None
+        self._store(digest, content)
+        return content
+
+    def prefetch(self, assets: Iterable[ImageAsset], max_workers: int = 8) -> int:
+        """
+        Function that downloads every asset that is not already cached, in parallel on
+        a bounded thread pool.  Failures are ignored here; they will surface again
+        (and be handled by the dashboard) when the image is requested while drawing.
+
+        Args:
+            assets (Iterable[ImageAsset]): Assets to make sure are cached
+            max_workers (int): Maximum number of concurrent downloads
+
+        Returns:
+            int: Number of assets that had to be downloaded
+        """
+        pending = {}
+        for asset in assets:
+            if asset.key not in pending and not self.contains(asset.key):
+                pending[asset.key] = asset
+        if not pending:
+            return 0
+
+        def _fetch(asset: ImageAsset):
+            try:
+                self.fetch(asset.key, asset.url)
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            list(executor.map(_fetch, pending.values()))
+        return len(pending)
+
+    def contains(self, key: CacheKey) -> bool:
+        """
+        Function that checks if a key has a live entry (positive or negative)
+
+        Args:
+            key (CacheKey): Tuple of strings identifying the image
+
+        Returns:
+            bool: True if fetching the key would not hit the network
+        """
+        found, _ = self._lookup(self.key_hash(key), count=False)
+        return found
+
+    def clear(self, disk: bool = False):
+        """
+        Function that empties the memory tier and optionally the disk tier
+
+        Args:
+            disk (bool): Whether to also delete the cached files on disk
+        """
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+        if disk and self.cache_dir and os.path.isdir(self.cache_dir):
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.endswith((_POSITIVE_SUFFIX, _NEGATIVE_SUFFIX)):
+                    self._remove(os.path.join(self.cache_dir, file_name))
+
+    def _lookup(self, digest: str, count: bool = True) -> Tuple[bool, Optional[bytes]]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(digest)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(digest)
+                    if count:
+                        self.hits += 1
+                    return True, entry[1]
+                del self._memory[digest]
+
+        entry = self._read_disk(digest, now)
+        with self._lock:
+            if entry is not None:
+                self._remember(digest, entry)
+                if count:
+                    self.hits += 1
+                return True, entry[1]
+            if count:
+                self.misses += 1
+        return False, None
+
+    def _store(self, digest: str, content: Optional[bytes]):
+        ttl = self.ttl if content is not None else self.negative_ttl
+        with self._lock:
+            self._remember(digest, (time.time() + ttl, content))
+        self._write_disk(digest, content)
+
+    def _remember(self, digest: str, entry: Tuple[float, Optional[bytes]]):
+        self._memory[digest] = entry
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _path(self, digest: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}{suffix}")
+
+    def _read_disk(self, digest: str, now: float) -> Optional[Tuple[float, Optional[bytes]]]:
+        if not self.cache_dir:
+            return None
+        for suffix, ttl in [(_POSITIVE_SUFFIX, self.ttl), (_NEGATIVE_SUFFIX, self.negative_ttl)]:
+            path = self._path(digest, suffix)
+            try:
+                expires = os.path.getmtime(path) + ttl
+                if expires <= now:
+                    self._remove(path)
+                    continue
+                if suffix == _NEGATIVE_SUFFIX:
+                    return expires, None
+                with open(path, "rb") as file:
+                    return expires, file.read()
+            except OSError:
+                continue
+        return None
+
+    def _write_disk(self, digest: str, content: Optional[bytes]):
+        if not self.cache_dir:
+            return
+        suffix = _POSITIVE_SUFFIX if content is not None else _NEGATIVE_SUFFIX
+        path = self._path(digest, suffix)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(content or b"")
+            os.replace(tmp_path, path)
+        except OSError:
+            self._remove(tmp_path)
+            return
+        if content is not None:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if item.name.endswith(_POSITIVE_SUFFIX):
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
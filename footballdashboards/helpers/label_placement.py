@@ -0,0 +1,250 @@
+"""
+Label placement engines for annotated charts.
+
+"greedy" places labels one at a time at the first free candidate position around their
+point, looking up collisions with already placed labels and the plotted points in a
+uniform grid.  Its cost is roughly linear in the number of labels and it stops searching
+when its time budget runs out, leaving the remaining labels at their first candidate.
+
+"adjust_text" uses the adjustText package, which usually gives the nicest layouts but
+whose runtime grows quickly with the number of labels.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from adjustText import adjust_text
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.text import Text
+
+Box = Tuple[float, float, float, float]
+
+# unit directions of the candidate positions, tried in this order on every ring
+_DIRECTIONS = [
+    (1, 1),
+    (1, -1),
+    (-1, 1),
+    (-1, -1),
+    (0, 1),
+    (0, -1),
+    (1, 0),
+    (-1, 0),
+]
+
+
+class _Grid:
+    """Uniform grid of boxes for cheap overlap queries"""
+
+    def __init__(self, cell_size: float):
+        self.cell_size = max(cell_size, 1.0)
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self.boxes: List[Box] = []
+
+    def _cells(self, box: Box):
+        x0, y0, x1, y1 = (int(np.floor(v / self.cell_size)) for v in box)
+        for i in range(x0, x1 + 1):
+            for j in range(y0, y1 + 1):
+                yield i, j
+
+    def add(self, box: Box):
+        index = len(self.boxes)
+        self.boxes.append(box)
+        for cell in self._cells(box):
+            self.cells[cell].append(index)
+
+    def overlap(self, box: Box) -> float:
+        seen = set()
+        area = 0.0
+        for cell in self._cells(box):
+            for index in self.cells.get(cell, ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                other = self.boxes[index]
+                width = min(box[2], other[2]) - max(box[0], other[0])
+                height = min(box[3], other[3]) - max(box[1], other[1])
+                if width > 0 and height > 0:
+                    area += width * height
+        return area
+
+
+def _collection_boxes(objects: Optional[Any], ax: Axes) -> List[Box]:
+    """Display space boxes around every point of the scatter collections in objects"""
+    if objects is None:
+        return []
+    if isinstance(objects, PathCollection):
+        objects = [objects]
+    boxes = []
+    for collection in objects:
+        offsets = collection.get_offset_transform().transform(collection.get_offsets())
+        sizes = np.asarray(collection.get_sizes(), dtype=float)
+        # matplotlib cycles the sizes over the points, which are areas in points^2
+        sizes = np.resize(sizes, len(offsets)) if sizes.size else np.full(len(offsets), 36.0)
+        radii = np.sqrt(sizes) / 2 * ax.figure.dpi / 72
+        boxes.extend(
+            (x - r, y - r, x + r, y + r) for (x, y), r in zip(offsets, radii) if np.isfinite(x)
+        )
+    return boxes
+
+
+def place_labels_greedy(
+    ax: Axes,
+    texts: Sequence[Text],
+    objects: Optional[Any] = None,
+    arrowprops: Optional[Dict[str, Any]] = None,
+    time_budget: float = 0.25,
+    max_rings: int = 6,
+    padding: float = 3.0,
+    zorder: float = 29,
+) -> int:
+    """
+    Function that moves each text to the first candidate position around its anchor that
+    doesn't overlap the labels placed before it, the plotted points or the axes edges
+
+    Args:
+        ax (Axes): Axes the texts are drawn on
+        texts (Sequence[Text]): Texts positioned at their anchor points, in data
+            coordinates
+        objects (Any, optional): Scatter collection(s) whose points the labels avoid
+        arrowprops (Dict[str, Any], optional): Arrow drawn from the anchor to labels
+            that had to move beyond the first ring of candidates
+        time_budget (float): Seconds to spend searching.  Labels left when it runs out
+            keep their first candidate position
+        max_rings (int): Number of rings of candidate positions around each anchor
+        padding (float): Gap in pixels between a label and its anchor and between rings
+        zorder (float): zorder of the arrows
+
+    Returns:
+        int: Number of labels moved beyond the first ring
+    """
+    if len(texts) == 0:
+        return 0
+    deadline = time.perf_counter() + time_budget
+    # pylint: disable=protected-access
+    renderer = ax.figure._get_renderer()
+    # settle pending autoscaling so the data transform matches the drawn figure
+    ax.autoscale_view()
+    ax.apply_aspect()
+    to_display = ax.transData
+    to_data = ax.transData.inverted()
+    axes_box = ax.get_window_extent(renderer)
+    anchors = to_display.transform([text.get_position() for text in texts])
+    sizes = []
+    for text in texts:
+        text.set_ha("left")
+        text.set_va("bottom")
+        extent = text.get_window_extent(renderer)
+        sizes.append((extent.width, extent.height))
+    sizes = np.array(sizes)
+
+    points = _Grid(np.median(sizes[:, 1]) * 2)
+    point_boxes = _collection_boxes(objects, ax)
+    for box in point_boxes:
+        points.add(box)
+    labels = _Grid(points.cell_size)
+    # start the first ring clear of a typical marker around the anchor
+    marker_radius = np.median([box[2] - box[0] for box in point_boxes]) / 2 if point_boxes else 0
+
+    moved = 0
+    for text, (x, y), (width, height) in zip(texts, anchors, sizes):
+        best, best_cost, best_ring = None, np.inf, 0
+        rings = max_rings if time.perf_counter() < deadline else 1
+        for ring in range(1, rings + 1):
+            step = marker_radius + padding + (ring - 1) * (height + padding)
+            for dx, dy in _DIRECTIONS:
+                x0 = x + dx * step - (width if dx < 0 else width / 2 if dx == 0 else 0)
+                y0 = y + dy * step - (height if dy < 0 else height / 2 if dy == 0 else 0)
+                box = (x0, y0, x0 + width, y0 + height)
+                outside = (
+                    max(axes_box.x0 - box[0], 0)
+                    + max(box[2] - axes_box.x1, 0)
+                    + max(axes_box.y0 - box[1], 0)
+                    + max(box[3] - axes_box.y1, 0)
+                )
+                # overlapping another label is much worse than covering a point
+                cost = 10 * labels.overlap(box) + points.overlap(box) + outside * height
+                if cost < best_cost:
+                    best, best_cost, best_ring = box, cost, ring
+                if best_cost == 0:
+                    break
+            if best_cost == 0:
+                break
+        labels.add(best)
+        text.set_position(to_data.transform((best[0], best[1])))
+        if best_ring > 1:
+            moved += 1
+            if arrowprops is not None:
+                centre = to_data.transform(((best[0] + best[2]) / 2, (best[1] + best[3]) / 2))
+                ax.annotate(
+                    "",
+                    xy=to_data.transform((x, y)),
+                    xytext=centre,
+                    arrowprops=arrowprops,
+                    zorder=zorder,
+                )
+    return moved
+
+
+def place_labels_adjust_text(
+    ax: Axes,
+    texts: Sequence[Text],
+    objects: Optional[Any] = None,
+    arrowprops: Optional[Dict[str, Any]] = None,
+    time_budget: Optional[float] = None,
+    zorder: float = 29,
+    **kwargs,
+) -> int:
+    """
+    Function that places the labels with adjustText
+
+    Args:
+        ax (Axes): Axes the texts are drawn on
+        texts (Sequence[Text]): Texts positioned at their anchor points
+        objects (Any, optional): Artists the labels avoid
+        arrowprops (Dict[str, Any], optional): Arrows from the anchors to moved labels
+        time_budget (float, optional): Passed to adjust_text as time_lim.  Defaults to
+            adjustText's own limit
+        zorder (float): zorder of the arrows
+        kwargs: Additional keyword arguments of adjust_text
+
+    Returns:
+        int: Number of arrows drawn
+    """
+    if len(texts) == 0:
+        return 0
+    options = dict(only_move={"text": "xy"}, ensure_inside_axes=True, avoid_self=True)
+    if time_budget is not None:
+        options["time_lim"] = time_budget
+    options.update(kwargs)
+    _, patches = adjust_text(
+        list(texts), ax=ax, objects=objects, arrowprops=arrowprops, zorder=zorder, **options
+    )
+    return len(patches) if patches is not None else 0
+
+
+LABEL_PLACERS: Dict[str, Callable[..., int]] = {
+    "greedy": place_labels_greedy,
+    "adjust_text": place_labels_adjust_text,
+}
+
+
+def place_labels(method: str, ax: Axes, texts: Sequence[Text], **kwargs) -> int:
+    """
+    Function that places labels with one of the LABEL_PLACERS
+
+    Args:
+        method (str): "greedy" for the fast placer or "adjust_text" for the slower but
+            higher quality one
+        ax (Axes): Axes the texts are drawn on
+        texts (Sequence[Text]): Texts positioned at their anchor points
+        kwargs: Keyword arguments of the placer
+
+    Returns:
+        int: As returned by the placer
+    """
+    if method not in LABEL_PLACERS:
+        raise ValueError(f"Unknown label placement {method!r}, use one of {list(LABEL_PLACERS)}")
+    return LABEL_PLACERS[method](ax, texts, **kwargs)
@@ -0,0 +1,147 @@
+"""
+Vectorized lineup and minutes played helpers shared by the match and player dashboards.
+
+The functions take the substitution event types as arguments so that they work with both
+the footmav and the footballmodels EventType enums.
+"""
+
+from typing import Any, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def substitution_minutes(
+    data: pd.DataFrame, sub_on_type: Any, sub_off_type: Any, keys: Sequence[str]
+) -> pd.DataFrame:
+    """
+    Function that finds the minute of the first substitution on and off within each group
+
+    Args:
+        data (pd.DataFrame): Event data
+        sub_on_type (Any): EventType member for a substitution on
+        sub_off_type (Any): EventType member for a substitution off
+        keys (Sequence[str]): Columns to group by, eg ["player_name"] or ["matchId", "period"]
+
+    Returns:
+        pd.DataFrame: Indexed by keys, with sub_on_minute and sub_off_minute columns that
+            are NaN for groups without that substitution
+    """
+    keys = list(keys)
+    is_on = data["event_type"] == sub_on_type
+    is_off = data["event_type"] == sub_off_type
+    return pd.concat(
+        [
+            data.loc[is_on].groupby(keys, sort=False)["minute"].first().rename("sub_on_minute"),
+            data.loc[is_off].groupby(keys, sort=False)["minute"].first().rename("sub_off_minute"),
+        ],
+        axis=1,
+    )
+
+
+def substitutions(data: pd.DataFrame, sub_on_type: Any, sub_off_type: Any) -> pd.DataFrame:
+    """
+    Function that pairs every substitution on with the substitution off it belongs to,
+    using a single merge of the off events' relatedEventId onto the on events' eventId
+    within the same team (and match if there is a matchId column)
+
+    Args:
+        data (pd.DataFrame): Event data
+        sub_on_type (Any): EventType member for a substitution on
+        sub_off_type (Any): EventType member for a substitution off
+
+    Returns:
+        pd.DataFrame: One row per substitution on, in the order they appear in data, with
+            player_on, player_off (NaN if the off event is missing), teamId and minute
+    """
+    keys = ["teamId"] + (["matchId"] if "matchId" in data.columns else [])
+    sub_on = data.loc[
+        data["event_type"] == sub_on_type, ["eventId", "player_name", "minute"] + keys
+    ]
+    sub_off = data.loc[
+        data["event_type"] == sub_off_type, ["relatedEventId", "player_name"] + keys
+    ].dropna(subset=["relatedEventId"])
+    sub_off = sub_off.rename(columns={"relatedEventId": "eventId", "player_name": "player_off"})
+    sub_off["eventId"] = sub_off["eventId"].astype(sub_on["eventId"].dtype)
+    paired = sub_off.drop_duplicates(["eventId"] + keys).merge(
+        sub_on.rename(columns={"player_name": "player_on"}), on=["eventId"] + keys, how="right"
+    )
+    return paired[["player_on", "player_off", "minute"] + keys].reset_index(drop=True)
+
+
+def player_minutes(
+    data: pd.DataFrame, sub_on_type: Any, sub_off_type: Any, full_time: float = None
+) -> pd.DataFrame:
+    """
+    Function that works out when every player in a single match started and stopped playing
+
+    Args:
+        data (pd.DataFrame): Event data for a single match
+        sub_on_type (Any): EventType member for a substitution on
+        sub_off_type (Any): EventType member for a substitution off
+        full_time (float, optional): Final minute of the match.  Defaults to the last
+            minute in the data
+
+    Returns:
+        pd.DataFrame: Indexed by player_name in order of first appearance, with
+            sub_on_minute, sub_off_minute (NaN if not substituted), start_minute,
+            end_minute and minutes
+    """
+    full_time = data["minute"].max() if full_time is None else full_time
+    players = pd.Index(data["player_name"].dropna().unique(), name="player_name")
+    table = substitution_minutes(data, sub_on_type, sub_off_type, ["player_name"]).reindex(players)
+    table["start_minute"] = table["sub_on_minute"].fillna(0)
+    table["end_minute"] = table["sub_off_minute"].fillna(full_time)
+    if pd.api.types.is_integer_dtype(data["minute"]) and float(full_time).is_integer():
+        table = table.astype({"start_minute": int, "end_minute": int})
+    table["minutes"] = table["end_minute"] - table["start_minute"]
+    return table
+
+
+def insert_substitutes(names: Sequence[str], subs: pd.DataFrame) -> List[str]:
+    """
+    Function that lists each player followed by the substitute who replaced them
+
+    Args:
+        names (Sequence[str]): Players in display order, usually the starters
+        subs (pd.DataFrame): Output of substitutions
+
+    Returns:
+        List[str]: names with every replacement inserted after the player they replaced
+    """
+    paired = subs.dropna(subset=["player_off"])
+    replaced_by = dict(zip(paired["player_off"], paired["player_on"]))
+    ordered = []
+    for name in names:
+        ordered.append(name)
+        if name in replaced_by:
+            ordered.append(replaced_by[name])
+    return ordered
+
+
+def minutes_in_periods(
+    data: pd.DataFrame, sub_on_type: Any, sub_off_type: Any, period_length: float = 45
+) -> float:
+    """
+    Function that totals the minutes played by one player over several matches, from
+    that player's own events and a max_minute column holding the last minute of each
+    period
+
+    Args:
+        data (pd.DataFrame): Events of a single player with matchId, period and max_minute
+        sub_on_type (Any): EventType member for a substitution on
+        sub_off_type (Any): EventType member for a substitution off
+        period_length (float): Nominal length of a period, used for where periods start
+
+    Returns:
+        float: Total minutes played
+    """
+    keys = ["matchId", "period"]
+    periods = data.groupby(keys)["max_minute"].max().to_frame()
+    periods = periods.join(substitution_minutes(data, sub_on_type, sub_off_type, keys))
+    period_start = (periods.index.get_level_values("period").to_numpy() - 1) * period_length
+    start = np.maximum(periods["sub_on_minute"].fillna(0).to_numpy(), period_start)
+    end = np.minimum(
+        periods["sub_off_minute"].fillna(10000).to_numpy(), periods["max_minute"].fillna(0)
+    )
+    return (end - start).sum()
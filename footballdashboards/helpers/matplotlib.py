@@ -1,7 +1,27 @@
 """
 Various utility helper functions for matplotlib
 """
+from io import BytesIO
+from typing import Dict, Iterable, Optional, Tuple, Type, Union
+import numpy as np
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PathCollection, PolyCollection, QuadMesh
+from matplotlib.contour import ContourSet
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from PIL import Image
+
+VECTOR_FORMATS = ("svg", "svgz", "pdf", "eps", "ps")
+
+# artist types of the layers that can be rasterized inside vector output
+RASTER_LAYERS: Dict[str, Tuple[Type[Artist], ...]] = {
+    "scatter": (PathCollection,),
+    "lines": (LineCollection, Line2D),
+    "kde": (ContourSet, PolyCollection),
+    "mesh": (QuadMesh,),
+}
 
 
 def get_aspect(ax: Axes) -> float:
@@ -19,3 +39,130 @@ def get_aspect(ax: Axes) -> float:
     left_bottom, right_top = ax.get_position() * ax.figure.get_size_inches()
     width, height = right_top - left_bottom
     return height / width * ax.get_data_ratio()
+
+
+def figure_to_bytes(fig: Figure, fmt: str = "png", dpi: Optional[float] = None, **kwargs) -> bytes:
+    """
+    Save a figure straight to an in-memory image
+
+    Args:
+        fig (Figure): matplotlib figure
+        fmt (str): Image format understood by savefig, eg "png" or "svg"
+        dpi (float, optional): Resolution of raster output. Defaults to the figure dpi
+        kwargs: Additional keyword arguments passed to savefig
+
+    Returns:
+        bytes: Encoded image
+    """
+    buffer = BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi or fig.dpi, **kwargs)
+    return buffer.getvalue()
+
+
+def _artist_size(artist: Artist) -> int:
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata())
+    if isinstance(artist, ContourSet):
+        return sum(len(path.vertices) for path in artist.get_paths())
+    if isinstance(artist, QuadMesh):
+        return artist.get_array().size if artist.get_array() is not None else 0
+    # a scatter shares one marker path between all of its offsets
+    return max(len(artist.get_paths()), len(artist.get_offsets()))
+
+
+def rasterize_layers(fig: Figure, layers: Iterable[str], min_size: int = 100) -> int:
+    """
+    Function that marks the dense artists of a figure as rasterized, so that vector output
+    embeds them as one image each instead of thousands of paths.  Raster output is
+    unaffected.
+
+    Args:
+        fig (Figure): matplotlib figure
+        layers (Iterable[str]): Names from RASTER_LAYERS, eg ["scatter", "kde"]
+        min_size (int): Only rasterize artists with at least this many points, paths or
+            cells
+
+    Returns:
+        int: Number of artists rasterized
+    """
+    layers = list(layers)
+    unknown = set(layers) - set(RASTER_LAYERS)
+    if unknown:
+        raise ValueError(f"Unknown layers {sorted(unknown)}, use some of {list(RASTER_LAYERS)}")
+    types = tuple(artist_type for layer in layers for artist_type in RASTER_LAYERS[layer])
+    count = 0
+    for artist in fig.findobj(lambda artist: isinstance(artist, types)):
+        if _artist_size(artist) >= min_size:
+            artist.set_rasterized(True)
+            count += 1
+    return count
+
+
+def figure_to_rgba(fig: Figure, dpi: Optional[float] = None) -> np.ndarray:
+    """
+    Draw a figure with the Agg canvas and return its pixels without encoding them
+
+    Args:
+        fig (Figure): matplotlib figure
+        dpi (float, optional): Resolution. Defaults to the figure dpi
+
+    Returns:
+        np.ndarray: (height, width, 4) uint8 view of the canvas buffer
+    """
+    original_dpi = fig.dpi
+    if dpi is not None:
+        fig.set_dpi(dpi)
+    try:
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())
+    finally:
+        fig.set_dpi(original_dpi)
+
+
+def render_figure(
+    fig: Figure,
+    fmt: str = "png",
+    dpi: Optional[float] = None,
+    rasterize: Optional[Iterable[str]] = None,
+    optimize: bool = False,
+    quality: Optional[int] = None,
+    **kwargs,
+) -> Union[bytes, memoryview]:
+    """
+    Render a figure to an in-memory image
+
+    Args:
+        fig (Figure): matplotlib figure
+        fmt (str): "rgba" for the raw Agg buffer, "webp", or any format savefig supports
+        dpi (float, optional): Resolution of raster output. Defaults to the figure dpi
+        rasterize (Iterable[str], optional): Layers to rasterize in vector output, see
+            rasterize_layers
+        optimize (bool): Encode png with Pillow's optimizer, smaller but slower
+        quality (int, optional): webp quality, 1-100.  Defaults to lossless
+        kwargs: Additional keyword arguments passed to savefig.  For optimized png and
+            webp the figure is saved as png first and then re-encoded by Pillow
+
+    Returns:
+        Union[bytes, memoryview]: Encoded image, or a memoryview of the (height, width, 4)
+            uint8 canvas for "rgba"
+    """
+    fmt = fmt.lower()
+    if rasterize:
+        rasterize_layers(fig, rasterize)
+    if fmt == "rgba":
+        return memoryview(figure_to_rgba(fig, dpi))
+    if fmt == "webp" or (fmt == "png" and optimize):
+        if kwargs:
+            # savefig options such as bbox_inches or transparent change the pixels
+            image = Image.open(BytesIO(figure_to_bytes(fig, fmt="png", dpi=dpi, **kwargs)))
+        else:
+            image = Image.fromarray(figure_to_rgba(fig, dpi))
+        buffer = BytesIO()
+        if fmt == "webp":
+            options = {"lossless": True} if quality is None else {"quality": quality}
+            image.save(buffer, format="WEBP", **options)
+        else:
+            image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+    return figure_to_bytes(fig, fmt=fmt, dpi=dpi, **kwargs)
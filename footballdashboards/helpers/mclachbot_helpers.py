@@ -2,18 +2,59 @@
 Helpers for getting data from the mclachbot API
 """
 
-from typing import Any
-from urllib.request import urlopen
+from io import BytesIO
+from typing import Any, Optional
 from PIL import Image
 from urllib.error import HTTPError
 import requests
 import json
 import os
+from footballdashboards.helpers.image_cache import ImageAsset, ImageCache, CACHE_DIR_ENV_VAR
+
+# Shared by every badge service and logo helper so that repeat renders in the same
+# process (or processes sharing FOOTBALLDASHBOARDS_CACHE_DIR) do no network I/O.
+image_cache = ImageCache(cache_dir=os.environ.get(CACHE_DIR_ENV_VAR))
+
+BALL_LOGO_URL = "http://www.mclachbot.com/site/img/ball_logo.png"
+BALL_LOGO2_URL = "http://www.mclachbot.com/site/img/mclachbot_logo.png"
 
 
 class McLachBotBadgeService:
     url = "http://www.mclachbot.com:9000"
 
+    def __init__(self, cache: Optional[ImageCache] = None):
+        self.cache = cache or image_cache
+
+    def league_badge_asset(self, league: str) -> ImageAsset:
+        """
+        Get the cache key and url of a league badge, for prefetching
+
+        Args:
+            league (str): League to get the image for
+
+        Returns:
+            ImageAsset: Asset for the league badge
+        """
+        league = league.replace(" ", "%20")
+        return ImageAsset(("league_badge", league), f"{self.url}/league_badge_download/{league}")
+
+    def team_badge_asset(self, league: str, team: str) -> ImageAsset:
+        """
+        Get the cache key and url of a team badge, for prefetching
+
+        Args:
+            league (str): League to get the image for
+            team (str): Team to get the image for
+
+        Returns:
+            ImageAsset: Asset for the team badge
+        """
+        league = league.replace(" ", "%20")
+        team = team.replace(" ", "%20")
+        return ImageAsset(
+            ("team_badge", league, team), f"{self.url}/badge_download/{league}/{team}"
+        )
+
     def league_badge(self, league: str) -> Image:
         """
         Get the imagine for a league from the sportsdb API
@@ -25,13 +66,15 @@ class McLachBotBadgeService:
             Image: Image of the league badge
 
         """
+        asset = self.league_badge_asset(league)
         league = league.replace(" ", "%20")
-
-        url = f"{self.url}/league_badge_download/{league}"
         try:
-            return Image.open(urlopen(url))
+            content = self.cache.fetch(*asset)
         except HTTPError as exc:
             raise ValueError(f"League {league} not found") from exc
+        if content is None:
+            raise ValueError(f"League {league} not found")
+        return Image.open(BytesIO(content))
 
     def team_badge(self, league: str, team: str) -> Image:
         """
@@ -45,47 +88,81 @@ class McLachBotBadgeService:
             Image: Image of the team badge
 
         """
+        asset = self.team_badge_asset(league, team)
         league = league.replace(" ", "%20")
         team = team.replace(" ", "%20")
-
-        url = f"{self.url}/badge_download/{league}/{team}"
         try:
-            return Image.open(urlopen(url))
+            content = self.cache.fetch(*asset)
         except HTTPError as exc:
             raise ValueError(f"Team {team} not found in league {league}") from exc
+        if content is None:
+            raise ValueError(f"Team {team} not found in league {league}")
+        return Image.open(BytesIO(content))
 
 
-def get_ball_logo(url: str = "http://www.mclachbot.com/site/img/ball_logo.png") -> Image:
+def get_ball_logo(url: str = BALL_LOGO_URL, cache: Optional[ImageCache] = None) -> Image:
     """
     Get the imagine for the ball logo from the sportsdb API
 
+    Args:
+        url (str): Url of the logo
+        cache (ImageCache, optional): Cache to read through.  Defaults to image_cache
+
     Returns:
         Image: Image of the ball logo
 
     """
-    return Image.open(urlopen(url))
+    return get_image(url, cache)
 
 
-def get_ball_logo2(url: str = "http://www.mclachbot.com/site/img/mclachbot_logo.png") -> Image:
+def get_ball_logo2(url: str = BALL_LOGO2_URL, cache: Optional[ImageCache] = None) -> Image:
     """
     Get the imagine for the ball logo from the sportsdb API
 
+    Args:
+        url (str): Url of the logo
+        cache (ImageCache, optional): Cache to read through.  Defaults to image_cache
+
     Returns:
         Image: Image of the ball logo
 
     """
-    return Image.open(urlopen(url))
+    return get_image(url, cache)
 
 
-def get_image(url: str) -> Image:
+def image_asset(url: str) -> ImageAsset:
+    """
+    Get the cache key and url of an arbitrary image, for prefetching
+
+    Args:
+        url (str): Url of the image
+
+    Returns:
+        ImageAsset: Asset for the image
+    """
+    return ImageAsset(("url", url), url)
+
+
+def get_image(url: str, cache: Optional[ImageCache] = None) -> Image:
     """
     Get the image
 
+    Args:
+        url (str): Url of the image
+        cache (ImageCache, optional): Cache to read through, eg the cache of the badge
+            service the dashboard prefetched into.  Defaults to image_cache
+
     Returns:
         Image: Image
 
     """
-    return Image.open(urlopen(url))
+    try:
+        content = (cache or image_cache).fetch(*image_asset(url))
+    except HTTPError as exc:
+        raise ValueError(f"Image {url} not found") from exc
+    if content is None:
+        raise ValueError(f"Image {url} not found")
+    return Image.open(BytesIO(content))
 
 
 class TeamColorHelper:
@@ -114,8 +191,9 @@ class TeamColorHelper:
 class CachedPlayerImageHelper:
     url = "http://www.mclachbot.com:9000"
 
-    def __init__(self, cache_dir: str = None):
+    def __init__(self, cache_dir: str = None, cache: Optional[ImageCache] = None):
         self.cache_dir = cache_dir
+        self.cache = cache or image_cache
 
     def _check_cached_dir(self) -> bool:
         if not self.cache_dir:
@@ -142,22 +220,39 @@ class CachedPlayerImageHelper:
             return None
         return Image.open(os.path.join(self.cache_dir, f"{player_id}.png"))
 
-    def _get_player_image(self, player_id: int, ws:bool=False) -> Any:
+    def player_image_asset(self, player_id: int, ws: bool = False) -> Optional[ImageAsset]:
+        """
+        Get the cache key and url of a player cutout, for prefetching
+
+        Args:
+            player_id (int): Id of the player
+            ws (bool): Whether the id is a whoscored id
+
+        Returns:
+            Optional[ImageAsset]: Asset for the cutout, or None if it is already in
+                this helper's cache directory
+        """
+        if self._check_cached_image(player_id):
+            return None
+        return self._player_image_asset(player_id, ws)
+
+    def _player_image_asset(self, player_id: int, ws: bool) -> ImageAsset:
         full_url = f"{self.url}/player_cutout/{player_id}"
         if ws:
             full_url += "?source=ws"
-        try:
-            r = requests.get(full_url)
-            if r.status_code == 200:
-                img = Image.open(urlopen(full_url))
-                if self._check_cached_dir():
-                    img.save(os.path.join(self.cache_dir, f"{player_id}.png"))
-                return img
-            else:
-                return None
+        return ImageAsset(("player_cutout", str(player_id), str(ws)), full_url)
 
+    def _get_player_image(self, player_id: int, ws:bool=False) -> Any:
+        try:
+            content = self.cache.fetch(*self._player_image_asset(player_id, ws))
         except HTTPError:
             return None
+        if content is None:
+            return None
+        img = Image.open(BytesIO(content))
+        if self._check_cached_dir():
+            img.save(os.path.join(self.cache_dir, f"{player_id}.png"))
+        return img
 
     def get_player_image(self, player_id: int, ws:bool=False) -> Any:
         if self._check_cached_image(player_id):
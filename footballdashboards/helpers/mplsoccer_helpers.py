@@ -4,12 +4,15 @@ Some helper functions for working with mplsoccer.  Some of these contained code
 
 from matplotlib.figure import Figure
 import numpy as np
-from mplsoccer.pitch import Pitch
-import numpy as np
+from mplsoccer import Pitch
+import pandas as pd
 from scipy.stats import binned_statistic_2d
-from scipy.ndimage import gaussian_filter, zoom
-from dataclasses import asdict
+from scipy.ndimage import correlate1d, zoom
+from dataclasses import fields
+from functools import lru_cache
+from typing import NamedTuple
 from mplsoccer.heatmap import _nan_safe, BinnedStatisticResult
+from footballdashboards.helpers.figure_templates import cached_figure, pitch_key
 
 
 def get_ax_size(ax, fig):
@@ -35,7 +38,9 @@ def bin_statistic(
     """Calculates binned statistics using scipy.stats.binned_statistic_2d.
 
     This method automatically sets the range, changes the scipy defaults,
-    and outputs the grids and centers for plotting.
+    and outputs the grids and centers for plotting.  The grid for each pitch and
+    binning is cached in a PitchGrid, and 'count' and 'sum' use its np.bincount
+    fast path.
 
     The default statistic has been changed to count instead of mean.
     The default bins have been set to (5,4).
@@ -96,63 +101,397 @@ def bin_statistic(
     y = np.ravel(y)
     if x.size != y.size:
         raise ValueError("x and y must be the same size")
-    statistic = _nan_safe(statistic)
-    if (values is None) & (statistic == "count"):
-        values = x
-    if (values is None) & (statistic != "count"):
-        raise ValueError("values on which to calculate the statistic are missing")
-    if standardized:
-        pitch_range = [[0, 105], [0, 68]]
-    elif dim.invert_y:
-        pitch_range = [[dim.left, dim.right], [dim.top, dim.bottom]]
-        y = dim.bottom - y
-    else:
-        pitch_range = [[dim.left, dim.right], [dim.bottom, dim.top]]
-    statistic, x_edge, y_edge, binnumber = binned_statistic_2d(
-        x, y, values, statistic=statistic, bins=bins, range=pitch_range, expand_binnumbers=True
+    grid = PitchGrid.for_dim(dim, bins=bins, standardized=standardized, zoom_value=zoom_value)
+    return grid.bin_statistic(
+        x,
+        y,
+        values=values,
+        statistic=statistic,
+        normalize=normalize,
+        gaussian_filter_value=gaussian_filter_value,
     )
 
-    if gaussian_filter_value is not None:
-        statistic = gaussian_filter(statistic, gaussian_filter_value)
-    if zoom_value is not None:
-        statistic = zoom(statistic, zoom_value)
-        x_edge = np.linspace(x_edge[0], x_edge[-1], int(bins[0] * zoom_value) + 1)
-        y_edge = np.linspace(y_edge[0], y_edge[-1], int(bins[1] * zoom_value) + 1)
-        # Determine the bin indices in the new grid for each data point
-        x_bin_indices = np.digitize(x, x_edge) - 1  # `-1` to match zero-based indexing
-        y_bin_indices = np.digitize(y, y_edge) - 1
-        binnumber = np.array([x_bin_indices, y_bin_indices])
-
-    statistic = np.flip(statistic.T, axis=0)
-    if statistic.ndim == 3:
-        num_y, num_x, _ = statistic.shape
-    else:
-        num_y, num_x = statistic.shape
-    if normalize:
-        statistic = statistic / statistic.sum()
-    binnumber[1, :] = num_y - binnumber[1, :] + 1
-    x_grid, y_grid = np.meshgrid(x_edge, y_edge)
-    cx, cy = np.meshgrid(x_edge[:-1] + 0.5 * np.diff(x_edge), y_edge[:-1] + 0.5 * np.diff(y_edge))
-
-    if not dim.invert_y or standardized is not False:
-        y_grid = np.flip(y_grid, axis=0)
-        cy = np.flip(cy, axis=0)
-
-    # if outside the pitch set the bin number to minus one
-    # else zero index the results by removing one
-    mask_x_out = np.logical_or(binnumber[0, :] == 0, binnumber[0, :] == num_x + 1)
-    binnumber[0, mask_x_out] = -1
-    binnumber[0, ~mask_x_out] = binnumber[0, ~mask_x_out] - 1
-
-    mask_y_out = np.logical_or(binnumber[1, :] == 0, binnumber[1, :] == num_y + 1)
-    binnumber[1, mask_y_out] = -1
-    binnumber[1, ~mask_y_out] = binnumber[1, ~mask_y_out] - 1
-    inside = np.logical_and(~mask_x_out, ~mask_y_out)
-    return asdict(
-        BinnedStatisticResult(statistic, x_grid, y_grid, cx, cy, binnumber=binnumber, inside=inside)
+
+def bin_statistic_grouped(
+    data,
+    group_key,
+    dim,
+    x="x",
+    y="y",
+    values=None,
+    statistic="count",
+    bins=(5, 4),
+    normalize=False,
+    standardized=False,
+    gaussian_filter_value=None,
+    zoom_value=None,
+):
+    """
+    Function that bins the events of every team or player in a frame in one pass.  Use
+    instead of filtering the frame and calling bin_statistic once per group.
+
+    Args:
+        data (pd.DataFrame): Event data
+        group_key (str): Column identifying the groups, eg player_name
+        dim: mplsoccer pitch dimensions, eg pitch.dim
+        x (str): Column with the x coordinates
+        y (str): Column with the y coordinates
+        values (str, optional): Column to aggregate.  Ignored for count
+        statistic (str or callable): As for bin_statistic
+        bins (int or [int, int] or [array, array]): As for bin_statistic
+        normalize (bool): Whether to divide each group's statistic by its own total
+        standardized (bool): As for bin_statistic
+        gaussian_filter_value (float, optional): As for bin_statistic
+        zoom_value (float, optional): As for bin_statistic
+
+    Returns:
+        dict: As bin_statistic, with a (k, ny, nx) statistic and a groups array of the k
+            sorted group labels.  result["statistic"][list(result["groups"]).index(name)]
+            is the statistic of one group.
+    """
+    grid = PitchGrid.for_dim(dim, bins=bins, standardized=standardized, zoom_value=zoom_value)
+    return grid.bin_statistic_batched(
+        data[x],
+        data[y],
+        data[group_key],
+        values=None if values is None else data[values],
+        statistic=statistic,
+        normalize=normalize,
+        gaussian_filter_value=gaussian_filter_value,
     )
 
 
+def _bins_key(bins):
+    if np.isscalar(bins):
+        return bins
+    return tuple(b if np.isscalar(b) else tuple(np.asarray(b, dtype=float)) for b in bins)
+
+
+def _scipy_bin_numbers(values, edges):
+    """Bin numbers as computed by scipy.stats.binned_statistic_2d: one based, with 0 and
+    len(edges) for the outliers and values on the last edge counted in the last bin"""
+    numbers = np.digitize(values, edges)
+    decimal = int(-np.log10(np.diff(edges).min())) + 6
+    on_edge = (values >= edges[-1]) & (np.around(values, decimal) == np.around(edges[-1], decimal))
+    numbers[on_edge] -= 1
+    return numbers
+
+
+def _as_dict(result):
+    # dataclasses.asdict would deep copy the cached grids on every call
+    return {field.name: getattr(result, field.name) for field in fields(result)}
+
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+class PitchGrid:
+    """
+    A fixed binning of a pitch.  The bin edges, centers, meshgrids and gaussian kernels
+    are computed once and reused by every call, and count and sum statistics are
+    calculated with a single np.bincount over flat bin indices instead of
+    scipy.stats.binned_statistic_2d.  Other statistics fall back to scipy with the cached
+    edges.  The output is the same as bin_statistic.
+
+    Use PitchGrid.for_dim to share grids between calls.
+    """
+
+    FAST_STATISTICS = ("count", "sum")
+
+    def __init__(self, dim, bins=(5, 4), standardized=False, zoom_value=None):
+        """
+        Args:
+            dim: mplsoccer pitch dimensions, eg pitch.dim
+            bins (int or [int, int] or [array, array]): The bin specification, as for
+                bin_statistic
+            standardized (bool): Whether the x, y values are in the uefa (105m x 68m)
+                coordinates
+            zoom_value (float, optional): Zoom factor applied to the statistic
+        """
+        self.invert_y = bool(dim.invert_y) and not standardized
+        self.y_offset = dim.bottom if self.invert_y else None
+        if standardized:
+            pitch_range = [[0, 105], [0, 68]]
+        elif dim.invert_y:
+            pitch_range = [[dim.left, dim.right], [dim.top, dim.bottom]]
+        else:
+            pitch_range = [[dim.left, dim.right], [dim.bottom, dim.top]]
+        if np.isscalar(bins):
+            bins = [bins, bins]
+        self.x_edge, self.y_edge = [
+            _read_only(
+                np.linspace(low, high, edges + 1)
+                if np.isscalar(edges)
+                else np.asarray(edges, dtype=float)
+            )
+            for edges, (low, high) in zip(bins, pitch_range)
+        ]
+        self.zoom_value = zoom_value
+        x_edge, y_edge = self.x_edge, self.y_edge
+        if zoom_value is not None:
+            x_edge = np.linspace(x_edge[0], x_edge[-1], int(bins[0] * zoom_value) + 1)
+            y_edge = np.linspace(y_edge[0], y_edge[-1], int(bins[1] * zoom_value) + 1)
+        self.plot_x_edge, self.plot_y_edge = _read_only(x_edge), _read_only(y_edge)
+        x_grid, y_grid = np.meshgrid(x_edge, y_edge)
+        cx, cy = np.meshgrid(
+            x_edge[:-1] + 0.5 * np.diff(x_edge), y_edge[:-1] + 0.5 * np.diff(y_edge)
+        )
+        if not dim.invert_y or standardized is not False:
+            y_grid = np.flip(y_grid, axis=0)
+            cy = np.flip(cy, axis=0)
+        self.x_grid, self.y_grid = _read_only(x_grid), _read_only(y_grid)
+        self.cx, self.cy = _read_only(cx), _read_only(cy)
+        self._kernels = {}
+
+    @staticmethod
+    def for_dim(dim, bins=(5, 4), standardized=False, zoom_value=None) -> "PitchGrid":
+        """
+        Function that returns a shared PitchGrid for the pitch dimensions and binning
+
+        Args:
+            dim: mplsoccer pitch dimensions, eg pitch.dim
+            bins (int or [int, int] or [array, array]): The bin specification
+            standardized (bool): Whether the x, y values are in the uefa coordinates
+            zoom_value (float, optional): Zoom factor applied to the statistic
+
+        Returns:
+            PitchGrid: Cached grid
+        """
+        key = (dim.left, dim.right, dim.bottom, dim.top, bool(dim.invert_y))
+        return _cached_pitch_grid(key, _bins_key(bins), standardized, zoom_value)
+
+    @property
+    def shape(self):
+        """(ny, nx) of the statistic returned by bin_statistic"""
+        return self.cx.shape
+
+    def gaussian_kernel(self, sigma, truncate=4.0) -> np.ndarray:
+        """
+        Function that returns the cached 1d weights used by scipy.ndimage.gaussian_filter
+
+        Args:
+            sigma (float): Standard deviation of the gaussian kernel
+            truncate (float): Truncate the kernel at this many standard deviations
+
+        Returns:
+            np.ndarray: Read only correlation weights
+        """
+        key = (float(sigma), float(truncate))
+        if key not in self._kernels:
+            radius = int(truncate * float(sigma) + 0.5)
+            x = np.arange(-radius, radius + 1)
+            weights = np.exp(-0.5 / (sigma * sigma) * x**2)
+            self._kernels[key] = _read_only((weights / weights.sum())[::-1])
+        return self._kernels[key]
+
+    def smooth(self, statistic, sigma, axes=(0, 1)) -> np.ndarray:
+        """
+        Function that applies scipy.ndimage.gaussian_filter over axes with the cached kernel
+
+        Args:
+            statistic (np.ndarray): Array to smooth
+            sigma (float): Standard deviation of the gaussian kernel
+            axes (Sequence[int]): Axes to smooth along
+
+        Returns:
+            np.ndarray: Smoothed copy of statistic
+        """
+        if sigma <= 1e-15:
+            return statistic.copy()
+        weights = self.gaussian_kernel(sigma)
+        output = np.empty_like(statistic)
+        for axis in axes:
+            correlate1d(statistic, weights, axis, output, mode="reflect")
+            statistic = output
+        return output
+
+    def _prepare(self, x, y, values, statistic):
+        x = np.ravel(x)
+        y = np.ravel(y)
+        if x.size != y.size:
+            raise ValueError("x and y must be the same size")
+        if statistic == "count":
+            values = None
+        elif values is None:
+            raise ValueError("values on which to calculate the statistic are missing")
+        else:
+            values = np.ravel(values)
+        if self.invert_y:
+            y = self.y_offset - y
+        return x, y, values
+
+    def _is_fast(self, x, y, statistic):
+        sample_type = np.result_type(x, y)
+        return (
+            isinstance(statistic, str)
+            and statistic in self.FAST_STATISTICS
+            and (sample_type == np.float64 or not np.issubdtype(sample_type, np.floating))
+        )
+
+    def _binned(self, x, y, values, statistic, groups=None, n_groups=1):
+        """Statistic of shape (n_groups, nx, ny) with scipy's orientation and bin numbers"""
+        x_bin = _scipy_bin_numbers(x, self.x_edge)
+        y_bin = _scipy_bin_numbers(y, self.y_edge)
+        binnumber = np.array([x_bin, y_bin])
+        full_shape = (len(self.x_edge) + 1, len(self.y_edge) + 1)
+        if self._is_fast(x, y, statistic):
+            flat = np.ravel_multi_index((x_bin, y_bin), full_shape)
+            if groups is not None:
+                flat = flat + groups * (full_shape[0] * full_shape[1])
+            weights = None if values is None else np.nan_to_num(values, nan=0.0)
+            n_bins = n_groups * full_shape[0] * full_shape[1]
+            counts = np.bincount(flat, weights, minlength=n_bins)
+            result = counts.astype(np.float64).reshape((n_groups,) + full_shape)[:, 1:-1, 1:-1]
+        else:
+            statistic = _nan_safe(statistic)
+            if values is None:
+                values = x
+            group_codes = np.zeros(x.size, dtype=int) if groups is None else groups
+            result = np.stack(
+                [
+                    binned_statistic_2d(
+                        x[group_codes == code],
+                        y[group_codes == code],
+                        values[group_codes == code],
+                        statistic=statistic,
+                        bins=[self.x_edge, self.y_edge],
+                    ).statistic
+                    for code in range(n_groups)
+                ]
+            )
+        return result, binnumber
+
+    def _finish(self, statistic, x, y, binnumber, normalize, gaussian_filter_value):
+        """Smooth, zoom, flip and normalize a (k, nx, ny) statistic and tidy the binnumbers
+        the same way as bin_statistic"""
+        if gaussian_filter_value is not None:
+            statistic = self.smooth(statistic, gaussian_filter_value, axes=(1, 2))
+        if self.zoom_value is not None:
+            statistic = np.stack([zoom(group, self.zoom_value) for group in statistic])
+            binnumber = np.array(
+                [np.digitize(x, self.plot_x_edge) - 1, np.digitize(y, self.plot_y_edge) - 1]
+            )
+        statistic = np.flip(np.swapaxes(statistic, 1, 2), axis=1)
+        _, num_y, num_x = statistic.shape
+        if normalize:
+            statistic = statistic / statistic.sum(axis=(1, 2), keepdims=True)
+        binnumber[1, :] = num_y - binnumber[1, :] + 1
+        mask_x_out = np.logical_or(binnumber[0, :] == 0, binnumber[0, :] == num_x + 1)
+        binnumber[0, mask_x_out] = -1
+        binnumber[0, ~mask_x_out] = binnumber[0, ~mask_x_out] - 1
+        mask_y_out = np.logical_or(binnumber[1, :] == 0, binnumber[1, :] == num_y + 1)
+        binnumber[1, mask_y_out] = -1
+        binnumber[1, ~mask_y_out] = binnumber[1, ~mask_y_out] - 1
+        inside = np.logical_and(~mask_x_out, ~mask_y_out)
+        return statistic, binnumber, inside
+
+    def bin_statistic(
+        self, x, y, values=None, statistic="count", normalize=False, gaussian_filter_value=None
+    ) -> dict:
+        """
+        Function that calculates a binned statistic on this grid
+
+        Args:
+            x, y (array like): Locations of the events
+            values (array like, optional): Values to aggregate.  Ignored for count
+            statistic (str or callable): count and sum use the bincount fast path, anything
+                else accepted by bin_statistic goes through scipy
+            normalize (bool): Whether to divide the statistic by its total
+            gaussian_filter_value (float, optional): Standard deviation of the gaussian
+                smoothing
+
+        Returns:
+            dict: Same keys and values as bin_statistic
+        """
+        x, y, values = self._prepare(x, y, values, statistic)
+        result, binnumber = self._binned(x, y, values, statistic)
+        result, binnumber, inside = self._finish(
+            result, x, y, binnumber, normalize, gaussian_filter_value
+        )
+        return _as_dict(
+            BinnedStatisticResult(
+                result[0],
+                self.x_grid,
+                self.y_grid,
+                self.cx,
+                self.cy,
+                binnumber=binnumber,
+                inside=inside,
+            )
+        )
+
+    def bin_statistic_batched(
+        self,
+        x,
+        y,
+        groups,
+        values=None,
+        statistic="count",
+        normalize=False,
+        gaussian_filter_value=None,
+    ) -> dict:
+        """
+        Function that calculates the binned statistic of many teams or players at once, with
+        a single bincount for count and sum
+
+        Args:
+            x, y (array like): Locations of the events
+            groups (array like): Team, player or other label of every event
+            values (array like, optional): Values to aggregate.  Ignored for count
+            statistic (str or callable): As for bin_statistic
+            normalize (bool): Whether to divide each group's statistic by its own total
+            gaussian_filter_value (float, optional): Standard deviation of the gaussian
+                smoothing, applied to each group separately
+
+        Returns:
+            dict: As bin_statistic, but statistic has shape (k, ny, nx) with one slice per
+                group, in the order of a sorted 'groups' key.  Events with a missing
+                group are ignored.
+        """
+        x, y, values = self._prepare(x, y, values, statistic)
+        codes, labels = pd.factorize(np.ravel(groups), sort=True)
+        if codes.size != x.size:
+            raise ValueError("groups must be the same size as x and y")
+        keep = codes >= 0
+        if not keep.all():
+            x, y, codes = x[keep], y[keep], codes[keep]
+            values = None if values is None else values[keep]
+        result, binnumber = self._binned(x, y, values, statistic, codes, len(labels))
+        result, binnumber, inside = self._finish(
+            result, x, y, binnumber, normalize, gaussian_filter_value
+        )
+        result_dict = _as_dict(
+            BinnedStatisticResult(
+                result,
+                self.x_grid,
+                self.y_grid,
+                self.cx,
+                self.cy,
+                binnumber=binnumber,
+                inside=inside,
+            )
+        )
+        result_dict["groups"] = np.asarray(labels)
+        return result_dict
+
+
+class _GridDims(NamedTuple):
+    left: float
+    right: float
+    bottom: float
+    top: float
+    invert_y: bool
+
+
+@lru_cache(maxsize=64)
+def _cached_pitch_grid(dim_key, bins, standardized, zoom_value):
+    left, right, bottom, top, invert_y = dim_key
+    dim = _GridDims(left, right, bottom, top, invert_y)
+    return PitchGrid(dim, bins=bins, standardized=standardized, zoom_value=zoom_value)
+
+
 def make_grid(
     pitch: Pitch,
     figheight=9,
@@ -355,3 +694,19 @@ def make_grid(
         result_axes["endnote"] = ax_endnote
 
     return fig, result_axes
+
+
+def make_grid_template(pitch: Pitch, **kwargs):
+    """
+    Function that returns a copy of make_grid(pitch, **kwargs) from the figure template
+    cache, so the pitches are only drawn the first time a layout is used
+
+    Args:
+        pitch (Pitch): Pitch to draw on every pitch axes
+        **kwargs: Keyword arguments of make_grid
+
+    Returns:
+        Same as make_grid
+    """
+    key = ("make_grid", pitch_key(pitch), tuple(sorted(kwargs.items())))
+    return cached_figure(key, lambda: make_grid(pitch, **kwargs))
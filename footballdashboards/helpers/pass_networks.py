@@ -0,0 +1,79 @@
+"""
+Vectorized aggregation of pass networks, shared by the pass network dashboard and the
+match report.
+
+Nodes are the average location and number of touches of each player (or position).
+Edges are undirected: passes from A to B and from B to A are counted together, by
+factorizing both ends onto one sorted set of codes and ordering each pair with
+np.minimum / np.maximum.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def aggregate_nodes(
+    data: pd.DataFrame, key: str = "position", count_column: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Function that computes the average location and touch count of every node
+
+    Args:
+        data (pd.DataFrame): Touch events with x and y columns
+        key (str): Column identifying a node, eg position or player_name
+        count_column (str, optional): Count the non null values of this column as
+            touches.  Defaults to counting rows.
+
+    Returns:
+        pd.DataFrame: Indexed by key with x, y and touches columns
+    """
+    grouped = data.groupby(key)
+    nodes = grouped[["x", "y"]].mean()
+    nodes["touches"] = grouped[count_column].count() if count_column else grouped.size()
+    return nodes
+
+
+def aggregate_edges(
+    data: pd.DataFrame,
+    source: str = "position",
+    target: str = "pass_receiver_position",
+    value_column: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Function that counts the passes between every pair of nodes, regardless of direction,
+    with a single groupby on integer codes
+
+    Args:
+        data (pd.DataFrame): Completed passes
+        source (str): Column identifying the passer node
+        target (str): Column identifying the receiver node
+        value_column (str, optional): Column to average over the passes of each edge,
+            eg xT
+
+    Returns:
+        pd.DataFrame: One row per edge with player_1 < player_2, passes and, if
+            requested, the mean of value_column.  Sorted by player_1 then player_2.
+            Passes with a missing source or target are ignored.
+    """
+    n_passes = len(data)
+    codes, uniques = pd.factorize(
+        np.concatenate([data[source].to_numpy(), data[target].to_numpy()]), sort=True
+    )
+    source_codes, target_codes = codes[:n_passes], codes[n_passes:]
+    valid = (source_codes >= 0) & (target_codes >= 0)
+    edges = pd.DataFrame(
+        {
+            "player_1": np.minimum(source_codes, target_codes)[valid],
+            "player_2": np.maximum(source_codes, target_codes)[valid],
+        }
+    )
+    aggregations = {"passes": ("player_1", "size")}
+    if value_column is not None:
+        edges[value_column] = data[value_column].to_numpy()[valid]
+        aggregations[value_column] = (value_column, "mean")
+    edges = edges.groupby(["player_1", "player_2"]).agg(**aggregations).reset_index()
+    edges["player_1"] = np.asarray(uniques)[edges["player_1"].to_numpy()]
+    edges["player_2"] = np.asarray(uniques)[edges["player_2"].to_numpy()]
+    return edges
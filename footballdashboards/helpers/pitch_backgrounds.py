@@ -0,0 +1,189 @@
+"""
+Raster cache for pitch markings.
+
+Drawing a pitch adds dozens of line and patch artists to the axes, and every dashboard
+draws the same few pitch configurations over and over.  draw_pitch(..., raster=True)
+renders the markings of a pitch configuration once per pixel size into an RGBA image and
+places that image on the axes in later renders, so each pitch costs one artist.  The axes
+limits, aspect and background are still set by the pitch itself, so data is plotted
+exactly as on a vector pitch.
+
+Raster pitches are opt-in and only meant for bitmap output; pitches are drawn as vectors
+by default.  Dashboards turn them on with their raster_pitches field, and draw vector
+pitches anyway inside vector_pitches(), which Dashboard.render uses for SVG and PDF.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import BboxImage
+
+from footballdashboards.helpers.figure_templates import pitch_key
+
+MAX_BACKGROUNDS = 32
+
+_lock = threading.Lock()
+_backgrounds: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+# scoped to the current thread or task, so concurrent renders don't see each other's output
+_vector_only: ContextVar[bool] = ContextVar("vector_pitches", default=False)
+
+
+@contextmanager
+def vector_pitches():
+    """
+    Context manager that makes draw_pitch draw vector pitches inside the block, even when
+    called with raster=True, eg while plotting for SVG or PDF output.  Only affects the
+    current thread.
+    """
+    token = _vector_only.set(True)
+    try:
+        yield
+    finally:
+        _vector_only.reset(token)
+
+
+def clear_pitch_backgrounds():
+    """
+    Function that drops every cached pitch image
+    """
+    with _lock:
+        _backgrounds.clear()
+
+
+def _can_rasterize(pitch: Any) -> bool:
+    # grass and stripes are drawn as artists under the data, which one image at the line
+    # zorder can't reproduce
+    return (
+        getattr(pitch, "pitch_color", None) != "grass"
+        and not getattr(pitch, "stripe", False)
+        and hasattr(pitch, "_set_axes")
+        and hasattr(pitch, "_set_background")
+    )
+
+
+def _set_limits(ax: Axes, xlim: Optional[Tuple[float, float]], ylim: Optional[Tuple[float, float]]):
+    if xlim is not None:
+        ax.set_xlim(xlim)
+    if ylim is not None:
+        ax.set_ylim(ylim)
+
+
+def _render_markings(
+    pitch: Any, width: int, height: int, dpi: float, xlim=None, ylim=None
+) -> np.ndarray:
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    fig.patch.set_alpha(0)
+    ax = fig.add_axes((0, 0, 1, 1))
+    pitch.draw(ax=ax)
+    _set_limits(ax, xlim, ylim)
+    ax.patch.set_visible(False)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    image = np.asarray(canvas.buffer_rgba()).copy()
+    image.setflags(write=False)
+    return image
+
+
+def pitch_background(
+    pitch: Any,
+    width: int,
+    height: int,
+    dpi: float = 100,
+    xlim: Optional[Tuple[float, float]] = None,
+    ylim: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
+    """
+    Function that returns the cached RGBA image of the markings of a pitch
+
+    Args:
+        pitch (Any): mplsoccer Pitch or VerticalPitch
+        width (int): Width of the image in pixels
+        height (int): Height of the image in pixels
+        dpi (float): Resolution the markings are rendered at, which sets the line widths
+        xlim (Tuple[float, float], optional): x limits to show instead of the whole pitch
+        ylim (Tuple[float, float], optional): y limits to show instead of the whole pitch
+
+    Returns:
+        np.ndarray: Read only (height, width, 4) uint8 image with a transparent background
+    """
+    xlim = None if xlim is None else tuple(xlim)
+    ylim = None if ylim is None else tuple(ylim)
+    key = (pitch_key(pitch), width, height, dpi, xlim, ylim)
+    with _lock:
+        image = _backgrounds.get(key)
+        if image is not None:
+            _backgrounds.move_to_end(key)
+            return image
+    image = _render_markings(pitch, width, height, dpi, xlim, ylim)
+    with _lock:
+        _backgrounds[key] = image
+        while len(_backgrounds) > MAX_BACKGROUNDS:
+            _backgrounds.popitem(last=False)
+    return image
+
+
+class _PitchImage(BboxImage):
+    """
+    Image of the markings of a pitch that fills its axes.  The image is taken from the
+    cache at every draw, at the pixel size and dpi of the renderer, so saving at another
+    dpi than the figure dpi gives sharp markings of the right width.
+    """
+
+    def __init__(self, pitch: Any, ax: Axes, xlim=None, ylim=None):
+        super().__init__(ax.bbox, zorder=pitch.line_zorder, interpolation="none")
+        self._pitch = pitch
+        self._ax = ax
+        self._xlim = xlim
+        self._ylim = ylim
+        self._rendered_key = None
+
+    def draw(self, renderer, *args, **kwargs):
+        width = max(int(round(self._ax.bbox.width)), 1)
+        height = max(int(round(self._ax.bbox.height)), 1)
+        key = (width, height, renderer.dpi)
+        # setting the same data again would mark the figure stale after every draw
+        if key != self._rendered_key:
+            self.set_data(
+                pitch_background(self._pitch, width, height, renderer.dpi, self._xlim, self._ylim)
+            )
+            self._rendered_key = key
+        super().draw(renderer, *args, **kwargs)
+
+
+def draw_pitch(
+    pitch: Any,
+    ax: Axes,
+    raster: bool = False,
+    xlim: Optional[Tuple[float, float]] = None,
+    ylim: Optional[Tuple[float, float]] = None,
+):
+    """
+    Function that draws a pitch on ax, from the raster cache where possible.  The image is
+    rendered for the axes at draw time, so pass any zoomed limits as xlim/ylim rather than
+    setting them afterwards.
+
+    Args:
+        pitch (Any): mplsoccer Pitch or VerticalPitch
+        ax (Axes): Axes to draw on
+        raster (bool): Whether to draw the markings from the raster cache.  Only use for
+            bitmap output, SVG and PDF output would embed the pitch as an image.  Ignored
+            inside vector_pitches()
+        xlim (Tuple[float, float], optional): x limits to show instead of the whole pitch
+        ylim (Tuple[float, float], optional): y limits to show instead of the whole pitch
+    """
+    if not raster or _vector_only.get() or not _can_rasterize(pitch):
+        pitch.draw(ax=ax)
+        _set_limits(ax, xlim, ylim)
+        return
+    # pylint: disable=protected-access
+    pitch._set_axes(ax)
+    pitch._set_background(ax)
+    _set_limits(ax, xlim, ylim)
+    ax.add_artist(_PitchImage(pitch, ax, xlim, ylim))
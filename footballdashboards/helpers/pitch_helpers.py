@@ -7,6 +7,7 @@ from footmav.data_definitions.whoscored.constants import EventType
 from matplotlib.lines import Line2D
 from footballdashboards.helpers.fonts import font_normal
 from footballdashboards.helpers.pass_type_definitions import PassTypeDefinition
+from footballdashboards.helpers.event_types import event_type_codes, event_type_value
 import matplotlib.patheffects as path_effects
 from footballdashboards.helpers.event_definitions import (
     defensive_events,
@@ -125,9 +126,9 @@ def plot_positional_heatmap_on_pitch(
     scatter_color: str = "blue",
     cmap="hot",
 ):
-    passes_mask = (data["event_type"] == EventType.Pass) & (
-        ~WF.col_has_qualifier(data, qualifier_code=107)
-    )
+    passes = data.loc[
+        (data["event_type"] == EventType.Pass) & (~WF.col_has_qualifier(data, qualifier_code=107))
+    ]
 
     path_eff = [
         path_effects.Stroke(linewidth=3, foreground="white"),
@@ -135,16 +136,16 @@ def plot_positional_heatmap_on_pitch(
     ]
 
     bin_statistic = pitch.bin_statistic_positional(
-        data.loc[passes_mask].x,
-        data.loc[passes_mask].y,
+        passes.x,
+        passes.y,
         statistic="count",
         positional="full",
         normalize=True,
     )
     pitch.heatmap_positional(bin_statistic, ax=ax, cmap=cmap, edgecolors=base_edge_color)
     pitch.scatter(
-        data.loc[passes_mask].x,
-        data.loc[passes_mask].y,
+        passes.x,
+        passes.y,
         c=scatter_color,
         s=2,
         ax=ax,
@@ -174,7 +175,7 @@ def apply_event_plot(
     """Apply the event plot to the axes"""
 
     sub_data = data.loc[
-        (data["event_type"] == event_definition.event_type)
+        (event_type_codes(data["event_type"]) == event_type_value(event_definition.event_type))
         & (data["outcomeType"] == event_definition.outcome_type)
     ]
 
@@ -203,6 +204,9 @@ def draw_defensive_events_on_axes(
     base_edge_color: str,
 ):
     """Draw defensive events on the axes"""
+    # compare integer codes rather than enum objects in each of the event filters, so the
+    # enum column is only converted once
+    data = data[["x", "y", "outcomeType"]].assign(event_type=event_type_codes(data["event_type"]))
     for event_type in defensive_events:
         apply_event_plot(pitch, ax, data, event_type, base_size, base_color, base_edge_color)
 
@@ -0,0 +1,85 @@
+"""
+Vectorized assignment of events to rectangular zones of the pitch.
+
+PitchZones stores the bounds of every zone as NumPy arrays and classifies all events with
+one broadcasted containment test.  An event inside several zones is assigned to the first
+one, in the order the zones were given.
+"""
+
+from typing import Hashable, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+Corners = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+class PitchZones:
+    """
+    Classifier of x, y locations into named rectangles given by two opposite corners.
+    Rectangles are closed, so locations on an edge are inside.
+    """
+
+    def __init__(self, zones: Mapping[Hashable, Corners], default: Hashable = ""):
+        """
+        Args:
+            zones (Mapping[Hashable, Corners]): Zone name -> ((x1, y1), (x2, y2)), in
+                priority order
+            default (Hashable): Name given to locations outside every zone
+        """
+        if len(zones) == 0:
+            raise ValueError("PitchZones needs at least one zone")
+        corners = np.array([np.asarray(value, dtype=float) for value in zones.values()])
+        if corners.shape[1:] != (2, 2):
+            raise ValueError("Every zone must be given as ((x1, y1), (x2, y2))")
+        self.names = np.empty(len(zones) + 1, dtype=object)
+        self.names[:-1] = list(zones)
+        self.names[-1] = default
+        self.x_min, self.y_min = corners.min(axis=1).T
+        self.x_max, self.y_max = corners.max(axis=1).T
+
+    def __len__(self) -> int:
+        return len(self.names) - 1
+
+    def codes(
+        self, x: Union[Sequence[float], np.ndarray], y: Union[Sequence[float], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Function that finds the index of the first zone containing each location
+
+        Args:
+            x (array like): x coordinates
+            y (array like): y coordinates
+
+        Returns:
+            np.ndarray: Zone index of every location, len(self) for no zone
+        """
+        x = np.asarray(x, dtype=float)[:, np.newaxis]
+        y = np.asarray(y, dtype=float)[:, np.newaxis]
+        inside = (x >= self.x_min) & (x <= self.x_max) & (y >= self.y_min) & (y <= self.y_max)
+        # argmax finds the first True, the extra column catches locations in no zone
+        inside = np.concatenate([inside, np.ones((inside.shape[0], 1), dtype=bool)], axis=1)
+        return inside.argmax(axis=1)
+
+    def classify(
+        self, x: Union[Sequence[float], np.ndarray], y: Union[Sequence[float], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Function that names the first zone containing each location
+
+        Args:
+            x (array like): x coordinates
+            y (array like): y coordinates
+
+        Returns:
+            np.ndarray: Zone name of every location, the default for no zone
+        """
+        return self.names[self.codes(x, y)]
+
+    def centers(self) -> np.ndarray:
+        """
+        Function that returns the middle of every zone
+
+        Returns:
+            np.ndarray: (len(self), 2) array of x, y centers
+        """
+        return np.column_stack([(self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2])
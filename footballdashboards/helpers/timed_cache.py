@@ -0,0 +1,173 @@
+"""
+Time limited LRU cache for data loading functions that take a single config dict, eg the
+database queries of the player maps.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+import pandas as pd
+
+from footballdashboards.helpers.data_accessors import normalize_kwargs_value
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    expired: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: Optional[int]
+
+
+def _size_of(data: Any) -> int:
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=True).sum())
+    return sys.getsizeof(data)
+
+
+class TimedCache:
+    """
+    Decorator for functions that take a single config dict.  Results are kept for
+    `timeout` seconds in an LRU bounded by number of entries and optionally by total
+    size.  Keys ignore dict ordering and the values of secret keys such as db_password.
+    Concurrent callers missing on the same key wait for a single call of the function.
+
+    Args:
+        timeout (int): Lifetime of a result in seconds
+        max_entries (int): Maximum number of results kept
+        max_bytes (int, optional): Maximum total size of the results kept
+        secret_keys (Iterable[str]): Config keys left out of the cache key
+    """
+
+    def __init__(
+        self,
+        timeout: int,
+        max_entries: int = 64,
+        max_bytes: Optional[int] = None,
+        secret_keys: Iterable[str] = ("db_password",),
+    ):
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.secret_keys = frozenset(secret_keys)
+        self.cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._in_flight: Dict[Any, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+
+    def make_key(self, config: Dict[str, Any]) -> Any:
+        """
+        Function that builds the cache key of a config
+
+        Args:
+            config (Dict[str, Any]): Config passed to the decorated function
+
+        Returns:
+            Any: Hashable key, independent of dict ordering and of the secret keys
+        """
+        return normalize_kwargs_value(
+            {k: v for k, v in config.items() if k not in self.secret_keys}
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Function that returns the cache counters and limits
+
+        Returns:
+            CacheInfo: hits, misses, expired, evictions, entries, bytes, max_entries and
+                max_bytes
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._expired,
+                self._evictions,
+                len(self.cache),
+                self._bytes,
+                self.max_entries,
+                self.max_bytes,
+            )
+
+    def cache_clear(self):
+        """
+        Function that empties the cache and resets the counters
+        """
+        with self._lock:
+            self.cache.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._expired = self._evictions = 0
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(config: Dict[str, Any]):
+            key = self.make_key(config)
+            while True:
+                with self._lock:
+                    entry = self._get(key)
+                    if entry is not None:
+                        self._hits += 1
+                        return entry["data"]
+                    event = self._in_flight.get(key)
+                    if event is None:
+                        self._misses += 1
+                        event = self._in_flight[key] = threading.Event()
+                        break
+                # another caller is already loading this key, wait for it and look again
+                event.wait()
+            try:
+                data = func(config)
+                with self._lock:
+                    self._put(key, data)
+                return data
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                event.set()
+
+        wrapper.cache_info = self.cache_info
+        wrapper.cache_clear = self.cache_clear
+        return wrapper
+
+    def _get(self, key: Any) -> Optional[Dict[str, Any]]:
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry["time"] >= self.timeout:
+            self._drop(key)
+            self._expired += 1
+            return None
+        self.cache.move_to_end(key)
+        return entry
+
+    def _put(self, key: Any, data: Any):
+        size = _size_of(data)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self.cache:
+            self._drop(key)
+        self.cache[key] = {"data": data, "time": time.monotonic(), "size": size}
+        self._bytes += size
+        now = time.monotonic()
+        for old_key in [k for k, v in self.cache.items() if now - v["time"] >= self.timeout]:
+            self._drop(old_key)
+            self._expired += 1
+        while len(self.cache) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._drop(next(iter(self.cache)))
+            self._evictions += 1
+
+    def _drop(self, key: Any):
+        self._bytes -= self.cache.pop(key)["size"]
@@ -0,0 +1,94 @@
+"""
+Expected threat (xT) grid lookups.
+
+The default grid is Karun Singh's open 12x8 xT grid (open_xt_12x8_v1), bundled with the
+package so that nothing is downloaded while rendering.  It is loaded once per process.
+Use set_xthreat_grid to substitute a custom grid.
+"""
+
+import json
+import os
+import threading
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_XTHREAT_GRID_FILE = os.path.join(os.path.dirname(__file__), "open_xt_12x8_v1.json")
+
+_lock = threading.Lock()
+_grid: Optional[np.ndarray] = None
+
+
+def _as_grid(grid: Union[str, Sequence[Sequence[float]], np.ndarray]) -> np.ndarray:
+    if isinstance(grid, str):
+        with open(grid, "r", encoding="utf-8") as file:
+            grid = json.load(file)
+    grid = np.array(grid, dtype=float)
+    if grid.ndim != 2 or grid.size == 0:
+        raise ValueError(f"xthreat grid must be a non empty 2d array, got shape {grid.shape}")
+    grid.setflags(write=False)
+    return grid
+
+
+def get_xthreat_grid() -> np.ndarray:
+    """
+    Function that returns the xthreat grid in use
+
+    Returns:
+        np.ndarray: Read only array of shape (n_y, n_x).  Rows run along the width of
+            the pitch, columns along the length in the direction of attack
+    """
+    global _grid  # pylint: disable=global-statement
+    if _grid is None:
+        with _lock:
+            if _grid is None:
+                _grid = _as_grid(DEFAULT_XTHREAT_GRID_FILE)
+    return _grid
+
+
+def set_xthreat_grid(grid: Union[None, str, Sequence[Sequence[float]], np.ndarray]):
+    """
+    Function that replaces the xthreat grid used by every dashboard in this process
+
+    Args:
+        grid (Union[None, str, Sequence[Sequence[float]], np.ndarray]): Grid of shape
+            (n_y, n_x), or the path to a json file containing one.  None restores the
+            bundled grid.
+    """
+    global _grid  # pylint: disable=global-statement
+    with _lock:
+        _grid = None if grid is None else _as_grid(grid)
+
+
+def assign_xthreat(
+    x: Union[Sequence[float], np.ndarray],
+    y: Union[Sequence[float], np.ndarray],
+    grid: Optional[np.ndarray] = None,
+    pitch_length: float = 100,
+    pitch_width: float = 100,
+) -> np.ndarray:
+    """
+    Function that looks up the xthreat value of every location in one vectorized pass.
+    Cells are closed on the right, (0, 100/12], (100/12, 200/12] ... as with pd.cut.
+    Locations off the pitch are clipped to the nearest cell and missing locations
+    use the first cell.
+
+    Args:
+        x (array like): x coordinates, in the direction of attack
+        y (array like): y coordinates
+        grid (np.ndarray, optional): Grid to use.  Defaults to get_xthreat_grid()
+        pitch_length (float): Length of the pitch in the data coordinates
+        pitch_width (float): Width of the pitch in the data coordinates
+
+    Returns:
+        np.ndarray: xthreat value for every location
+    """
+    grid = get_xthreat_grid() if grid is None else grid
+    n_y, n_x = grid.shape
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_idx = np.digitize(x, np.linspace(0, pitch_length, n_x + 1), right=True) - 1
+    y_idx = np.digitize(y, np.linspace(0, pitch_width, n_y + 1), right=True) - 1
+    x_idx = np.where(np.isnan(x), 0, np.clip(x_idx, 0, n_x - 1))
+    y_idx = np.where(np.isnan(y), 0, np.clip(y_idx, 0, n_y - 1))
+    return grid[y_idx, x_idx]
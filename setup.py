@@ -33,10 +33,11 @@ setup(
         "adjustText",
         "jinja2",
     ],
+    extras_require={"arrow": ["pyarrow"]},
     classifiers=[
         "Development Status :: 1 - Planning",
         "Programming Language :: Python :: 3.0",
         "Topic :: Utilities",
     ],
-    package_data={"": ["*.ttf", "*.otf"]},
+    package_data={"": ["*.ttf", "*.otf", "*.json"]},
 )
@@ -0,0 +1,64 @@
+import pandas as pd
+from matplotlib.figure import Figure
+
+from footballdashboards.dashboard.dashboard import Dashboard
+from footballdashboards._types._dashboard_fields import DashboardField
+
+
+class _Accessor:
+    def get_data(self, data_requester_name, **kwargs):
+        if kwargs["value"] < 0:
+            raise ValueError("negative")
+        return pd.DataFrame({"value": [kwargs["value"]]})
+
+
+class _ValueDashboard(Dashboard):
+    title = DashboardField(description="Title", default="")
+
+    @property
+    def datasource_name(self):
+        return "value"
+
+    def _required_data_columns(self):
+        return {"value": "A value"}
+
+    def _plot_data(self, data):
+        fig = Figure(figsize=(1, 1), dpi=50, facecolor=self.facecolor)
+        ax = fig.add_subplot()
+        ax.set_title(f"{self.title}{data['value'].iloc[0]}")
+        return fig, {"main": ax}
+
+
+class TestRenderBatch:
+    def test_in_process(self):
+        from footballdashboards.helpers.batch_rendering import render_batch
+
+        results = list(
+            render_batch(
+                _ValueDashboard,
+                {"title": "v"},
+                [{"value": 1}, {"value": -1}],
+                workers=1,
+                dashboard_args=(_Accessor(),),
+            )
+        )
+        assert results[0].content.startswith(b"\x89PNG")
+        assert results[0].error is None
+        assert results[1].error == repr(ValueError("negative"))
+        assert "ValueError: negative" in results[1].traceback
+
+    def test_process_pool(self):
+        from footballdashboards.helpers.batch_rendering import render_batch
+
+        results = render_batch(
+            _ValueDashboard,
+            None,
+            [{"value": i} for i in range(6)],
+            workers=2,
+            dashboard_args=(_Accessor(),),
+            fmt="svg",
+            max_pending=2,
+        )
+        results = sorted(results, key=lambda result: result.index)
+        assert [result.index for result in results] == list(range(6))
+        assert all(b"<svg" in result.content for result in results)
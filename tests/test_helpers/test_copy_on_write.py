@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+
+def _events():
+    return pd.DataFrame(
+        {"x": np.arange(1000.0), "y": np.arange(1000.0), "is_home_team": np.tile([0, 1], 500)}
+    )
+
+
+class TestCopyOnWrite:
+    def test_lazy_copy_is_independent(self):
+        from footballdashboards.helpers.copy_on_write import copy_on_write, lazy_copy
+
+        data = _events()
+        with copy_on_write():
+            copied = lazy_copy(data)
+            copied.loc[0, "x"] = -1.0
+        assert data.loc[0, "x"] == 0.0
+        assert copied.loc[0, "x"] == -1.0
+
+    def test_render_copies_counted(self):
+        from footballdashboards.dashboard.dashboard import Dashboard
+        from footballdashboards.helpers.copy_on_write import count_copies
+        from footballdashboards.helpers.event_preprocessing import orient_by_team_side
+
+        class OrientDashboard(Dashboard):
+            datasource_name = "events"
+            use_copy_on_write = True
+
+            def _required_data_columns(self):
+                return {"x": "X coordinate", "y": "Y coordinate", "is_home_team": "Home team flag"}
+
+            def _plot_data(self, data):
+                return orient_by_team_side(data)
+
+        assert Dashboard.use_copy_on_write is False
+        dashboard = OrientDashboard(None)
+        dashboard.debug_copies = True
+        oriented = dashboard.plot_dataframe(_events())
+        assert oriented["x"].tolist()[:2] == [100.0, 1.0]
+        assert dashboard.last_copy_report.deep_copies == 0
+        assert dashboard.last_copy_report.copies > 0
+
+        dashboard.use_copy_on_write = False
+        dashboard.plot_dataframe(_events())
+        assert dashboard.last_copy_report.bytes_copied >= 3 * 8 * 1000
+
+        with count_copies() as copies:
+            _events().copy()
+        assert copies.report().deep_copies == 1
+
+    def test_copy_on_write_blocks_are_serialised(self):
+        import threading
+
+        from footballdashboards.helpers.copy_on_write import copy_on_write, lazy_copy
+
+        data = _events()
+        entered = threading.Event()
+        release = threading.Event()
+        copies = []
+
+        def render():
+            with copy_on_write():
+                entered.set()
+                release.wait(5)
+
+        def other_render():
+            # runs while the first thread has copy-on-write on
+            copies.append(lazy_copy(data))
+            with copy_on_write():
+                copies.append(release.is_set())
+
+        first = threading.Thread(target=render)
+        first.start()
+        assert entered.wait(5)
+        second = threading.Thread(target=other_render)
+        second.start()
+        second.join(0.2)
+        assert len(copies) == 1  # the second block waits for the first
+        release.set()
+        first.join(5)
+        second.join(5)
+        assert copies[1] is True
+        # the copy taken outside its own block is deep, so it stays independent
+        copies[0].loc[0, "x"] = -1.0
+        assert data.loc[0, "x"] == 0.0
+
+    def test_select_rows_copies_once(self):
+        import warnings
+
+        from footballdashboards.helpers.copy_on_write import count_copies, select_rows
+
+        data = _events()
+        with count_copies() as copies, warnings.catch_warnings():
+            warnings.simplefilter("error")
+            home = select_rows(data, data["is_home_team"] == 1)
+            home["x"] = -1.0
+            home.loc[1, "y"] = -1.0
+        assert copies.report().deep_copies == 0
+        assert len(home) == 500
+        assert data.loc[1, "x"] == 1.0 and data.loc[1, "y"] == 1.0
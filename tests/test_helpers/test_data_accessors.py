@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+class _CountingAccessor:
+    def __init__(self):
+        self.calls = []
+
+    def get_data(self, data_requester_name, **kwargs):
+        self.calls.append((data_requester_name, kwargs))
+        return pd.DataFrame({"player": [kwargs.get("player")], "value": np.arange(1.0)})
+
+
+class TestCachingDataAccessor:
+    def test_equivalent_kwargs_share_one_query(self):
+        from footballdashboards.helpers.data_accessors import CachingDataAccessor
+
+        inner = _CountingAccessor()
+        accessor = CachingDataAccessor(inner)
+        accessor.get_data("pizza", player="Saka", seasons=[2022, 2023])
+        accessor.get_data("pizza", seasons=(np.int64(2022), 2023), player="Saka")
+        accessor.get_data("radar", player="Saka", seasons=[2022, 2023])
+        assert len(inner.calls) == 2
+        assert (accessor.hits, accessor.misses) == (1, 2)
+
+    def test_cached_data_is_not_corrupted_by_callers(self):
+        from footballdashboards.helpers.data_accessors import CachingDataAccessor
+
+        accessor = CachingDataAccessor(_CountingAccessor())
+        accessor.get_data("pizza", player="Saka")["value"] = 10.0
+        accessor.get_data("pizza", player="Saka")["value"] = 20.0
+        assert accessor.get_data("pizza", player="Saka")["value"].iloc[0] == 0.0
+
+    def test_memory_bound_evicts_least_recently_used(self):
+        from footballdashboards.helpers.data_accessors import CachingDataAccessor
+
+        inner = _CountingAccessor()
+        size = int(inner.get_data("x", player="a").memory_usage(deep=True).sum())
+        accessor = CachingDataAccessor(inner, max_memory_bytes=int(size * 2.5))
+        for player in ["a", "b", "a", "c"]:
+            accessor.get_data("pizza", player=player)
+        assert accessor.cache_info()["entries"] == 2
+        assert accessor.memory_bytes <= accessor.max_memory_bytes
+        calls = len(inner.calls)
+        accessor.get_data("pizza", player="a")
+        accessor.get_data("pizza", player="b")
+        assert len(inner.calls) == calls + 1
+
+    def test_disk_backend_shared_between_instances(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from footballdashboards.helpers.data_accessors import (
+            CachingDataAccessor,
+            ParquetBackend,
+        )
+
+        inner = _CountingAccessor()
+        CachingDataAccessor(inner, backend=ParquetBackend(str(tmp_path))).get_data(
+            "pizza", player="Saka"
+        )
+        other = CachingDataAccessor(inner, backend=ParquetBackend(str(tmp_path)))
+        data = other.get_data("pizza", player="Saka")
+        assert data["player"].iloc[0] == "Saka"
+        assert len(inner.calls) == 1
+        assert other.disk_hits == 1
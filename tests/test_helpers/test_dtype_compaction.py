@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+class TestCompactDtypes:
+    def test_columns_downcast_where_lossless(self):
+        from footballdashboards.helpers.dtype_compaction import compact_dtypes
+
+        data = pd.DataFrame(
+            {
+                "x": np.linspace(0, 100, 1000),
+                "is_goal": np.tile([0, 1], 500),
+                "minute": np.arange(1000),
+                "player": ["Saka", "Odegaard"] * 500,
+                "assists": [np.nan, 1.0] * 500,
+            }
+        )
+        schema = {
+            "x": "float32",
+            "is_goal": "bool",
+            "minute": "int8",
+            "player": "category",
+            "assists": "int8",
+            "missing": "int8",
+        }
+        compacted, report = compact_dtypes(data, schema)
+        assert report.converted == ("x", "is_goal", "player")
+        assert compacted["minute"].dtype == np.int64
+        assert compacted["assists"].isna().sum() == 500
+        assert report.bytes_saved == report.bytes_before - report.bytes_after > 0
+        assert data["x"].dtype == np.float64
+
+    def test_unsupported_dtype(self):
+        from footballdashboards.helpers.dtype_compaction import compact_dtypes
+
+        with pytest.raises(ValueError):
+            compact_dtypes(pd.DataFrame({"x": [1.0]}), {"x": "float16"})
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+
+class TestFixOwnGoals:
+    def test_own_goals_credited_to_other_team(self):
+        from footballdashboards.helpers.event_preprocessing import fix_own_goals
+
+        data = pd.DataFrame(
+            {
+                "x": [10.0, 95.0, 30.0],
+                "y": [20.0, 50.0, 40.0],
+                "is_home_team": [1, 0, 0],
+                "team": ["Arsenal", "Chelsea", "Chelsea"],
+                "teamId": [13, 15, 15],
+            }
+        )
+        fixed = fix_own_goals(data, np.array([False, True, False]))
+        assert fixed["x"].tolist() == [10.0, 5.0, 30.0]
+        assert fixed["y"].tolist() == [20.0, 50.0, 40.0]
+        assert fixed["is_home_team"].tolist() == [1, 1, 0]
+        assert fixed["team"].tolist() == ["Arsenal", "Arsenal", "Chelsea"]
+        assert fixed["teamId"].tolist() == [13, 13, 15]
+        assert fixed["own_goal"].tolist() == [0, 1, 0]
+        assert data["team"].tolist() == ["Arsenal", "Chelsea", "Chelsea"]
+
+    def test_no_own_goals(self):
+        from footballdashboards.helpers.event_preprocessing import fix_own_goals
+
+        data = pd.DataFrame({"x": [1.0], "team": ["Arsenal"]})
+        fixed = fix_own_goals(data, np.array([False]))
+        assert fixed["x"].tolist() == [1.0]
+        assert fixed["own_goal"].tolist() == [0]
+
+
+class TestOrientByTeamSide:
+    def test_away_events_mirrored(self):
+        from footballdashboards.helpers.event_preprocessing import orient_by_team_side
+
+        data = pd.DataFrame({"x": [10.0, 10.0], "y": [20.0, 20.0], "is_home_team": [1, 0]})
+        oriented = orient_by_team_side(data)
+        assert oriented["x"].tolist() == [10.0, 90.0]
+        assert oriented["y"].tolist() == [20.0, 80.0]
+        assert oriented["possession_side"].tolist() == [1, -1]
+        assert data["x"].tolist() == [10.0, 10.0]
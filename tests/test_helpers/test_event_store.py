@@ -0,0 +1,116 @@
+import enum
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+class _EventType(enum.Enum):
+    Pass = 1
+    Goal = 16
+
+
+class _MatchAccessor:
+    def __init__(self):
+        self.calls = 0
+
+    def get_data(self, data_requester_name, **kwargs):
+        self.calls += 1
+        return pd.DataFrame(
+            {
+                "x": [10.0, 50.0, 99.0],
+                "team": ["Arsenal", "Arsenal", "Chelsea"],
+                "event_type": [_EventType.Pass, _EventType.Pass, _EventType.Goal],
+            }
+        )
+
+
+class TestEventStore:
+    def test_events_stored_with_compact_types(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from footballdashboards.helpers.event_store import EventStore
+
+        store = EventStore(str(tmp_path))
+        store.write(1234, _MatchAccessor().get_data("match"))
+        data = store.read(1234)
+        assert data["event_type"].dtype == np.int8
+        assert data["event_type"].tolist() == [1, 1, 16]
+        assert isinstance(data["team"].dtype, pd.CategoricalDtype)
+        assert store.match_ids() == ["1234"]
+        assert store.read(1234, columns=["x"]).columns.tolist() == ["x"]
+
+    def test_nested_values_are_refused(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from footballdashboards.helpers.event_store import EventStore
+
+        store = EventStore(str(tmp_path))
+        data = pd.DataFrame(
+            {
+                "x": [10.0, 50.0, 99.0],
+                "outcome": ["Successful", None, "Unsuccessful"],
+                "qualifiers": [{"KeyPass": 1}, {"Cross": "x"}, None],
+            }
+        )
+        with pytest.raises(ValueError, match="qualifiers"):
+            store.write(1, data)
+        assert 1 not in store
+
+        store.write(1, data.drop(columns="qualifiers"))
+        pd.testing.assert_frame_equal(store.read(1), data.drop(columns="qualifiers"))
+
+    def test_accessor_serves_unstorable_matches_as_fetched(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from footballdashboards.helpers.event_store import EventStore, EventStoreDataAccessor
+
+        class QualifierAccessor(_MatchAccessor):
+            def get_data(self, data_requester_name, **kwargs):
+                data = super().get_data(data_requester_name, **kwargs)
+                data["qualifiers"] = [{"KeyPass": 1}, {"Cross": "x"}, {}]
+                return data
+
+        store = EventStore(str(tmp_path))
+        accessor = EventStoreDataAccessor(store, QualifierAccessor(), event_type=_EventType)
+        data = accessor.get_data("match", match_id=7)
+        assert 7 not in store
+        assert data["qualifiers"].tolist() == [{"KeyPass": 1}, {"Cross": "x"}, {}]
+        assert data["event_type"].tolist() == [_EventType.Pass, _EventType.Pass, _EventType.Goal]
+
+    def test_accessor_fetches_each_match_once(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from footballdashboards.helpers.event_store import EventStore, EventStoreDataAccessor
+
+        inner = _MatchAccessor()
+        accessor = EventStoreDataAccessor(
+            EventStore(str(tmp_path)), inner, copy=True, event_type=_EventType
+        )
+        accessor.get_data("match", match_id=1)
+        data = accessor.get_data("match", match_id=1)
+        assert inner.calls == 1
+        assert data["event_type"].tolist() == [_EventType.Pass, _EventType.Pass, _EventType.Goal]
+        data.loc[0, "x"] = 0.0
+        with pytest.raises(ValueError):
+            EventStoreDataAccessor(accessor.store).get_data("match", match_id=2)
+
+    def test_dashboard_columns_pushed_down(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from footballdashboards.dashboard.dashboard import Dashboard
+        from footballdashboards.helpers.event_store import EventStore, EventStoreDataAccessor
+
+        class _XDashboard(Dashboard):
+            datasource_name = "match"
+
+            def _required_data_columns(self):
+                return {"x": "X coordinate"}
+
+            def _optional_data_columns(self):
+                return {"xg": "Expected goals, if available"}
+
+            def _plot_data(self, data):
+                return data
+
+        accessor = EventStoreDataAccessor(EventStore(str(tmp_path)), _MatchAccessor())
+        assert _XDashboard(accessor).plot(match_id=1).columns.tolist() == ["x"]
+        data = _MatchAccessor().get_data("match")
+        projected = _XDashboard(None).plot_dataframe(data)
+        assert projected.columns.tolist() == ["x"]
+        assert np.shares_memory(projected["x"].to_numpy(), data["x"].to_numpy())
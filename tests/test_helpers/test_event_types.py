@@ -0,0 +1,42 @@
+import enum
+
+import numpy as np
+import pandas as pd
+
+
+class _Footmav(enum.Enum):
+    Pass = 1
+    Foul = 4
+
+
+class _Footballmodels(enum.Enum):
+    Pass = 1
+    Foul = 4
+
+
+class TestEventTypes:
+    def test_convert_between_families(self):
+        from footballdashboards.helpers.event_types import convert_event_types
+
+        data = pd.Series([_Footmav.Pass, _Footmav.Foul, _Footmav.Pass])
+        converted = convert_event_types(data, _Footballmodels)
+        assert converted.tolist() == [
+            _Footballmodels.Pass,
+            _Footballmodels.Foul,
+            _Footballmodels.Pass,
+        ]
+        assert convert_event_types(np.array([4, 1]), _Footmav).tolist() == [
+            _Footmav.Foul,
+            _Footmav.Pass,
+        ]
+
+    def test_accessor_matches_enums_and_codes(self):
+        import footballdashboards.helpers.event_types  # pylint: disable=unused-import
+
+        enums = pd.Series([_Footmav.Pass, _Footmav.Foul], index=[5, 6])
+        codes = pd.Series(np.array([1, 4], dtype=np.int8), index=[5, 6])
+        for data in [enums, codes]:
+            assert data.event_types.eq(_Footballmodels.Foul).tolist() == [False, True]
+            assert data.event_types.isin([_Footmav.Pass, 4]).tolist() == [True, True]
+            assert data.event_types.eq(1).index.tolist() == [5, 6]
+        assert enums.event_types.codes.dtype == np.int8
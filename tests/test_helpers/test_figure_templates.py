@@ -0,0 +1,33 @@
+class TestFigureTemplateCache:
+    def test_builds_once_and_returns_copies(self):
+        from matplotlib.figure import Figure
+        from footballdashboards.helpers.figure_templates import FigureTemplateCache
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            fig = Figure(figsize=(4, 3))
+            axes = fig.subplot_mosaic([["left", "right"]])
+            axes["left"].plot([0, 1], [0, 1])
+            return fig, axes
+
+        cache = FigureTemplateCache()
+        fig_1, axes_1 = cache.get(("layout", "white"), build)
+        fig_2, axes_2 = cache.get(("layout", "white"), build)
+        assert len(builds) == 1
+        assert fig_1 is not fig_2
+        assert axes_2["left"].figure is fig_2
+        assert len(axes_2["left"].lines) == 1
+        axes_1["right"].plot([0, 1], [1, 0])
+        assert len(cache.get(("layout", "white"), build)[1]["right"].lines) == 0
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.entries) == (2, 1, 1)
+
+    def test_disabled(self):
+        from footballdashboards.helpers.figure_templates import FigureTemplateCache
+
+        cache = FigureTemplateCache()
+        cache.enabled = False
+        assert cache.get("key", lambda: [1]) == [1]
+        assert cache.cache_info().entries == 0
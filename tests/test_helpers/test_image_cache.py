@@ -0,0 +1,158 @@
+import os
+from urllib.error import HTTPError
+
+
+class _FakeFetcher:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        response = self.responses[url]
+        if isinstance(response, int):
+            raise HTTPError(url, response, "error", None, None)
+        return response
+
+
+class TestImageCache:
+    def test_memory_hit(self):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"a": b"badge"})
+        cache = ImageCache(fetcher=fetcher)
+        assert cache.fetch(("league", "team"), "a") == b"badge"
+        assert cache.fetch(("league", "team"), "a") == b"badge"
+        assert fetcher.calls == ["a"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_negative_caching(self):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"missing": 404})
+        cache = ImageCache(fetcher=fetcher)
+        assert cache.fetch(("league", "nobody"), "missing") is None
+        assert cache.fetch(("league", "nobody"), "missing") is None
+        assert fetcher.calls == ["missing"]
+
+    def test_server_errors_are_not_cached(self):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"broken": 500})
+        cache = ImageCache(fetcher=fetcher)
+        for _ in range(2):
+            try:
+                cache.fetch(("league", "team"), "broken")
+                assert False
+            except HTTPError:
+                pass
+        assert len(fetcher.calls) == 2
+
+    def test_lru_eviction(self):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"a": b"a", "b": b"b", "c": b"c"})
+        cache = ImageCache(max_memory_items=2, fetcher=fetcher)
+        cache.fetch(("a",), "a")
+        cache.fetch(("b",), "b")
+        cache.fetch(("a",), "a")
+        cache.fetch(("c",), "c")
+        assert cache.contains(("a",))
+        assert not cache.contains(("b",))
+
+    def test_ttl_expiry(self):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"a": b"a"})
+        cache = ImageCache(ttl=-1, fetcher=fetcher)
+        cache.fetch(("a",), "a")
+        cache.fetch(("a",), "a")
+        assert len(fetcher.calls) == 2
+
+    def test_disk_tier_shared_between_instances(self, tmp_path):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"a": b"badge", "missing": 404})
+        ImageCache(cache_dir=str(tmp_path), fetcher=fetcher).fetch(("a",), "a")
+        ImageCache(cache_dir=str(tmp_path), fetcher=fetcher).fetch(("m",), "missing")
+        other = ImageCache(cache_dir=str(tmp_path), fetcher=fetcher)
+        assert other.fetch(("a",), "a") == b"badge"
+        assert other.fetch(("m",), "missing") is None
+        assert fetcher.calls == ["a", "missing"]
+
+    def test_disk_size_bound(self, tmp_path):
+        from footballdashboards.helpers.image_cache import ImageCache
+
+        fetcher = _FakeFetcher({"a": b"x" * 10, "b": b"y" * 10})
+        cache = ImageCache(cache_dir=str(tmp_path), max_disk_bytes=15, fetcher=fetcher)
+        cache.fetch(("a",), "a")
+        os.utime(tmp_path / f"{cache.key_hash(('a',))}.img", (0, 0))
+        cache.fetch(("b",), "b")
+        assert sorted(os.listdir(tmp_path)) == [f"{cache.key_hash(('b',))}.img"]
+
+    def test_prefetch_skips_cached_and_duplicates(self):
+        from footballdashboards.helpers.image_cache import ImageAsset, ImageCache
+
+        fetcher = _FakeFetcher({"a": b"a", "b": b"b", "broken": 500})
+        cache = ImageCache(fetcher=fetcher)
+        cache.fetch(("a",), "a")
+        assets = [
+            ImageAsset(("a",), "a"),
+            ImageAsset(("b",), "b"),
+            ImageAsset(("b",), "b"),
+            ImageAsset(("x",), "broken"),
+        ]
+        assert cache.prefetch(assets) == 2
+        assert sorted(fetcher.calls) == ["a", "b", "broken"]
+        assert cache.contains(("b",))
+        assert not cache.contains(("x",))
+
+    def test_helpers_read_the_prefetched_cache(self):
+        from io import BytesIO
+
+        from PIL import Image
+
+        from footballdashboards.helpers.image_cache import ImageCache
+        from footballdashboards.helpers.mclachbot_helpers import get_image, image_asset
+
+        buffer = BytesIO()
+        Image.new("RGB", (2, 2)).save(buffer, format="PNG")
+        fetcher = _FakeFetcher({"logo": buffer.getvalue()})
+        cache = ImageCache(fetcher=fetcher)
+        cache.prefetch([image_asset("logo")])
+        assert get_image("logo", cache).size == (2, 2)
+        assert fetcher.calls == ["logo"]
+
+    def test_header_draws_badges_from_the_prefetched_cache(self):
+        import datetime
+        from io import BytesIO
+
+        from matplotlib.figure import Figure
+        from PIL import Image
+
+        from footballdashboards.elements.headers import match_dashboard_header
+        from footballdashboards.helpers.image_cache import ImageCache
+        from footballdashboards.helpers.mclachbot_helpers import McLachBotBadgeService
+
+        buffer = BytesIO()
+        Image.new("RGB", (2, 2)).save(buffer, format="PNG")
+        service = McLachBotBadgeService(ImageCache(fetcher=_FakeFetcher({})))
+        assets = [service.team_badge_asset("EPL", team) for team in ("Arsenal", "Chelsea")]
+        service.cache.fetcher = _FakeFetcher({asset.url: buffer.getvalue() for asset in assets})
+        service.cache.prefetch(assets)
+        service.cache.fetcher = _FakeFetcher({})  # any download while plotting fails
+        ax = Figure(figsize=(6, 1)).add_subplot()
+        match_dashboard_header(
+            ax,
+            datetime.date(2023, 8, 12),
+            "EPL",
+            ["Arsenal", "Chelsea"],
+            ["Arsenal", "Chelsea"],
+            [1, 0],
+            ["4-3-3", "4-2-3-1"],
+            "black",
+            "white",
+            "grey",
+            badge_service=service,
+        )
+        assert sum(len(child.images) for child in ax.child_axes) == 2
@@ -0,0 +1,43 @@
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+class TestPlaceLabels:
+    def test_greedy_separates_coincident_labels(self):
+        from footballdashboards.helpers.label_placement import place_labels
+
+        fig = Figure(figsize=(4, 4))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        scatter = ax.scatter([0, 0, 1], [0, 0, 1])
+        texts = [ax.text(0, 0, "Player A"), ax.text(0, 0, "Player B")]
+        place_labels("greedy", ax, texts, objects=scatter)
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        first, second = (text.get_window_extent(renderer) for text in texts)
+        assert not first.overlaps(second)
+
+    def test_unknown_method(self):
+        from footballdashboards.helpers.label_placement import place_labels
+
+        fig = Figure()
+        with pytest.raises(ValueError):
+            place_labels("simulated_annealing", fig.add_subplot(), [])
+
+    def test_adjust_text_keeps_its_own_time_limit(self, monkeypatch):
+        from footballdashboards.helpers import label_placement
+
+        calls = []
+
+        def fake_adjust_text(texts, **kwargs):
+            calls.append(kwargs)
+            return texts, None
+
+        monkeypatch.setattr(label_placement, "adjust_text", fake_adjust_text)
+        ax = Figure().add_subplot()
+        texts = [ax.text(0, 0, "Player A")]
+        label_placement.place_labels("adjust_text", ax, texts)
+        label_placement.place_labels("adjust_text", ax, texts, time_budget=2)
+        assert "time_lim" not in calls[0]
+        assert calls[1]["time_lim"] == 2
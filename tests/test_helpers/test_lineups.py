@@ -0,0 +1,44 @@
+import pandas as pd
+
+
+def _match():
+    return pd.DataFrame(
+        {
+            "eventId": [1, 2, 3, 10, 11, 4, 5],
+            "relatedEventId": [None, None, None, 11, 10, None, None],
+            "teamId": [1, 1, 1, 1, 1, 1, 1],
+            "event_type": ["pass", "pass", "pass", "off", "on", "pass", "pass"],
+            "player_name": ["a", "b", "c", "b", "d", "d", "a"],
+            "minute": [1, 5, 10, 60, 60, 70, 90],
+        }
+    )
+
+
+class TestLineups:
+    def test_player_minutes(self):
+        from footballdashboards.helpers.lineups import player_minutes
+
+        table = player_minutes(_match(), "on", "off")
+        assert table.index.tolist() == ["a", "b", "c", "d"]
+        assert table["minutes"].to_dict() == {"a": 90, "b": 60, "c": 90, "d": 30}
+
+    def test_substitutions_and_ordering(self):
+        from footballdashboards.helpers.lineups import insert_substitutes, substitutions
+
+        subs = substitutions(_match(), "on", "off")
+        assert subs[["player_on", "player_off", "minute"]].values.tolist() == [["d", "b", 60]]
+        assert insert_substitutes(["a", "b", "c"], subs) == ["a", "b", "d", "c"]
+
+    def test_minutes_in_periods(self):
+        from footballdashboards.helpers.lineups import minutes_in_periods
+
+        data = pd.DataFrame(
+            {
+                "matchId": [1, 1, 2, 2],
+                "period": [1, 2, 1, 2],
+                "max_minute": [46, 93, 45, 90],
+                "event_type": ["pass", "off", "pass", "pass"],
+                "minute": [3, 70, 40, 80],
+            }
+        )
+        assert minutes_in_periods(data, "on", "off") == 46 + 25 + 45 + 45
@@ -0,0 +1,39 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+
+def _scatter_figure():
+    fig = Figure(figsize=(2, 1), dpi=50)
+    ax = fig.add_subplot()
+    ax.scatter(np.arange(500), np.arange(500))
+    ax.plot([0, 1], [0, 1])
+    return fig
+
+
+class TestRenderFigure:
+    def test_rgba_and_webp(self):
+        from footballdashboards.helpers.matplotlib import render_figure
+
+        pixels = np.asarray(render_figure(_scatter_figure(), "rgba", dpi=100))
+        assert pixels.shape == (100, 200, 4)
+        assert render_figure(_scatter_figure(), "webp")[8:12] == b"WEBP"
+        assert render_figure(_scatter_figure(), "png", optimize=True)[:4] == b"\x89PNG"
+
+    def test_optimize_with_savefig_kwargs(self):
+        from io import BytesIO
+        from PIL import Image
+        from footballdashboards.helpers.matplotlib import figure_to_bytes, render_figure
+
+        plain = figure_to_bytes(_scatter_figure(), "png", transparent=True)
+        optimized = render_figure(_scatter_figure(), "png", optimize=True, transparent=True)
+        assert len(optimized) < len(plain)
+        np.testing.assert_array_equal(
+            np.asarray(Image.open(BytesIO(optimized))), np.asarray(Image.open(BytesIO(plain)))
+        )
+
+    def test_rasterize_layers(self):
+        from footballdashboards.helpers.matplotlib import rasterize_layers, render_figure
+
+        fig = _scatter_figure()
+        assert rasterize_layers(fig, ["scatter", "lines"]) == 1
+        assert b"<image" in render_figure(fig, "svg")
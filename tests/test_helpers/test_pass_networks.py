@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+
+class TestPassNetworks:
+    def test_edges_are_undirected(self):
+        from footballdashboards.helpers.pass_networks import aggregate_edges
+
+        data = pd.DataFrame(
+            {
+                "position": ["GK", "DC", "DC", "AMC", "GK", "DC"],
+                "pass_receiver_position": ["DC", "GK", "AMC", "DC", "DC", np.nan],
+                "xT": [0.01, 0.03, 0.02, 0.04, 0.02, 0.5],
+            }
+        )
+        edges = aggregate_edges(data, value_column="xT")
+        assert edges[["player_1", "player_2", "passes"]].values.tolist() == [
+            ["AMC", "DC", 2],
+            ["DC", "GK", 3],
+        ]
+        np.testing.assert_allclose(edges["xT"], [0.03, 0.02])
+
+    def test_nodes(self):
+        from footballdashboards.helpers.pass_networks import aggregate_nodes
+
+        data = pd.DataFrame(
+            {
+                "position": ["GK", "DC", "GK"],
+                "x": [5.0, 20.0, 15.0],
+                "y": [50.0, 40.0, 50.0],
+                "id": [1, 2, None],
+            }
+        )
+        nodes = aggregate_nodes(data, count_column="id")
+        assert nodes.loc["GK"].tolist() == [10.0, 50.0, 1]
+        assert aggregate_nodes(data)["touches"].to_dict() == {"DC": 1, "GK": 2}
@@ -0,0 +1,118 @@
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+class TestDrawPitch:
+    def test_raster_matches_vector_axes(self):
+        from matplotlib.image import BboxImage
+        from mplsoccer import VerticalPitch
+        from footballdashboards.helpers.pitch_backgrounds import (
+            clear_pitch_backgrounds,
+            draw_pitch,
+            pitch_background,
+        )
+
+        clear_pitch_backgrounds()
+        pitch = VerticalPitch(pitch_type="opta", half=True, pitch_color="white")
+        axes = [Figure(figsize=(4, 4)).add_subplot() for _ in range(3)]
+        draw_pitch(pitch, axes[0], raster=False, ylim=(60, 101))
+        draw_pitch(pitch, axes[1], raster=True, ylim=(60, 101))
+        draw_pitch(pitch, axes[2], raster=True, ylim=(60, 101))
+        assert axes[1].get_xlim() == axes[0].get_xlim()
+        assert axes[1].get_ylim() == axes[0].get_ylim()
+        images = [artist for artist in axes[1].get_children() if isinstance(artist, BboxImage)]
+        assert len(images) == 1
+        assert len(axes[1].lines) + len(axes[1].patches) < len(axes[0].lines) + len(axes[0].patches)
+        FigureCanvasAgg(axes[1].figure).draw()
+        image = images[0].get_array()
+        assert image.ndim == 3 and image.shape[2] == 4
+        assert pitch_background(pitch, image.shape[1], image.shape[0], 100, ylim=(60, 101)) is (
+            pitch_background(pitch, image.shape[1], image.shape[0], 100, ylim=(60, 101))
+        )
+
+    def test_raster_follows_the_save_dpi(self):
+        from io import BytesIO
+        from matplotlib.image import BboxImage
+        from mplsoccer import Pitch
+        from footballdashboards.helpers.pitch_backgrounds import draw_pitch
+
+        fig = Figure(figsize=(4, 3), dpi=50)
+        ax = fig.add_subplot()
+        draw_pitch(Pitch(pitch_type="opta", pitch_color="white"), ax, raster=True)
+        (image,) = [artist for artist in ax.get_children() if isinstance(artist, BboxImage)]
+        shapes = []
+        for dpi in (50, 200):
+            fig.savefig(BytesIO(), format="png", dpi=dpi)
+            shapes.append(image.get_array().shape[:2])
+        assert abs(shapes[1][0] - 4 * shapes[0][0]) <= 4
+        assert abs(shapes[1][1] - 4 * shapes[0][1]) <= 4
+
+    def test_vector_by_default(self):
+        from mplsoccer import Pitch
+        from footballdashboards.helpers.pitch_backgrounds import draw_pitch
+
+        ax = Figure().add_subplot()
+        draw_pitch(Pitch(pitch_type="opta"), ax)
+        assert len(ax.images) == 0 and not any(
+            type(artist).__name__ == "BboxImage" for artist in ax.get_children()
+        )
+
+    def test_dashboard_renders_vector_pitches_to_svg(self):
+        import pandas as pd
+        from matplotlib.image import BboxImage
+        from mplsoccer import Pitch
+        from footballdashboards.dashboard.dashboard import Dashboard
+        from footballdashboards.helpers.pitch_backgrounds import draw_pitch
+
+        class PitchDashboard(Dashboard):
+            datasource_name = "pitch"
+
+            def _required_data_columns(self):
+                return {}
+
+            def _plot_data(self, data):
+                fig = Figure(figsize=(2, 2))
+                ax = fig.add_subplot()
+                draw_pitch(Pitch(pitch_type="opta"), ax, raster=self.raster_pitches)
+                self.rendered_ax = ax
+                return fig, {"pitch": ax}
+
+        class Accessor:
+            def get_data(self, data_requester_name, **kwargs):
+                return pd.DataFrame()
+
+        dashboard = PitchDashboard(Accessor())
+        dashboard.raster_pitches = True
+        assert b"<image" not in dashboard.render(fmt="svg")
+        assert dashboard.raster_pitches is True
+        dashboard.render(fmt="png")
+        assert any(isinstance(artist, BboxImage) for artist in dashboard.rendered_ax.get_children())
+
+    def test_vector_pitches_only_affects_the_current_thread(self):
+        import threading
+        from matplotlib.image import BboxImage
+        from mplsoccer import Pitch
+        from footballdashboards.helpers.pitch_backgrounds import draw_pitch, vector_pitches
+
+        entered = threading.Event()
+        release = threading.Event()
+
+        def render_vector():
+            with vector_pitches():
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=render_vector)
+        thread.start()
+        assert entered.wait(5)
+        try:
+            ax = Figure().add_subplot()
+            draw_pitch(Pitch(pitch_type="opta"), ax, raster=True)
+        finally:
+            release.set()
+            thread.join(5)
+        assert any(isinstance(artist, BboxImage) for artist in ax.get_children())
+        with vector_pitches():
+            vector_ax = Figure().add_subplot()
+            draw_pitch(Pitch(pitch_type="opta"), vector_ax, raster=True)
+        assert not any(isinstance(artist, BboxImage) for artist in vector_ax.get_children())
@@ -0,0 +1,11 @@
+class TestPitchZones:
+    def test_first_matching_zone(self):
+        from footballdashboards.helpers.pitch_zones import PitchZones
+
+        zones = PitchZones(
+            {"box": ((100, 80), (83, 20)), "half": ((100, 100), (50, 0))}, default="other"
+        )
+        names = zones.classify([90, 83, 60, 10, 90], [50, 20, 50, 50, 90])
+        assert names.tolist() == ["box", "box", "half", "other", "half"]
+        assert zones.codes([10], [10]).tolist() == [2]
+        assert zones.centers().tolist() == [[91.5, 50.0], [75.0, 50.0]]
@@ -0,0 +1,98 @@
+import threading
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimedCache:
+    def test_results_expire_after_timeout(self, monkeypatch):
+        from footballdashboards.helpers import timed_cache
+
+        clock = _Clock()
+        monkeypatch.setattr(timed_cache.time, "monotonic", clock)
+        calls = []
+
+        @timed_cache.TimedCache(60)
+        def load(config):
+            calls.append(config)
+            return len(calls)
+
+        assert load({"player_id": 1}) == 1
+        clock.now += 59
+        assert load({"player_id": 1}) == 1
+        clock.now += 1
+        assert load({"player_id": 1}) == 2
+        info = load.cache_info()
+        assert (info.hits, info.misses, info.expired) == (1, 2, 1)
+
+    def test_evicts_least_recently_used(self):
+        from footballdashboards.helpers.timed_cache import TimedCache
+
+        calls = []
+
+        @TimedCache(60, max_entries=2)
+        def load(config):
+            calls.append(config["player_id"])
+            return config["player_id"]
+
+        load({"player_id": 1})
+        load({"player_id": 2})
+        load({"player_id": 1})  # 2 is now the least recently used
+        load({"player_id": 3})
+        load({"player_id": 1})
+        load({"player_id": 2})
+        assert calls == [1, 2, 3, 2]
+        assert load.cache_info().evictions == 2
+
+    def test_concurrent_misses_load_once(self):
+        from footballdashboards.helpers.timed_cache import TimedCache
+
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @TimedCache(60)
+        def load(config):
+            calls.append(config["player_id"])
+            started.set()
+            release.wait(5)
+            return config["player_id"]
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(load({"player_id": 7})))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert calls == [7]
+        assert results == [7] * 8
+        info = load.cache_info()
+        assert (info.hits, info.misses) == (7, 1)
+
+    def test_secret_keys_are_not_part_of_the_key(self):
+        from footballdashboards.helpers.timed_cache import TimedCache
+
+        cache = TimedCache(60)
+        calls = []
+
+        @cache
+        def load(config):
+            calls.append(config)
+            return len(calls)
+
+        load({"player_id": 1, "db_password": "first", "seasons": [2022, 2023]})
+        load({"seasons": (2022, 2023), "db_password": "second", "player_id": 1})
+        assert len(calls) == 1
+        assert "first" not in repr(cache.make_key(calls[0]))
+        load.cache_clear()
+        assert load.cache_info().entries == 0
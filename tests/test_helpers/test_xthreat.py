@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+
+class TestXThreat:
+    def test_bundled_grid(self):
+        from footballdashboards.helpers.xthreat import get_xthreat_grid
+
+        grid = get_xthreat_grid()
+        assert grid.shape == (8, 12)
+        assert get_xthreat_grid() is grid
+        assert grid[3, 11] == grid.max()
+
+    def test_matches_pd_cut_lookup(self):
+        from footballdashboards.helpers.xthreat import assign_xthreat, get_xthreat_grid
+
+        grid = get_xthreat_grid()
+        rng = np.random.default_rng(0)
+        x = np.append(rng.uniform(0, 100, 500), [0, 100, 100 / 12])
+        y = np.append(rng.uniform(0, 100, 500), [0, 100, 12.5])
+        x_idx = pd.cut(x, bins=np.linspace(0, 100, 13), labels=range(12)).fillna(0)
+        y_idx = pd.cut(y, bins=np.linspace(0, 100, 9), labels=range(8)).fillna(0)
+        expected = [grid[j][i] for i, j in zip(x_idx, y_idx)]
+        np.testing.assert_array_equal(assign_xthreat(x, y), expected)
+
+    def test_override(self):
+        from footballdashboards.helpers.xthreat import (
+            assign_xthreat,
+            get_xthreat_grid,
+            set_xthreat_grid,
+        )
+
+        try:
+            set_xthreat_grid([[0.0, 1.0], [2.0, 3.0]])
+            assert assign_xthreat([10, 90, 150], [10, 90, np.nan]).tolist() == [0.0, 3.0, 1.0]
+        finally:
+            set_xthreat_grid(None)
+        assert get_xthreat_grid().shape == (8, 12)